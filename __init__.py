@@ -1,75 +1,141 @@
 import atexit
-import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from typing_extensions import Final
 
 from . import (
     _compatibility as _compatibility,  # pylint: disable=redefined-builtin; Import first to fail fast
 )
-from . import (
-    _functions,
-    agg as agg,
-    array as array,
-    comparator as comparator,
-    config as config,
-    experimental as experimental,
-    math as math,
-    query as query,
-    scope as scope,
-    string as string,
-    type as type,
-)
-from ._functions import *  # pylint: disable=redefined-builtin
-from ._java_utils import retrieve_info_from_jar
+from ._api_utils import walk_api_attribute
+from ._lazy_module import LazyModule, lazy_import
 from ._licensing import (
     EULA as __license__,
-    check_license,
     hide_new_license_agreement_message as hide_new_license_agreement_message,
 )
 from ._plugins import register_active_plugins
-from ._sessions import Sessions
-from ._telemetry import setup_telemetry
-from ._tutorial import copy_tutorial
-from ._type_utils import _instrument_typechecking
+from ._telemetry import instrument_call_tracking_callback, setup_telemetry
 from ._version import VERSION as __version__
-from .column import Column as Column
-from .cube import Cube as Cube
-from .hierarchy import Hierarchy as Hierarchy
-from .level import Level as Level
-from .measure import Measure as Measure
-from .query.cube import QueryCube as QueryCube
-from .query.hierarchy import QueryHierarchy as QueryHierarchy
-from .query.level import QueryLevel as QueryLevel
-from .query.measure import QueryMeasure as QueryMeasure
-from .query.query_result import QueryResult as QueryResult
-from .query.session import QuerySession as QuerySession
-from .session import Session as Session
-from .table import Table as Table
-from .type import DataType as DataType
-
-# pylint: disable=invalid-name
-sessions: Final = Sessions()
-create_session: Final = sessions.create_session
-open_query_session: Final = sessions.open_query_session
-# pylint: enable=invalid-name
+
+if TYPE_CHECKING:
+    from . import (
+        agg as agg,
+        array as array,
+        comparator as comparator,
+        config as config,
+        experimental as experimental,
+        math as math,
+        profiling as profiling,
+        query as query,
+        scope as scope,
+        string as string,
+        type as type,
+    )
+    from ._functions import *  # pylint: disable=redefined-builtin
+    from ._sessions import Sessions
+    from ._tutorial import copy_tutorial
+    from .column import Column as Column
+    from .cube import Cube as Cube
+    from .hierarchy import Hierarchy as Hierarchy
+    from .level import Level as Level
+    from .measure import Measure as Measure
+    from .query.cube import QueryCube as QueryCube
+    from .query.hierarchy import QueryHierarchy as QueryHierarchy
+    from .query.level import QueryLevel as QueryLevel
+    from .query.measure import QueryMeasure as QueryMeasure
+    from .query.query_result import QueryResult as QueryResult
+    from .query.session import QuerySession as QuerySession
+    from .session import Session as Session
+    from .table import Table as Table
+    from .type import DataType as DataType
+
+    # pylint: disable=invalid-name
+    sessions: Final[Sessions]
+    create_session: Final = sessions.create_session
+    open_query_session: Final = sessions.open_query_session
+    # pylint: enable=invalid-name
+
+# Same as `_functions.__all__`, which cannot be read without importing the functions.
+_FUNCTION_NAMES: Final = [
+    "at",
+    "date_shift",
+    "_first",
+    "_last",
+    "parent_value",
+    "shift",
+    "total",
+    "value",
+    "date_diff",
+    "filter",
+    "rank",
+    "where",
+]
+
+
+def _create_sessions() -> "Sessions":
+    from ._sessions import Sessions  # pylint: disable=import-outside-toplevel
+
+    return Sessions()
+
+
+# Submodules and heavy dependencies such as pandas, pyarrow, or py4j are only imported when first used.
+_ATOTI_MODULE: Final = LazyModule.install(
+    __name__,
+    lazy_attributes={
+        **{
+            submodule_name: lazy_import(f"{__name__}.{submodule_name}")
+            for submodule_name in [
+                "agg",
+                "array",
+                "comparator",
+                "config",
+                "experimental",
+                "math",
+                "profiling",
+                "query",
+                "scope",
+                "string",
+                "type",
+            ]
+        },
+        **{
+            function_name: lazy_import(f"{__name__}._functions", function_name)
+            for function_name in _FUNCTION_NAMES
+        },
+        "Column": lazy_import(f"{__name__}.column", "Column"),
+        "Cube": lazy_import(f"{__name__}.cube", "Cube"),
+        "Hierarchy": lazy_import(f"{__name__}.hierarchy", "Hierarchy"),
+        "Level": lazy_import(f"{__name__}.level", "Level"),
+        "Measure": lazy_import(f"{__name__}.measure", "Measure"),
+        "QueryCube": lazy_import(f"{__name__}.query.cube", "QueryCube"),
+        "QueryHierarchy": lazy_import(f"{__name__}.query.hierarchy", "QueryHierarchy"),
+        "QueryLevel": lazy_import(f"{__name__}.query.level", "QueryLevel"),
+        "QueryMeasure": lazy_import(f"{__name__}.query.measure", "QueryMeasure"),
+        "QueryResult": lazy_import(f"{__name__}.query.query_result", "QueryResult"),
+        "QuerySession": lazy_import(f"{__name__}.query.session", "QuerySession"),
+        "Session": lazy_import(f"{__name__}.session", "Session"),
+        "Table": lazy_import(f"{__name__}.table", "Table"),
+        "DataType": lazy_import(f"{__name__}.type", "DataType"),
+        "copy_tutorial": lazy_import(f"{__name__}._tutorial", "copy_tutorial"),
+        "sessions": _create_sessions,
+        "create_session": lazy_import(__name__, "sessions.create_session"),
+        "open_query_session": lazy_import(__name__, "sessions.open_query_session"),
+    },
+)
 
 
 def close() -> None:
     """Close all opened sessions."""
-    sessions.close()
+    # Nothing to close if no sessions were ever created.
+    if "sessions" in globals():
+        globals()["sessions"].close()
 
 
 atexit.register(close)
 
 
-(_LICENSE_END_DATE, _IS_COMMUNITY_LICENSE) = retrieve_info_from_jar()
-
-check_license(_LICENSE_END_DATE, _IS_COMMUNITY_LICENSE)
-
 register_active_plugins()
 
-_ATOTI_MODULE = sys.modules[__name__]
-
 # Need to export elements before typechecking and telemetry setup for walk_api
 __all__ = [
     "copy_tutorial",
@@ -77,11 +143,33 @@ __all__ = [
     "open_query_session",
     "__version__",
 ]
-__all__ += _functions.__all__
+__all__ += _FUNCTION_NAMES
 if __license__:
     __all__.append("__license__")
 
 
-_instrument_typechecking(_ATOTI_MODULE)
+_TRACK_CALLS: Final = setup_telemetry()
+
+
+def _instrument_api_attribute(module: ModuleType, attribute_name: str) -> None:
+    # Imported lazily since typeguard is only needed once the API is used.
+    from ._type_utils import (  # pylint: disable=import-outside-toplevel
+        instrument_typechecking_callback,
+    )
+
+    walk_api_attribute(
+        module, attribute_name, callback=instrument_typechecking_callback
+    )
+    if _TRACK_CALLS:
+        walk_api_attribute(
+            module, attribute_name, callback=instrument_call_tracking_callback
+        )
+
+
+if _TRACK_CALLS:
+    # Not lazy but it has no parameters to typecheck.
+    walk_api_attribute(
+        _ATOTI_MODULE, "close", callback=instrument_call_tracking_callback
+    )
 
-setup_telemetry(_ATOTI_MODULE)
+_ATOTI_MODULE.start_instrumentation(_instrument_api_attribute)
@@ -161,3 +161,28 @@ def walk_api(
         include_attribute=include_attribute,
         visited_elements=visited_elements,
     )
+
+
+def walk_api_attribute(
+    container: ContainerType,
+    attribute_name: str,
+    *,
+    callback: Callable[[ContainerType, str], None],
+):
+    """Explore the public API exposed by a single attribute of the input container.
+
+    Unlike :func:`walk_api`, the other attributes of the container are not accessed.
+    This is used to instrument the attributes of a lazily loaded module as they are loaded.
+    """
+    element = getattr(container, attribute_name)
+    if not _is_exported_element(
+        element,
+        elem_container_module=inspect.getmodule(container),
+        elem_module=inspect.getmodule(element),
+        exported_names=getattr(container, "__all__", []),
+    ):
+        return
+    if inspect.ismodule(element) or inspect.isclass(element):
+        walk_api(element, callback=callback)
+    elif inspect.isfunction(element) or inspect.ismethod(element):
+        callback(container, attribute_name)
@@ -1,17 +1,46 @@
 import json
+from collections import Counter
+from datetime import time
 from http import HTTPStatus
-from typing import Any, Collection, Mapping, cast
+from typing import Any, Collection, Dict, List, Mapping, Optional, Sequence, cast
 from urllib.parse import urljoin
 from urllib.request import Request, urlopen
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 
+from ._profiler import io_span
 from .query._mdx_utils import parse_level_unique_name
 from .query.session import QuerySession
+from .type import DataType
 
 ATOTI_API_VERSION = "1"
 
+_TABLE_COLUMN_TYPES: Mapping[str, pa.DataType] = {  # type: ignore
+    "boolean": pa.bool_(),
+    "string": pa.string(),
+    "int": pa.int32(),
+    "long": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "int[]": pa.list_(pa.int32()),
+    "long[]": pa.list_(pa.int64()),
+    "float[]": pa.list_(pa.float32()),
+    "double[]": pa.list_(pa.float64()),
+}
+
+_TEMPORAL_COLUMN_TYPES: Mapping[str, pa.DataType] = {  # type: ignore
+    "LocalDate": pa.date32(),
+    "LocalDateTime": pa.timestamp("ns"),
+    "ZonedDateTime": pa.timestamp("ns", tz="UTC"),
+    "LocalTime": pa.time64("us"),
+}
+
+# Length of the ISO 8601 representation of a time with microseconds.
+_TIME_WITH_MICROSECONDS_LENGTH = len("00:00:00.000000")
+
 
 def get_raw_query_endpoint(session: QuerySession) -> str:
     return urljoin(
@@ -34,7 +63,7 @@ def run_raw_arrow_query(
     req = Request(
         url, method="POST", headers=headers, data=json.dumps(params).encode("utf-8")
     )
-    with urlopen(req) as response:  # nosec
+    with io_span("http", url), urlopen(req) as response:  # nosec
         if response.status != HTTPStatus.OK:
             try:
                 # Try to get the first error of the chain if it exists.
@@ -50,13 +79,127 @@ def run_raw_arrow_query(
         )
 
 
+def _get_column_names(table: pa.Table) -> List[str]:  # type: ignore
+    """Return the names of the columns of the table with the unique names of levels replaced by their name.
+
+    Levels whose name is shared with another column, such as ``[Date].[Year]`` and ``[Fiscal].[Year]``, keep their unique name.
+    """
+    unique_names = cast(Collection[str], table.column_names)
+    short_names = []
+    for column_name in unique_names:
+        level_coordinates = parse_level_unique_name(column_name)
+        short_names.append(
+            column_name if level_coordinates is None else level_coordinates[2]
+        )
+    short_name_counts = Counter(short_names)
+    return [
+        short_name if short_name_counts[short_name] == 1 else unique_name
+        for unique_name, short_name in zip(unique_names, short_names)
+    ]
+
+
+def rename_level_columns(
+    table: pa.Table,  # type: ignore
+) -> pa.Table:  # type: ignore
+    return table.rename_columns(_get_column_names(table))
+
+
+def arrow_to_numpy(
+    table: pa.Table,  # type: ignore
+) -> Dict[str, np.ndarray]:
+    # Columns without nulls made of a single chunk are converted without copy.
+    return {
+        column_name: column.to_numpy()
+        for column_name, column in zip(_get_column_names(table), table.columns)
+    }
+
+
 def arrow_to_pandas(
     table: pa.Table,  # type: ignore
 ) -> pd.DataFrame:
-    return table.to_pandas().rename(
-        columns={
-            column_name: parse_level_unique_name(column_name)[2]  # type: ignore
-            for column_name in cast(Collection[str], table.column_names)
-            if parse_level_unique_name(column_name) is not None
-        }
+    return rename_level_columns(table).to_pandas()
+
+
+def _parse_timestamps(values: Sequence[Any], *, utc: bool) -> pd.Series:
+    series = pd.Series(values, dtype=object)
+    try:
+        # Without it, pandas >= 2 expects all the strings to have the precision of the first one.
+        return pd.to_datetime(series, format="ISO8601", utc=utc)
+    except ValueError:
+        return pd.to_datetime(series, utc=utc)
+
+
+def get_arrow_type(data_type: DataType) -> Optional[pa.DataType]:  # type: ignore
+    """Return the Arrow type of the values of the given type or ``None`` if it depends on the values."""
+    return _TEMPORAL_COLUMN_TYPES.get(
+        data_type.java_type, _TABLE_COLUMN_TYPES.get(data_type.java_type)
+    )
+
+
+def to_arrow_array(
+    values: Sequence[Any], *, data_type: DataType
+) -> pa.Array:  # type: ignore
+    java_type = data_type.java_type
+    if java_type in ("LocalDate", "LocalDateTime", "ZonedDateTime"):
+        array = pa.array(_parse_timestamps(values, utc=java_type == "ZonedDateTime"))
+        return array.cast(pa.date32()) if java_type == "LocalDate" else array
+    if java_type == "LocalTime":
+        # Python times stop at microseconds.
+        return pa.array(
+            [
+                None
+                if value is None
+                else time.fromisoformat(value[:_TIME_WITH_MICROSECONDS_LENGTH])
+                for value in values
+            ],
+            type=pa.time64("us"),
+        )
+    if java_type in _TABLE_COLUMN_TYPES:
+        return pa.array(values, type=_TABLE_COLUMN_TYPES[java_type])
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Objects of different types.
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=pa.string(),
+        )
+
+
+def table_rows_to_arrow(
+    rows: Sequence[Sequence[Any]],
+    *,
+    headers: Sequence[str],
+    types: Mapping[str, DataType],
+    columns: Sequence[str],
+) -> pa.Table:  # type: ignore
+    """Build an Arrow table with the given columns from rows of a table.
+
+    Temporal values must be ISO 8601 strings and arrays must be lists.
+    Each column is converted at once to its Arrow type.
+    """
+    values_per_column: Dict[str, Sequence[Any]] = (
+        dict(zip(headers, zip(*rows))) if rows else {}
+    )
+    return pa.Table.from_arrays(
+        [
+            to_arrow_array(
+                values_per_column.get(column_name, ()), data_type=types[column_name]
+            )
+            for column_name in columns
+        ],
+        names=list(columns),
     )
+
+
+def filter_arrow_table(
+    table: pa.Table,  # type: ignore
+    *,
+    coordinates: Mapping[str, Any],
+) -> pa.Table:  # type: ignore
+    """Keep the rows where the value of each column is the one given in the coordinates."""
+    mask = None
+    for column_name, value in coordinates.items():
+        column_mask = pc.equal(table.column(column_name), value)
+        mask = column_mask if mask is None else pc.and_(mask, column_mask)
+    return table if mask is None else table.filter(mask)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from subprocess import STDOUT, CalledProcessError, check_output  # nosec
+from threading import Lock, Thread, main_thread
+from time import time
+from typing import Iterable, List, Optional, Set
+from uuid import uuid4
+
+from ._java_utils import (
+    JAR_PATH,
+    get_files_digest,
+    get_java_path,
+    get_resolved_java_path,
+)
+from ._os_utils import get_env_flag
+from ._path_utils import get_atoti_home, to_absolute_path
+
+DISABLE_CLASS_DATA_SHARING_ENV_VAR = "ATOTI_DISABLE_CLASS_DATA_SHARING"
+
+# Options with which the user already chose how classes are shared.
+_CLASS_DATA_SHARING_OPTION_PREFIXES = (
+    "-Xshare",
+    "-XX:DumpLoadedClassList",
+    "-XX:SharedArchiveFile",
+    "-XX:SharedClassListFile",
+)
+
+# Temporary files older than that were left by interrupted processes.
+_STALE_TEMPORARY_FILE_AGE_IN_SECONDS = 24 * 60 * 60
+
+_LOGGER = logging.getLogger("atoti.java")
+
+_archives_being_created: Set[Path] = set()
+_archives_being_created_lock = Lock()
+
+
+def _get_temporary_path(path: Path) -> Path:
+    # Unique per process and call so that concurrent writers never write to the same file.
+    return path.with_name(f"{path.name}.{os.getpid()}.{uuid4().hex}.tmp")
+
+
+def _remove_stale_temporary_files(directory: Path) -> None:
+    for path in directory.glob("*.tmp"):
+        try:
+            if path.stat().st_mtime < time() - _STALE_TEMPORARY_FILE_AGE_IN_SECONDS:
+                path.unlink()
+        except OSError:
+            pass
+
+
+@dataclass(frozen=True)
+class ClassDataSharing:
+    """Application class-data sharing (AppCDS) archive of the classes loaded by the server.
+
+    The first server started with a given set of JARs lists the classes it loads.
+    Once it has exited, these classes are dumped to an archive in a background thread.
+    When Python is exiting, background threads would be interrupted so the archive is created synchronously instead.
+    The next servers map this archive instead of loading, parsing, and verifying these classes again.
+    The JVM checks that the archive matches its class path and falls back to loading the classes normally if it does not.
+    """
+
+    class_list_path: Path
+    archive_path: Path
+    pending_class_list_path: Path
+    """Where the server lists the classes it loads until it exits."""
+
+    def get_java_options(self) -> List[str]:
+        if self.archive_path.exists():
+            return [f"-XX:SharedArchiveFile={self.archive_path}"]
+        if self.class_list_path.exists():
+            # The previous process might have exited before the archive was created.
+            self._create_archive_in_background()
+            return []
+        self.class_list_path.parent.mkdir(parents=True, exist_ok=True)
+        return [f"-XX:DumpLoadedClassList={self.pending_class_list_path}"]
+
+    def on_server_exit(self, *, return_code: int) -> None:
+        """Keep the class list written by the server unless it was killed and create the archive from it."""
+        if not self.pending_class_list_path.exists():
+            return
+        try:
+            # A killed server might have been interrupted while writing a line.
+            if return_code < 0:
+                self.pending_class_list_path.unlink()
+                return
+            os.replace(self.pending_class_list_path, self.class_list_path)
+        except OSError:
+            _LOGGER.debug("Could not keep the class list.", exc_info=True)
+            return
+        # The main thread is only stopped once the interpreter is shutting down.
+        if main_thread().is_alive():
+            self._create_archive_in_background()
+        else:
+            self._create_archive()
+
+    def _create_archive_in_background(self) -> None:
+        # If the process exits before it is done, the archive will be created from the kept class list by the next one.
+        Thread(target=self._create_archive, daemon=True).start()
+
+    def _create_archive(self) -> None:
+        with _archives_being_created_lock:
+            if (
+                self.archive_path in _archives_being_created
+                or self.archive_path.exists()
+            ):
+                return
+            _archives_being_created.add(self.archive_path)
+        pending_archive_path = _get_temporary_path(self.archive_path)
+        try:
+            _remove_stale_temporary_files(self.archive_path.parent)
+            # Dumping without running the application: the class path must be the same as the one the server uses.
+            check_output(  # nosec
+                [
+                    str(get_java_path()),
+                    "-Xshare:dump",
+                    f"-XX:SharedClassListFile={self.class_list_path}",
+                    f"-XX:SharedArchiveFile={pending_archive_path}",
+                    "-cp",
+                    to_absolute_path(JAR_PATH),
+                ],
+                stderr=STDOUT,
+                text=True,
+            )
+            os.replace(pending_archive_path, self.archive_path)
+            _LOGGER.debug("Created %s.", self.archive_path)
+        except (CalledProcessError, OSError) as error:
+            if pending_archive_path.exists():
+                pending_archive_path.unlink()
+            _LOGGER.debug(
+                "Could not create the class data sharing archive:\n%s",
+                getattr(error, "output", error),
+            )
+        finally:
+            with _archives_being_created_lock:
+                _archives_being_created.discard(self.archive_path)
+
+
+def get_class_data_sharing(
+    *, jar_paths: Iterable[str], java_options: Iterable[str]
+) -> Optional[ClassDataSharing]:
+    """Return the archive to use to start a server with the given extra JARs, or ``None`` if it cannot be used."""
+    if get_env_flag(DISABLE_CLASS_DATA_SHARING_ENV_VAR) or any(
+        option.startswith(_CLASS_DATA_SHARING_OPTION_PREFIXES)
+        for option in java_options
+    ):
+        return None
+    resolved_java_path = get_resolved_java_path(get_java_path())
+    if resolved_java_path is None:
+        return None
+    # The classes loaded depend on the JARs and the archive on the Java installation.
+    digest = get_files_digest(
+        [
+            JAR_PATH.resolve(),
+            *(Path(jar_path).resolve() for jar_path in jar_paths),
+            resolved_java_path,
+        ]
+    )
+    if digest is None:
+        return None
+    directory = get_atoti_home() / "cache" / "cds"
+    class_list_path = directory / f"{digest}.classlist"
+    return ClassDataSharing(
+        class_list_path=class_list_path,
+        archive_path=directory / f"{digest}.jsa",
+        pending_class_list_path=_get_temporary_path(class_list_path),
+    )
@@ -30,7 +30,9 @@ def _extract_java_version(java_version_output: str) -> Tuple[int, ...]:
     return tuple(_convert_element_to_int(element) for element in version_elements)
 
 
-def check_java_version(minimum_supported_version: Tuple[int], *, java_path: Path):
+def check_java_version(
+    minimum_supported_version: Tuple[int], *, java_path: Path
+) -> Tuple[int, ...]:
     try:
         output = check_output(  # nosec
             [str(java_path), "-version"], stderr=STDOUT, text=True
@@ -44,3 +46,5 @@ def check_java_version(minimum_supported_version: Tuple[int], *, java_path: Path
         raise Exception(
             f"Java >= {'.'.join(map(str, minimum_supported_version))} is required but current version is {'.'.join(map(str, java_version))}."
         )
+
+    return java_version
@@ -0,0 +1,165 @@
+"""Stress test of the API called from many threads at once.
+
+Run it with ``python -m atoti._concurrency_benchmark``.
+Loads, queries, and metadata lookups are run on the same session, first one after the other on a single thread and then concurrently on many threads.
+The run fails if a call raised an error or if the loaded data does not match what was sent, and reports the speedup of the concurrent run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Final
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    duration: float = 0
+    """Duration of the run in seconds."""
+
+    call_counts: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+
+def _create_dataframe(chunk_index: int, *, chunk_size: int) -> pd.DataFrame:
+    ids = np.arange(chunk_index * chunk_size, (chunk_index + 1) * chunk_size)
+    return pd.DataFrame(
+        {"ID": ids, "Group": "G" + pd.Series(ids % 100).astype(str), "Value": 1.0}
+    )
+
+
+def _get_workloads(
+    session: Any, table: Any, *, chunk_count: int, chunk_size: int, call_count: int
+) -> Dict[str, Sequence[Callable[[], Any]]]:
+    cube = session.cubes["Stress"]
+    measure = cube.measures["Value.SUM"]
+    level = cube.levels["Group"]
+
+    def load(chunk_index: int) -> Callable[[], Any]:
+        return lambda: table.load_pandas(
+            _create_dataframe(chunk_index, chunk_size=chunk_size)
+        )
+
+    def lookup_metadata() -> Any:
+        return (
+            list(cube.hierarchies),
+            list(cube.measures),
+            table.keys,
+            list(table.columns),
+            session.port,
+        )
+
+    return {
+        "load": [load(chunk_index) for chunk_index in range(1, chunk_count + 1)],
+        "query": [
+            lambda: cube.query(measure, levels=[level], mode="raw")
+            for _ in range(call_count)
+        ],
+        "metadata": [lookup_metadata for _ in range(call_count)],
+    }
+
+
+def _run(
+    name: str,
+    workloads: Dict[str, Sequence[Callable[[], Any]]],
+    *,
+    thread_count: int,
+) -> BenchmarkResult:
+    result = BenchmarkResult(
+        name,
+        call_counts={
+            workload_name: len(workload)
+            for workload_name, workload in workloads.items()
+        },
+    )
+
+    def call(workload_name: str, func: Callable[[], Any]) -> None:
+        try:
+            func()
+        except Exception:  # pylint: disable=broad-except
+            result.errors.append(f"{workload_name}: {traceback.format_exc()}")
+
+    # Interleave the workloads so that they overlap.
+    interleaved_calls = [
+        (workload_name, workload[index])
+        for index in range(max(len(workload) for workload in workloads.values()))
+        for workload_name, workload in workloads.items()
+        if index < len(workload)
+    ]
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        for workload_name, func in interleaved_calls:
+            executor.submit(call, workload_name, func)
+    result.duration = perf_counter() - start
+    return result
+
+
+def run_benchmark(
+    *, thread_count: int = 16, chunk_count: int = 20, chunk_size: int = 10_000
+) -> List[BenchmarkResult]:
+    """Run the workloads on a single thread then on many threads and return the results."""
+    import atoti as tt  # pylint: disable=import-outside-toplevel
+
+    results = []
+    with tt.create_session() as session:
+        for name, threads in [("sequential", 1), ("concurrent", thread_count)]:
+            table = session.read_pandas(
+                _create_dataframe(0, chunk_size=chunk_size),
+                keys=["ID"],
+                table_name=f"Stress {name}",
+            )
+            session.create_cube(table, "Stress")
+            workloads = _get_workloads(
+                session,
+                table,
+                chunk_count=chunk_count,
+                chunk_size=chunk_size,
+                call_count=chunk_count * 2,
+            )
+            result = _run(name, workloads, thread_count=threads)
+            expected_row_count = (chunk_count + 1) * chunk_size
+            if len(table) != expected_row_count:
+                result.errors.append(
+                    f"The table has {len(table)} rows instead of {expected_row_count}."
+                )
+            results.append(result)
+            del session.cubes["Stress"]
+    for result in results:
+        call_counts = ", ".join(
+            f"{count} {workload_name}"
+            for workload_name, count in result.call_counts.items()
+        )
+        print(f"{result.name}: {result.duration:.3f}s for {call_counts}")
+    sequential, concurrent = results
+    print(f"Speedup: {sequential.duration / concurrent.duration:.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser: Final = argparse.ArgumentParser(  # pylint: disable=invalid-name
+        description="Stress test the API called from many threads at once."
+    )
+    parser.add_argument(
+        "--threads", default=16, help="the number of concurrent threads", type=int
+    )
+    parser.add_argument(
+        "--chunks", default=20, help="the number of loads per run", type=int
+    )
+    parser.add_argument(
+        "--chunk-size", default=10_000, help="the number of rows per load", type=int
+    )
+    args: argparse.Namespace = parser.parse_args()
+    benchmark_results = run_benchmark(
+        thread_count=args.threads, chunk_count=args.chunks, chunk_size=args.chunk_size
+    )
+    benchmark_errors = [error for result in benchmark_results for error in result.errors]
+    if benchmark_errors:
+        raise SystemExit("\n".join(benchmark_errors))
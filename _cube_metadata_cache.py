@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from threading import RLock
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import pyarrow as pa
+
+from .comparator import Comparator
+from .query._cellset import LevelCoordinates, MemberDictionary
+
+if TYPE_CHECKING:
+    from ._java_api import JavaApi
+    from .hierarchy import Hierarchy
+
+FetchLevelDataTypes = Callable[
+    [Collection[LevelCoordinates]], Mapping[LevelCoordinates, str]
+]
+
+
+class CubeMetadataCache:
+    """Cache of the metadata of a cube's hierarchies, levels, and measures.
+
+    The cache is emptied as soon as the structure version of the session changes.
+    The level members also depend on the data so they are emptied when the data version changes too.
+
+    It can be used from several threads: values fetched while the versions changed are returned but not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_level_data_types: FetchLevelDataTypes,
+        get_data_version: Callable[[], int],
+        get_structure_version: Callable[[], int],
+    ):
+        self._fetch_level_data_types = fetch_level_data_types
+        self._get_data_version = get_data_version
+        self._get_structure_version = get_structure_version
+        self._data_version = get_data_version()
+        self._structure_version = get_structure_version()
+        self._hierarchies: Optional[Dict[Tuple[str, str], Hierarchy]] = None
+        self._level_data_types: Dict[LevelCoordinates, str] = {}
+        self._level_members: Dict[
+            Tuple[LevelCoordinates, str], Tuple[Comparator, pa.Array]  # type: ignore
+        ] = {}
+        self._measures: Optional[Dict[str, JavaApi.JavaMeasureDescription]] = None
+        self._member_dictionaries: Dict[LevelCoordinates, MemberDictionary] = {}
+        self._lock = RLock()
+
+    def _clear_if_stale(self) -> Tuple[int, int]:
+        """Empty the stale parts of the cache and return the versions its content corresponds to."""
+        with self._lock:
+            structure_version = self._get_structure_version()
+            if structure_version != self._structure_version:
+                self._structure_version = structure_version
+                self._hierarchies = None
+                self._level_data_types.clear()
+                self._level_members.clear()
+                self._measures = None
+                self._member_dictionaries.clear()
+
+            data_version = self._get_data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._level_members.clear()
+
+            return structure_version, data_version
+
+    def _is_current(self, versions: Tuple[int, int]) -> bool:
+        """Whether the cache still corresponds to the given versions, in which case values fetched for them can be cached."""
+        return versions == (self._structure_version, self._data_version)
+
+    def get_hierarchies(
+        self, fetch_hierarchies: Callable[[], Dict[Tuple[str, str], Hierarchy]]
+    ) -> Mapping[Tuple[str, str], Hierarchy]:
+        """Return the hierarchies of the cube, only fetching them if they are not cached."""
+        versions = self._clear_if_stale()
+        hierarchies = self._hierarchies
+        if hierarchies is None:
+            hierarchies = fetch_hierarchies()
+            with self._lock:
+                if self._is_current(versions):
+                    self._hierarchies = hierarchies
+        return hierarchies
+
+    def get_measures(
+        self,
+        fetch_measures: Callable[[], Dict[str, JavaApi.JavaMeasureDescription]],
+    ) -> Mapping[str, JavaApi.JavaMeasureDescription]:
+        """Return the description of the measures of the cube, only fetching them if they are not cached."""
+        versions = self._clear_if_stale()
+        measures = self._measures
+        if measures is None:
+            measures = fetch_measures()
+            with self._lock:
+                if self._is_current(versions):
+                    self._measures = measures
+        return measures
+
+    def get_level_data_types(
+        self, levels_coordinates: Collection[LevelCoordinates]
+    ) -> Dict[LevelCoordinates, str]:
+        """Return the data types of the given levels, only fetching the unknown ones."""
+        versions = self._clear_if_stale()
+        level_data_types = {
+            level_coordinates: self._level_data_types[level_coordinates]
+            for level_coordinates in levels_coordinates
+            if level_coordinates in self._level_data_types
+        }
+        missing_levels_coordinates = [
+            level_coordinates
+            for level_coordinates in levels_coordinates
+            if level_coordinates not in level_data_types
+        ]
+        if missing_levels_coordinates:
+            fetched_level_data_types = self._fetch_level_data_types(
+                missing_levels_coordinates
+            )
+            level_data_types.update(fetched_level_data_types)
+            with self._lock:
+                if self._is_current(versions):
+                    self._level_data_types.update(fetched_level_data_types)
+        return {
+            level_coordinates: level_data_types[level_coordinates]
+            for level_coordinates in levels_coordinates
+        }
+
+    def get_member_dictionary(
+        self, level_coordinates: LevelCoordinates
+    ) -> MemberDictionary:
+        """Return the dictionary of the members of the given level."""
+        versions = self._clear_if_stale()
+        member_dictionary = self._member_dictionaries.get(level_coordinates)
+        if member_dictionary is None:
+            member_dictionary = MemberDictionary(
+                data_type=self.get_level_data_types([level_coordinates])[
+                    level_coordinates
+                ]
+            )
+            with self._lock:
+                if self._is_current(versions):
+                    # Another thread might have created it meanwhile and started filling it.
+                    member_dictionary = self._member_dictionaries.setdefault(
+                        level_coordinates, member_dictionary
+                    )
+        return member_dictionary
+
+    def get_level_members(
+        self,
+        level_coordinates: LevelCoordinates,
+        *,
+        comparator: Comparator,
+        fetch_level_members: Callable[[], pa.Array],  # type: ignore
+        scenario: str,
+    ) -> pa.Array:  # type: ignore
+        """Return the sorted distinct members of the given level, only fetching them if they are not cached."""
+        versions = self._clear_if_stale()
+        key = level_coordinates, scenario
+        # Comparators are not hashable since the first members are a list.
+        cached_comparator, members = self._level_members.get(key, (None, None))
+        if members is None or cached_comparator != comparator:
+            members = fetch_level_members()
+            with self._lock:
+                if self._is_current(versions):
+                    self._level_members[key] = comparator, members
+        return members
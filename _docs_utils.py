@@ -130,6 +130,8 @@ def get_query_args_doc(*, is_query_session: bool) -> str:
                                   United states    240.00
                         Europe    Germany          150.00
 
+            diff_against_base: When *scenarios* is passed, whether to only return the cells of the other scenarios whose value differs from the one in the base scenario.
+                A classic :class:`pandas.DataFrame` is then returned with the values equal to the base scenario replaced with ``NaN`` and the rows without any difference dropped.
             include_totals: Whether the returned DataFrame should include the grand total and subtotals.
                 Totals can be useful but they make the DataFrame harder to work with since its index will have some empty values.
 
@@ -161,6 +163,9 @@ def get_query_args_doc(*, is_query_session: bool) -> str:
             levels: The levels to split on.
                 If ``None``, the value of the measures at the top of the cube is returned.
             scenario: The scenario to query.
+            scenarios: The scenarios to query at once.
+                A single query is executed and the scenario becomes the first level of the index of the returned DataFrame.
+                Cannot be combined with *scenario*.
             timeout: The query timeout in seconds.
 """
 
@@ -174,6 +179,30 @@ EXPLAIN_QUERY_DOC = """Run the query but return an explanation of how the query
             An explanation containing a summary, global timings, and the query plan with all the retrievals.
         """
 
+DRILLTHROUGH_DOC = """Stream the facts contributing to the cube location selected by *condition*.
+
+        The rows are retrieved with MDX ``DRILLTHROUGH`` queries, each returning at most *batch_size* rows.
+        Batches are only queried when the previous one has been consumed.
+
+        Args:
+            batch_size: The maximum number of rows of each batch.
+            columns: The names of the drillthrough columns to return.
+                If ``None``, all the columns are returned.
+            condition: The filtering condition.
+                The same conditions as in :meth:`query` are supported.
+            limit: The maximum number of rows to return.
+                If ``None``, all the matching rows are returned.
+            offset: The number of rows to skip.
+                Passing the number of rows already consumed resumes a previous drillthrough.
+            scenario: The scenario to drill through.
+            timeout: The timeout of each query in seconds.
+
+        Returns:
+            An iterator of :class:`pyarrow.RecordBatch` sharing the same schema.
+            The columns have the type of the table column, level, or measure with the same name and the other ones are strings.
+            :meth:`pyarrow.Table.from_batches` can be used to collect them into a table.
+        """
+
 QUERY_DOC = """Query the cube to retrieve the value of the passed measures on the given levels.
 
         In JupyterLab with the :mod:`atoti-jupyterlab <atoti_jupyterlab>` plugin installed, query results can be converted to interactive widgets with the :guilabel:`Convert to Widget Below` action available in the command palette or by right clicking on the representation of the returned Dataframe.
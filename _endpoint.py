@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
-from dataclasses import dataclass
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from threading import Lock, Thread
 from typing import TYPE_CHECKING, Any, Callable, Collection, Optional
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
 from ._py4j_utils import to_python_dict
 from .pyapi.http_request import HttpRequest
 from .pyapi.user import User
@@ -11,14 +21,155 @@ from .pyapi.user import User
 if TYPE_CHECKING:
     from ._local_session import LocalSession
 
-    CallbackEndpoint = Callable[[HttpRequest, User, LocalSession[Any]], str]
+    CallbackEndpoint = Callable[[HttpRequest, User, LocalSession[Any]], Any]
+
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
+
+def _to_iso_format(value: Any) -> Any:
+    if value is pd.NaT:
+        return None
+    return value.isoformat() if isinstance(value, (date, datetime, time)) else value
+
+
+def _format_dates(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Format the dates with ``isoformat()`` like the dates of the other bodies rather than with the ISO format of pandas."""
+    dataframe = dataframe.copy(deep=False)
+    for column_name, column in dataframe.items():
+        if pd.api.types.is_datetime64_any_dtype(column.dtype):
+            column = column.astype(object).where(column.notna(), None)
+        elif column.dtype != object:
+            continue
+        dataframe[column_name] = column.map(_to_iso_format)
+    return dataframe
+
+
+def _replace_non_finite_floats(value: Any) -> Any:
+    """Replace NaN and infinite floats with ``None`` like orjson does since they are not valid JSON."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite_floats(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite_floats(item) for item in value]
+    return value
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Convert the values that the standard JSON encoder does not support."""
+    if isinstance(value, pa.Table):
+        value = value.to_pandas()
+    if isinstance(value, pd.DataFrame):
+        return json.loads(_format_dates(value).to_json(orient="records"))
+    if isinstance(value, pd.Series):
+        return json.loads(
+            _format_dates(value.to_frame()).iloc[:, 0].to_json(orient="values")
+        )
+    if isinstance(value, np.ndarray):
+        return _replace_non_finite_floats(value.tolist())
+    if isinstance(value, np.generic):
+        return _replace_non_finite_floats(value.item())
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_response_body(body: Any) -> str:
+    """Serialize the response body to JSON.
+
+    DataFrames and Arrow tables are serialized as a list of records.
+    When they are the whole body, pandas' encoder writes them directly, without building Python objects for each row.
+    orjson is used for the other bodies if it is installed.
+    Both encoders give the same output: dates are formatted with ``isoformat()`` and NaN or infinite floats become ``null``.
+    """
+    if isinstance(body, pa.Table):
+        body = body.to_pandas()
+    if isinstance(body, pd.DataFrame):
+        return _format_dates(body).to_json(orient="records")
+    if orjson is not None:
+        return orjson.dumps(
+            body,
+            default=_to_json_compatible,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf8")
+    return json.dumps(
+        _replace_non_finite_floats(body),
+        allow_nan=False,
+        default=_to_json_compatible,
+        separators=(",", ":"),
+    )
+
+
+def decode_request_body(body: str) -> Any:
+    """Parse the request body.
+
+    orjson rejects the ``NaN`` and ``Infinity`` constants accepted by the standard decoder so such bodies are parsed with the latter.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_EVENT_LOOP_LOCK = Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop running the coroutine handlers, starting it on first use."""
+    global _EVENT_LOOP  # pylint: disable=global-statement
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP is None:
+            _EVENT_LOOP = asyncio.new_event_loop()
+            Thread(
+                target=_EVENT_LOOP.run_forever,
+                daemon=True,
+                name="atoti-endpoint-event-loop",
+            ).start()
+        return _EVENT_LOOP
 
 
 @dataclass
 class EndpointHandler:
+    """Handle the requests made to a custom endpoint.
+
+    Py4J calls :meth:`handleRequest` on one of its callback threads, one per concurrent request, and this thread waits for the response whatever the kind of callback.
+    Coroutine functions run on an event loop shared by all the endpoints: a blocking call in one of them stalls all the coroutine endpoints.
+    Other functions run on the callback thread, or on a pool of *max_workers* threads dedicated to the endpoint if it is given.
+    The pool only bounds the number of requests handled at once: the callback thread waits for it so it does not add concurrency.
+    """
+
     callback: CallbackEndpoint
     session: LocalSession[Any]
+    max_workers: Optional[int] = None
     name: str = "Python.EndpointHandler"
+    _executor: Optional[ThreadPoolExecutor] = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_workers is not None and not inspect.iscoroutinefunction(
+            self.callback
+        ):
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="atoti-endpoint"
+            )
+
+    def _call(self, request: HttpRequest, user: User) -> Any:
+        if inspect.iscoroutinefunction(self.callback):
+            return asyncio.run_coroutine_threadsafe(
+                self.callback(request, user, self.session), _get_event_loop()
+            ).result()
+        if self._executor is not None:
+            return self._executor.submit(
+                self.callback, request, user, self.session
+            ).result()
+        return self.callback(request, user, self.session)
 
     def handleRequest(  # pylint: disable=invalid-name, too-many-positional-parameters
         self,
@@ -32,17 +183,17 @@ class EndpointHandler:
             str(key): str(value)
             for key, value in to_python_dict(path_parameter_values).items()
         }
-        parsed_body = None if body is None else json.loads(body)
+        parsed_body = None if body is None else decode_request_body(body)
         request = HttpRequest(url, path_parameters, parsed_body)
         user = User(username, roles[1 : len(roles) - 1].split(", "))
 
-        response_body = self.callback(
-            request,
-            user,
-            self.session,
-        )
+        response_body = self._call(request, user)
+
+        return encode_response_body(response_body)
 
-        return json.dumps(response_body)
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
 
     def toString(self) -> str:  # pylint: disable=invalid-name
         return self.name
@@ -0,0 +1,184 @@
+"""Benchmark of the time taken to import atoti.
+
+Run it with ``python -m atoti._import_benchmark``.
+Each repetition imports atoti in a new interpreter.
+The run fails if the import time regressed compared to the baseline stored in the atoti home directory or if importing atoti loaded one of the heavy dependencies that should only be loaded on first use.
+``--save-baseline`` replaces this baseline with the new results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess  # nosec
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence
+
+from typing_extensions import Final
+
+from ._path_utils import get_atoti_home
+from ._version import VERSION
+
+DEFAULT_BASELINE_PATH: Final = get_atoti_home() / "benchmarks" / "import.json"
+
+# Relative slowdown above which the import is reported as a regression.
+DEFAULT_REGRESSION_THRESHOLD: Final = 0.2
+
+LAZILY_IMPORTED_MODULES: Final = ["numpy", "pandas", "py4j", "pyarrow", "typeguard"]
+
+_PROBE: Final = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import atoti
+duration = time.perf_counter() - start
+print(json.dumps({"duration": duration, "modules": sorted(sys.modules)}))
+"""
+
+
+@dataclass
+class BenchmarkResult:
+    durations: List[float] = field(default_factory=list)
+    """Duration of each import in seconds."""
+
+    loaded_modules: List[str] = field(default_factory=list)
+    """Lazily imported modules that were loaded anyway."""
+
+    slowest_modules: Dict[str, float] = field(default_factory=dict)
+    """Cumulative import time of the slowest modules in seconds."""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.durations)
+
+
+def _get_slowest_modules(*, count: int) -> Dict[str, float]:
+    output = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", "import atoti"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    cumulative_durations: Dict[str, float] = {}
+    for line in output.splitlines():
+        # Lines look like: "import time:       123 |       4567 |   atoti._version".
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative_durations[parts[2].strip()] = int(parts[1]) / 1_000_000
+    return dict(
+        sorted(cumulative_durations.items(), key=lambda item: item[1], reverse=True)[
+            :count
+        ]
+    )
+
+
+def run_benchmark(*, repetitions: int = 10) -> BenchmarkResult:
+    """Import atoti in new interpreters and return the results."""
+    result = BenchmarkResult()
+    loaded_modules = set()
+    for _ in range(repetitions):
+        output = subprocess.run(  # nosec
+            [sys.executable, "-c", _PROBE], capture_output=True, check=True, text=True
+        ).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        result.durations.append(probe["duration"])
+        loaded_modules.update(
+            module_name
+            for module_name in probe["modules"]
+            if module_name.split(".")[0] in LAZILY_IMPORTED_MODULES
+        )
+    result.loaded_modules = sorted(
+        {module_name.split(".")[0] for module_name in loaded_modules}
+    )
+    result.slowest_modules = _get_slowest_modules(count=10)
+    print(f"import atoti: {result.median:.3f}s")
+    for module_name, duration in result.slowest_modules.items():
+        print(f"  {module_name}: {duration:.3f}s")
+    return result
+
+
+def save_baseline(result: BenchmarkResult, *, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {"version": VERSION, "result": {**asdict(result), "median": result.median}},
+            indent=2,
+        )
+    )
+
+
+def compare_to_baseline(
+    result: BenchmarkResult,
+    *,
+    baseline: Mapping[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> bool:
+    """Print the comparison of the result to the baseline and return whether it is a regression."""
+    baseline_median = baseline["result"]["median"]
+    ratio = result.median / baseline_median
+    is_regression = ratio > 1 + threshold
+    print(
+        f"Comparison to the baseline of atoti {baseline['version']}:"
+        f" {baseline_median:.3f}s -> {result.median:.3f}s"
+        f" ({ratio - 1:+.1%}){' REGRESSION' if is_regression else ''}"
+    )
+    return is_regression
+
+
+def _get_failures(result: BenchmarkResult, *, is_regression: bool) -> Sequence[str]:
+    failures = []
+    if result.loaded_modules:
+        failures.append(
+            f"Importing atoti loaded {', '.join(result.loaded_modules)}, which should only be loaded on first use."
+        )
+    if is_regression:
+        failures.append("The import time regressed.")
+    return failures
+
+
+if __name__ == "__main__":
+    parser: Final = argparse.ArgumentParser(  # pylint: disable=invalid-name
+        description="Benchmark the import of atoti."
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE_PATH),
+        help="the path of the JSON file holding the baseline result",
+        type=str,
+    )
+    parser.add_argument(
+        "--repetitions", default=10, help="the number of imports", type=int
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="replace the baseline with the result of this run",
+    )
+    parser.add_argument(
+        "--threshold",
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="the relative slowdown above which the import is reported as a regression",
+        type=float,
+    )
+    args: argparse.Namespace = parser.parse_args()
+    baseline_path = Path(args.baseline)
+    benchmark_result = run_benchmark(repetitions=args.repetitions)
+    regressed = False
+    if baseline_path.exists():
+        regressed = compare_to_baseline(
+            benchmark_result,
+            baseline=json.loads(baseline_path.read_text()),
+            threshold=args.threshold,
+        )
+    if args.save_baseline:
+        save_baseline(benchmark_result, path=baseline_path)
+        print(f"The baseline has been saved to {baseline_path.resolve()}")
+    benchmark_failures = _get_failures(benchmark_result, is_regression=regressed)
+    if benchmark_failures:
+        raise SystemExit("\n".join(benchmark_failures))
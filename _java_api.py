@@ -1,32 +1,40 @@
 from __future__ import annotations
 
+import json
 import re
 from dataclasses import dataclass
+from threading import Lock
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
-    cast,
 )
 
 import pandas as pd
+import pyarrow as pa
 from py4j.clientserver import ClientServer, JavaParameters, PythonParameters
 from py4j.java_collections import ListConverter
+from py4j.protocol import Py4JError
 from typing_extensions import Literal
 
+from ._arrow import table_rows_to_arrow
 from ._endpoint import EndpointHandler
 from ._measures.utils import convert_level_in_description
 from ._plugins import MissingPluginError
 from ._providers import PartialAggregateProvider
 from ._py4j_utils import (
+    get_object_mapper,
     to_java_map,
     to_java_object_array,
     to_java_object_list,
@@ -35,7 +43,10 @@ from ._py4j_utils import (
     to_python_list,
 )
 from ._query_plan import QueryAnalysis, QueryPlan, RetrievalData
+from ._session_definition import DefinitionJournal
+from ._shared_measures import SharedMeasures
 from ._sources.csv import CsvFileFormat
+from ._table_metadata_cache import TableMetadataCache
 from ._type_utils import is_array, is_temporal
 from .client_side_encryption import ClientSideEncryption
 from .comparator import ASCENDING, Comparator
@@ -55,6 +66,9 @@ if TYPE_CHECKING:
     from .table import Table
 
 
+_T = TypeVar("_T")
+
+
 def _parse_detailed_type(underlying_type: str) -> DataType:
     """Parse java detailed type string in DataType."""
     clean_type = underlying_type.replace("nullable ", "")
@@ -94,7 +108,13 @@ class ApiMetaClass(type):
 
 # pylint: disable=too-many-lines
 class JavaApi(metaclass=ApiMetaClass):
-    """API for communicating with the JVM."""
+    """API for communicating with the JVM.
+
+    It can be called from several threads at once.
+    The Py4J client server runs in pinned thread mode: each Python thread gets its own connection to the JVM, served by its own Java thread.
+    Calls made from different threads (e.g. a load and metadata lookups) thus run in parallel and a thread starting a transaction is the one ending it.
+    The Python-side state (versions, registered functions, shared measures, definition journal) is guarded by locks.
+    """
 
     _client_side_encryption: Optional[ClientSideEncryption] = None
 
@@ -105,11 +125,73 @@ class JavaApi(metaclass=ApiMetaClass):
         self.gateway: Any = JavaApi._create_py4j_gateway(py4j_java_port)
         self.java_session: Any = self.gateway.entry_point
         self.java_session.api(distributed)
+        self._structure_version = 0
+        self._data_version = 0
+        self._versions_lock = Lock()
+        self._kinds_without_json_snapshot: Set[str] = set()
+        self._registered_aggregation_functions: Set[str] = set()
+        self._registered_aggregation_functions_lock = Lock()
+        self.shared_measures = SharedMeasures()
+        self.table_metadata_cache = TableMetadataCache(
+            get_structure_version=lambda: self.structure_version
+        )
+        self.definition_journal = DefinitionJournal()
+
+    @property
+    def structure_version(self) -> int:
+        """Counter incremented each time the structure of the session may have changed.
+
+        Python objects caching metadata retrieved from the JVM compare it with the version they were filled at to know when they are stale.
+        """
+        return self._structure_version
+
+    @property
+    def data_version(self) -> int:
+        """Counter incremented each time data may have been changed from Python.
+
+        Data loaded by sources running in the JVM on their own (e.g. Kafka streams) does not change it.
+        """
+        return self._data_version
+
+    def _increment_structure_version(self) -> None:
+        with self._versions_lock:
+            self._structure_version += 1
+
+    def _increment_data_version(self) -> None:
+        with self._versions_lock:
+            self._data_version += 1
 
     @property
     def java_api(self) -> Any:
         return self.java_session.api()
 
+    def _convert_with_json_snapshot(
+        self,
+        java_object: Any,
+        *,
+        kind: str,
+        from_json: Callable[[Any], _T],
+        from_java: Callable[[Any], _T],
+    ) -> _T:
+        """Convert the Java object using a JSON snapshot of it.
+
+        The snapshot is serialized in the JVM by Jackson and decoded in a single round-trip instead of calling a getter per attribute.
+        If the object of the given kind cannot be serialized or its snapshot does not have the expected shape, *from_java* is used instead and the snapshot is not attempted anymore for this kind.
+        """
+        if kind not in self._kinds_without_json_snapshot:
+            try:
+                return from_json(
+                    json.loads(
+                        get_object_mapper(self.gateway).writeValueAsString(
+                            java_object
+                        )
+                    )
+                )
+            except (KeyError, Py4JError, TypeError, ValueError):
+                self._kinds_without_json_snapshot.add(kind)
+
+        return from_java(java_object)
+
     @staticmethod
     def _create_py4j_gateway(java_port: Optional[int] = None) -> ClientServer:
         # Connect to the Java side using the provided Java port
@@ -143,15 +225,20 @@ class JavaApi(metaclass=ApiMetaClass):
     def refresh(self) -> None:
         """Refresh the Java session."""
         self.java_api.refresh()
+        self._increment_structure_version()
         _warn_new_errors(self.get_new_load_errors())
 
     def publish_measures(self, cube_name: str) -> None:
         """Publish the new measures."""
         self.java_api.outsideTransactionApi().publishMeasures(cube_name)
+        self._increment_structure_version()
 
     def clear_session(self) -> None:
         """Refresh the pivot."""
         self.java_api.clearSession()
+        self._increment_structure_version()
+        self.shared_measures.clear()
+        self.definition_journal.clear()
 
     def get_session_port(self) -> int:
         """Return the port of the session."""
@@ -315,6 +402,15 @@ class JavaApi(metaclass=ApiMetaClass):
             is_parameter_table=is_parameter_table,
         )
         self.java_api.outsideTransactionApi().createStore(name, table_params)
+        self._increment_structure_version()
+        self.definition_journal.record_table(
+            name,
+            types=types,
+            keys=keys,
+            partitioning=partitioning,
+            hierarchized_columns=hierarchized_columns,
+            is_parameter_table=is_parameter_table,
+        )
 
     def convert_source_params(self, params: Mapping[str, Any]) -> Any:
         """Convert the params to Java Objects."""
@@ -403,6 +499,7 @@ class JavaApi(metaclass=ApiMetaClass):
         self.java_api.loadDataSourceIntoStore(
             table_name, source_key, load_params, source_params
         )
+        self._increment_data_version()
         # Check if errors happened during the loading
         _warn_new_errors(self.get_new_load_errors())
 
@@ -411,6 +508,7 @@ class JavaApi(metaclass=ApiMetaClass):
         self.java_api.outsideTransactionApi().createBranch(
             scenario_name, parent_scenario
         )
+        self._increment_data_version()
 
     def get_scenarios(self) -> List[str]:
         """Get the list of scenarios defined in the current session."""
@@ -419,6 +517,7 @@ class JavaApi(metaclass=ApiMetaClass):
     def delete_scenario(self, scenario: str) -> None:
         """Delete a scenario from the table."""
         self.java_api.outsideTransactionApi().deleteBranch(scenario)
+        self._increment_data_version()
 
     def start_transaction(self, scenario_name: str) -> None:
         """Start a multi operation transaction on the datastore."""
@@ -427,6 +526,7 @@ class JavaApi(metaclass=ApiMetaClass):
     def end_transaction(self, has_succeeded: bool) -> None:
         """End a multi operation transaction on the datastore."""
         self.java_api.endTransaction(has_succeeded)
+        self._increment_data_version()
 
     @dataclass(frozen=True)
     class AggregatesCacheDescription:
@@ -517,18 +617,19 @@ class JavaApi(metaclass=ApiMetaClass):
     def get_table_schema(self, table: Table) -> List[JavaApi.ColumnDescription]:  # type: ignore
         """Return the schema of the java table."""
         schema = self.java_api.getStoreSchema(table.name)
-        columns_descriptions = []
-        for i in range(0, len(list(schema.fieldNames()))):
-            columns_descriptions.append(
-                JavaApi.ColumnDescription(
-                    name=schema.fieldNames()[i],
-                    data_type=DataType(
-                        java_type=schema.types()[i].getJavaType(),
-                        nullable=schema.types()[i].nullable(),
-                    ),
-                )
+        # Retrieve the arrays once instead of once per column.
+        field_names = list(schema.fieldNames())
+        java_types = list(schema.types())
+        return [
+            JavaApi.ColumnDescription(
+                name=field_name,
+                data_type=DataType(
+                    java_type=java_type.getJavaType(),
+                    nullable=java_type.nullable(),
+                ),
             )
-        return columns_descriptions
+            for field_name, java_type in zip(field_names, java_types)
+        ]
 
     def get_table_partitioning(self, table: Table) -> str:
         """Return the table's partitioning."""
@@ -582,10 +683,15 @@ class JavaApi(metaclass=ApiMetaClass):
         self.java_api.outsideTransactionApi().createCubeFromStore(
             table.name, cube_name, creation_mode
         )
+        self.shared_measures.forget_cube(cube_name)
+        self.definition_journal.record_cube(
+            cube_name, base_table_name=table.name, mode=creation_mode
+        )
 
     def create_distributed_cube(self, cube_name: str) -> None:
         """Create a distributed cube."""
         self.java_api.createDistributedCube(cube_name)
+        self.shared_measures.forget_cube(cube_name)
 
     def generate_cube_schema_image(self, cube_name: str) -> str:
         """Generate the cube schema image and return its path."""
@@ -598,6 +704,8 @@ class JavaApi(metaclass=ApiMetaClass):
     def delete_cube(self, cube_name: str) -> None:
         """Delete a cube from the current session."""
         self.java_api.outsideTransactionApi().deleteCube(cube_name)
+        self.definition_journal.forget_cube(cube_name)
+        self.shared_measures.forget_cube(cube_name)
 
     def create_join(
         self,
@@ -614,6 +722,7 @@ class JavaApi(metaclass=ApiMetaClass):
         self.java_api.outsideTransactionApi().createReferences(
             table.name, other_table.name, jmapping
         )
+        self.definition_journal.record_join(table.name, other_table.name, mapping)
 
     def get_table_size(self, table: Table) -> int:
         """Get the size of the table on its current scenario."""
@@ -639,39 +748,89 @@ class JavaApi(metaclass=ApiMetaClass):
                 jcoordinates, self.gateway._gateway_client
             )
         self.java_api.deleteOnStoreBranch(table.name, scenario_name, jcoordinates_list)
+        self._increment_data_version()
+
+    @staticmethod
+    def _convert_java_table_rows(
+        java_rows: Any, *, types: Sequence[DataType]
+    ) -> List[List[Any]]:
+        """Convert the rows of a table cell by cell, with temporal values as ISO 8601 strings."""
+
+        def convert(value: Any, data_type: DataType) -> Any:
+            if value is None:
+                return None
+            if is_temporal(data_type):
+                # Drop the zone ID of zoned date times.
+                return str(value.toString()).split("[", 1)[0]
+            if is_array(data_type):
+                return to_python_list(value)
+            return value
+
+        return [
+            [
+                convert(value, data_type)
+                for value, data_type in zip(to_python_list(java_row), types)
+            ]
+            for java_row in to_python_list(java_rows)
+        ]
 
-    def get_table_dataframe(
+    def get_table_arrow(
         self,
         table: Table,
-        rows: int,
         *,
-        keys: Iterable[str],
-        scenario_name: Optional[str] = None,
-    ) -> pd.DataFrame:
-        """Return the first given rows of the table as a pandas DataFrame."""
-        dfrh = self.java_api.outsideTransactionApi().dataFrameRowsAndHeaders(
-            table.name, scenario_name, rows
-        )
+        columns: Sequence[str],
+        limit: Optional[int],
+        scenario_name: str,
+    ) -> pa.Table:  # type: ignore
+        """Return the first rows of the table on the given scenario as an Arrow table.
+
+        The server only gives the rows of a table so they are transferred at once as a JSON snapshot and then converted column by column.
+        """
+        api = self.java_api.outsideTransactionApi()
+        row_count = api.getStoreSize(table.name, scenario_name)
+        if limit is not None:
+            row_count = min(row_count, limit)
+        types = table._types
+        if row_count == 0:
+            return table_rows_to_arrow(
+                [], headers=list(types), types=types, columns=columns
+            )
 
+        dfrh = api.dataFrameRowsAndHeaders(table.name, scenario_name, row_count)
         headers = to_python_list(dfrh.getContentHeader())
-        content = to_python_list(dfrh.getContentRows())
-        dataframe = cast(
-            pd.DataFrame,
-            pd.DataFrame(data=content, columns=headers).apply(
-                pd.to_numeric, errors="ignore"
+        header_types = [types[header] for header in headers]
+        return self._convert_with_json_snapshot(
+            dfrh.getContentRows(),
+            # Arrays are snapshotted apart since their Java type differs from the other values.
+            kind="table_rows_with_arrays"
+            if any(is_array(data_type) for data_type in header_types)
+            else "table_rows",
+            from_json=lambda json_rows: table_rows_to_arrow(
+                json_rows, headers=headers, types=types, columns=columns
+            ),
+            from_java=lambda java_rows: table_rows_to_arrow(
+                self._convert_java_table_rows(java_rows, types=header_types),
+                headers=headers,
+                types=types,
+                columns=columns,
             ),
         )
 
-        for name, data_type in table._types.items():
-            if is_temporal(data_type):
-                dataframe[name] = dataframe[name].apply(to_date)
-            if is_array(data_type):
-                dataframe[name] = dataframe[name].apply(to_python_list)
-
-        if keys:
-            dataframe.set_index(keys, inplace=True)
-
-        return dataframe
+    @staticmethod
+    def _convert_from_json_levels(json_levels: Mapping[str, Any]) -> Dict[str, Level]:
+        """Convert from the JSON snapshot of java levels."""
+        levels = {}
+        for (name, json_level) in json_levels.items():
+            comparator_name = json_level["pythonExposedComparatorKey"]
+            levels[name] = Level(
+                name,
+                json_level["propertyName"],
+                _parse_detailed_type(json_level["type"]["detailType"]),
+                _comparator=ASCENDING
+                if comparator_name is None
+                else Comparator(comparator_name, json_level["firstMembers"]),
+            )
+        return levels
 
     @staticmethod
     def _convert_from_java_levels(jlevels: Any) -> Dict[str, Level]:
@@ -824,8 +983,15 @@ class JavaApi(metaclass=ApiMetaClass):
         java_hierarchies = self.java_api.outsideTransactionApi().retrieveHierarchies(
             cube.name
         )
-        python_hierarchies = self._convert_to_python_hierarchies(
-            cube, to_python_dict(java_hierarchies).values()
+        python_hierarchies = self._convert_with_json_snapshot(
+            java_hierarchies,
+            kind="hierarchies",
+            from_json=lambda json_hierarchies: self._convert_json_to_python_hierarchies(
+                cube, json_hierarchies.values()
+            ),
+            from_java=lambda java_hierarchies: self._convert_to_python_hierarchies(
+                cube, to_python_dict(java_hierarchies).values()
+            ),
         )
         for hierarchy in python_hierarchies:
             hierarchies[(hierarchy.dimension, hierarchy.name)] = hierarchy
@@ -844,21 +1010,25 @@ class JavaApi(metaclass=ApiMetaClass):
 
         return self._convert_to_python_hierarchies(cube, java_hierarchies)
 
-    def retrieve_hierarchy_for_level(
-        self,
-        level_name: str,
-        *,
-        cube: LocalCube[Any, Any, Any],
-        dimension_name: Optional[str],
-        hierarchy_name: Optional[str],
+    def _convert_json_to_python_hierarchies(
+        self, cube: LocalCube[Any, Any, Any], json_hierarchies: Iterable[Any]
     ) -> List[Hierarchy]:
-        """Retrieve the hierarchy containing a level with the given name."""
-        java_hierarchies = to_python_list(
-            self.java_api.outsideTransactionApi().retrieveHierarchyForLevel(
-                cube.name, dimension_name, hierarchy_name, level_name
+        """Convert the JSON snapshot of java hierarchies to python ones."""
+        hierarchies = []
+        for json_hierarchy in json_hierarchies:
+            hierarchy = Hierarchy(
+                json_hierarchy["name"],
+                JavaApi._convert_from_json_levels(json_hierarchy["levels"]),
+                json_hierarchy["dimensionName"],
+                json_hierarchy["slicing"],
+                cube,
+                self,
+                json_hierarchy["visible"],
             )
-        )
-        return self._convert_to_python_hierarchies(cube, java_hierarchies)
+            for level in hierarchy.levels.values():
+                level._hierarchy = hierarchy
+            hierarchies.append(hierarchy)
+        return hierarchies
 
     def _convert_to_python_hierarchies(
         self, cube: LocalCube[Any, Any, Any], java_hierarchies: Any
@@ -939,17 +1109,34 @@ class JavaApi(metaclass=ApiMetaClass):
     ) -> Dict[str, JavaApi.JavaMeasureDescription]:
         """Retrieve the list of the cube's measures, including their required levels."""
         java_measures = self.java_api.outsideTransactionApi().getFullMeasures(cube.name)
-        measures = to_python_list(java_measures)
-        final_measures: Dict[str, JavaApi.JavaMeasureDescription] = {}
-        for measure in measures:
-            final_measures[measure.getName()] = JavaApi.JavaMeasureDescription(
-                measure.getFolder(),
-                measure.getFormatter(),
-                measure.isVisible(),
-                _parse_detailed_type(measure.getType()),
-                measure.getDescription(),
-            )
-        return final_measures
+
+        def from_java(java_measures: Any) -> Dict[str, JavaApi.JavaMeasureDescription]:
+            final_measures: Dict[str, JavaApi.JavaMeasureDescription] = {}
+            for measure in to_python_list(java_measures):
+                final_measures[measure.getName()] = JavaApi.JavaMeasureDescription(
+                    measure.getFolder(),
+                    measure.getFormatter(),
+                    measure.isVisible(),
+                    _parse_detailed_type(measure.getType()),
+                    measure.getDescription(),
+                )
+            return final_measures
+
+        return self._convert_with_json_snapshot(
+            java_measures,
+            kind="measures",
+            from_json=lambda json_measures: {
+                measure["name"]: JavaApi.JavaMeasureDescription(
+                    measure["folder"],
+                    measure["formatter"],
+                    measure["visible"],
+                    _parse_detailed_type(measure["type"]),
+                    measure["description"],
+                )
+                for measure in json_measures
+            },
+            from_java=from_java,
+        )
 
     def get_measure(
         self, cube: LocalCube[Any, Any, Any], measure_name: str
@@ -1035,13 +1222,69 @@ class JavaApi(metaclass=ApiMetaClass):
         }
         return QueryPlan(infos=infos, retrievals=retrievals, dependencies=dependencies)
 
+    @staticmethod
+    def _create_query_plan_from_json(json_plan: Mapping[str, Any]) -> QueryPlan:
+        """Create a query plan from the JSON snapshot of a Java one."""
+        json_infos = json_plan["planInfo"]
+        infos = {
+            "ActivePivot": {
+                "Type": json_infos["pivotType"],
+                "Id": json_infos["pivotId"],
+                "Branch": json_infos["branch"],
+                "Epoch": json_infos["epoch"],
+            },
+            "Cube filters": {
+                query_filter["id"]: query_filter["description"]
+                for query_filter in json_plan["queryFilters"]
+            },
+            "Continuous": json_infos["continuous"],
+            "Range sharing": json_infos["rangeSharing"],
+            "Missed prefetches": json_infos["missedPrefetchBehavior"],
+            "Cache": json_infos["aggregatesCache"],
+            "Global timings (ms)": json_infos["globalTimings"],
+        }
+        retrievals = [
+            RetrievalData(
+                id=retrieval["retrievalId"],
+                retrieval_type=retrieval["type"],
+                location=", ".join(
+                    [
+                        f"{location['dimension']}@{location['hierarchy']}@"
+                        + "\\".join(location["level"])
+                        + ": "
+                        + "\\".join(str(member) for member in location["path"])
+                        for location in retrieval["location"]
+                    ]
+                ),
+                filter_id=retrieval["filterId"],
+                measures=retrieval["measures"],
+                start_times=retrieval["timingInfo"].get("startTime", []),
+                elapsed_times=retrieval["timingInfo"].get("elapsedTime", []),
+                result_size=retrieval["resultSize"],
+                retrieval_filter=str(retrieval["filterId"]),
+                partitioning=retrieval["partitioning"],
+                measures_provider=retrieval["measureProvider"],
+            )
+            for retrieval in json_plan["aggregateRetrievals"]
+        ]
+        # JSON object keys are always strings but retrieval IDs are integers.
+        dependencies = {
+            int(key): item for key, item in json_plan["dependencies"].items()
+        }
+        return QueryPlan(infos=infos, retrievals=retrievals, dependencies=dependencies)
+
     def analyse_mdx(self, mdx: str, timeout: int) -> QueryAnalysis:
         """Analyse an MDX query on a given cube."""
         jplans = to_python_list(
             self.java_api.outsideTransactionApi().analyseMdx(mdx, timeout)
         )
         plans = [
-            JavaApi.create_query_plan(jplan)
+            self._convert_with_json_snapshot(
+                jplan,
+                kind="query plan",
+                from_json=JavaApi._create_query_plan_from_json,
+                from_java=JavaApi.create_query_plan,
+            )
             for jplan in jplans
             if jplan.getPlanInfo().getClass().getSimpleName() == "PlanInfoData"
         ]
@@ -1090,26 +1333,36 @@ class JavaApi(metaclass=ApiMetaClass):
         output_type: DataType,
         plugin_key: str,
     ) -> None:
-        """Register a new user defined aggregation function."""
-        java_output_type = self._get_java_type(output_type)
-        java_buffer_types = self._create_java_types_list(buffer_types)
-        java_imports = ListConverter().convert(
-            additional_imports, self.gateway._gateway_client
-        )
-        java_methods = ListConverter().convert(
-            additional_methods, self.gateway._gateway_client
-        )
-        self.java_api.outsideTransactionApi().registerUserDefinedAggregateFunction(
-            contribute_source_code,
-            decontribute_source_code,
-            merge_source_code,
-            terminate_source_code,
-            java_buffer_types,
-            java_output_type,
-            plugin_key,
-            java_imports,
-            java_methods,
-        )
+        """Register a new user defined aggregation function.
+
+        Registering a plugin key a second time is a no-op.
+        """
+        with self._registered_aggregation_functions_lock:
+            if plugin_key in self._registered_aggregation_functions:
+                return
+            java_output_type = self._get_java_type(output_type)
+            java_buffer_types = self._create_java_types_list(buffer_types)
+            java_imports = ListConverter().convert(
+                additional_imports, self.gateway._gateway_client
+            )
+            java_methods = ListConverter().convert(
+                additional_methods, self.gateway._gateway_client
+            )
+            self.java_api.outsideTransactionApi().registerUserDefinedAggregateFunction(
+                contribute_source_code,
+                decontribute_source_code,
+                merge_source_code,
+                terminate_source_code,
+                java_buffer_types,
+                java_output_type,
+                plugin_key,
+                java_imports,
+                java_methods,
+            )
+            self._registered_aggregation_functions.add(plugin_key)
+
+    def is_aggregation_function_registered(self, plugin_key: str) -> bool:
+        return plugin_key in self._registered_aggregation_functions
 
     def levels_to_descriptions(self, arg: Any) -> Any:
         """Recursively convert levels and hierarchies to their java descriptions."""
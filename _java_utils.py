@@ -1,17 +1,32 @@
+import hashlib
 import json
+import logging
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from subprocess import STDOUT, CalledProcessError, check_output  # nosec
-from typing import Tuple
+from tempfile import NamedTemporaryFile
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 from ._compatibility import check_java_version
+from ._os_utils import get_env_flag
+from ._path_utils import get_atoti_home
 
 _ATOTI_JAVA_HOME_ENVIRONMENT_VARIABLE = "ATOTI_JAVA_HOME"
 _JAVA_HOME_ENVIRONMENT_VARIABLE = "JAVA_HOME"
 
 JAR_PATH = Path(__file__).parent / "data" / "atoti.jar"
 
+DISABLE_JAR_INFO_CACHE_ENV_VAR = "ATOTI_DISABLE_JAR_INFO_CACHE"
+
+LICENSE_ENV_VAR = "ATOTI_LICENSE"
+"""Environment variable holding the license key, or the path to the license file, read by the JAR."""
+
+LICENSE_EXPIRY_WARNING_DAYS = 7
+
+_LOGGER = logging.getLogger("atoti.java")
+
 
 def get_java_path(*, executable_name: str = "java") -> Path:
     """Get the path to the Java executable.
@@ -43,10 +58,90 @@ def get_java_path(*, executable_name: str = "java") -> Path:
         return java_path
 
 
-def retrieve_info_from_jar() -> Tuple[datetime, bool]:
-    """Retrieve info from the embedded JAR."""
-    java_path = get_java_path()
-    check_java_version((11,), java_path=java_path)
+def get_files_digest(
+    paths: Iterable[Path], *, extra_values: Iterable[str] = ()
+) -> Optional[str]:
+    """Return a digest changing when one of the files is replaced or modified, or ``None`` if one of them cannot be read.
+
+    The digest also changes with the given extra values.
+    """
+    try:
+        key = [
+            [str(path), stat.st_size, stat.st_mtime_ns]
+            for path, stat in ((path, path.stat()) for path in paths)
+        ]
+    except OSError:
+        return None
+    key.append(list(extra_values))
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()[:32]
+
+
+def get_resolved_java_path(java_path: Path) -> Optional[Path]:
+    resolved_java_path = shutil.which(str(java_path))
+    return None if resolved_java_path is None else Path(resolved_java_path).resolve()
+
+
+def _get_license_paths() -> List[Path]:
+    license_value = os.environ.get(LICENSE_ENV_VAR)
+    if not license_value:
+        return []
+    try:
+        license_path = Path(license_value)
+        return [license_path.resolve()] if license_path.is_file() else []
+    except (OSError, ValueError):
+        # The value is a license key rather than a path.
+        return []
+
+
+def _get_jar_info_cache_path(java_path: Path) -> Optional[Path]:
+    """Return the path of the cached JAR info, specific to the JAR, the Java installation used to read it, and the license configuration.
+
+    The Java installation is identified by its resolved executable rather than by running ``java -version`` since that would start a JVM too.
+    """
+    resolved_java_path = get_resolved_java_path(java_path)
+    if resolved_java_path is None:
+        return None
+    digest = get_files_digest(
+        [JAR_PATH.resolve(), resolved_java_path, *_get_license_paths()],
+        extra_values=[os.environ.get(LICENSE_ENV_VAR, "")],
+    )
+    if digest is None:
+        return None
+    return get_atoti_home() / "cache" / "jar_info" / f"{digest}.json"
+
+
+def _parse_jar_info(info: Mapping[str, Any]) -> Tuple[datetime, bool]:
+    return (
+        datetime.fromtimestamp(int(info["licenseEndDate"]) / 1000),
+        bool(info["isCommunityLicense"]),
+    )
+
+
+def _read_cached_jar_info(cache_path: Path) -> Optional[Tuple[datetime, bool]]:
+    try:
+        return _parse_jar_info(json.loads(cache_path.read_text(encoding="utf8")))
+    except FileNotFoundError:
+        return None
+    except (KeyError, OSError, TypeError, ValueError):
+        _LOGGER.debug("Ignoring invalid cached JAR info %s.", cache_path, exc_info=True)
+        return None
+
+
+def _write_cached_jar_info(cache_path: Path, info: Mapping[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so that concurrent processes never read a partial file.
+        with NamedTemporaryFile(
+            "w", dir=cache_path.parent, delete=False, encoding="utf8", suffix=".tmp"
+        ) as file:
+            json.dump(info, file)
+        os.replace(file.name, cache_path)
+    except OSError:
+        _LOGGER.debug("Could not cache JAR info %s.", cache_path, exc_info=True)
+
+
+def _probe_jar_info(java_path: Path) -> Mapping[str, Any]:
+    java_version = check_java_version((11,), java_path=java_path)
 
     try:
         output = check_output(
@@ -57,11 +152,41 @@ def retrieve_info_from_jar() -> Tuple[datetime, bool]:
 
     try:
         info = json.loads(output.strip().splitlines()[-1])
-        return (
-            datetime.fromtimestamp(int(info["licenseEndDate"]) / 1000),
-            info["isCommunityLicense"],
-        )
+        _parse_jar_info(info)
     except Exception as error:
         raise RuntimeError(
             f"Could not process JAR info from output:\n{output}"
         ) from error
+    return {
+        "licenseEndDate": info["licenseEndDate"],
+        "isCommunityLicense": info["isCommunityLicense"],
+        "javaVersion": list(java_version),
+    }
+
+
+def retrieve_info_from_jar() -> Tuple[datetime, bool]:
+    """Retrieve info from the embedded JAR.
+
+    Reading it requires starting a JVM so the result is cached in the atoti home directory until the JAR, the Java installation, or the license configuration changes.
+    The cache is not used when the license has expired or is about to.
+    """
+    java_path = get_java_path()
+    cache_path = (
+        None
+        if get_env_flag(DISABLE_JAR_INFO_CACHE_ENV_VAR)
+        else _get_jar_info_cache_path(java_path)
+    )
+
+    if cache_path is not None:
+        cached_info = _read_cached_jar_info(cache_path)
+        # A license about to expire may have been renewed so the JAR is read again.
+        if (
+            cached_info is not None
+            and (cached_info[0] - datetime.now()).days > LICENSE_EXPIRY_WARNING_DAYS
+        ):
+            return cached_info
+
+    info = _probe_jar_info(java_path)
+    if cache_path is not None:
+        _write_cached_jar_info(cache_path, info)
+    return _parse_jar_info(info)
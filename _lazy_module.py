@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from functools import reduce
+from types import ModuleType
+from typing import Any, Callable, List, Mapping, Optional, Set
+
+from ._api_utils import is_private_element
+
+AttributeLoader = Callable[[], Any]
+InstrumentAttribute = Callable[[ModuleType, str], None]
+
+
+def lazy_import(
+    module_name: str, attribute_path: Optional[str] = None
+) -> AttributeLoader:
+    """Return a loader importing the module and, if given, returning its attribute at the dotted path."""
+
+    def load() -> Any:
+        module = importlib.import_module(module_name)
+        if attribute_path is None:
+            return module
+        return reduce(getattr, attribute_path.split("."), module)
+
+    return load
+
+
+def _is_package_initializing(package_name: str) -> bool:
+    """Whether a module of the package is still being executed, meaning the current import is nested in another one."""
+    prefix = f"{package_name}."
+    return any(
+        # Set by importlib while the module is executed.
+        getattr(getattr(module, "__spec__", None), "_initializing", False)
+        for name, module in list(sys.modules.items())
+        if name.startswith(prefix)
+    )
+
+
+class LazyModule(ModuleType):
+    """Module loading its attributes on first access.
+
+    Lazy attributes are instrumented (e.g. to add type checking) when they are loaded.
+    Public submodules imported directly (e.g. ``import atoti.agg``) are instrumented too, once the import that triggered them is done.
+    This way, internal modules importing each other keep referencing the original functions, like when the whole API was instrumented at once.
+    """
+
+    _lazy_attributes: Mapping[str, AttributeLoader]
+    _instrumenters: List[InstrumentAttribute]
+    _instrumentation_started: bool
+    _pending_attribute_names: List[str]
+    _instrumented_attribute_names: Set[str]
+
+    @classmethod
+    def install(
+        cls, module_name: str, *, lazy_attributes: Mapping[str, AttributeLoader]
+    ) -> LazyModule:
+        """Turn the already imported module into a lazy one."""
+        module = sys.modules[module_name]
+        module.__class__ = cls
+        assert isinstance(module, cls)
+        object.__setattr__(module, "_lazy_attributes", lazy_attributes)
+        object.__setattr__(module, "_instrumenters", [])
+        object.__setattr__(module, "_instrumentation_started", False)
+        object.__setattr__(module, "_pending_attribute_names", [])
+        object.__setattr__(module, "_instrumented_attribute_names", set())
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        load = self.__dict__.get("_lazy_attributes", {}).get(name)
+        if load is None:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        value = load()
+        setattr(self, name, value)
+        # The loaded value might have been wrapped by the instrumentation.
+        return self.__dict__[name]
+
+    def __dir__(self) -> List[str]:
+        # Lazy attributes are listed before being loaded so that they can be autocompleted.
+        return sorted({*super().__dir__(), *self.__dict__.get("_lazy_attributes", {})})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        is_public_submodule = (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and not is_private_element(name)
+        )
+        if (
+            not (name in self._lazy_attributes or is_public_submodule)
+            # The instrumentation replaces the attributes it wraps.
+            or name in self._instrumented_attribute_names
+        ):
+            return
+        self._pending_attribute_names.append(name)
+        if self._instrumentation_started and not _is_package_initializing(
+            self.__name__
+        ):
+            self._instrument_pending_attributes()
+
+    def _instrument_pending_attributes(self) -> None:
+        while self._pending_attribute_names:
+            name = self._pending_attribute_names.pop(0)
+            if name not in self._instrumented_attribute_names:
+                self._instrumented_attribute_names.add(name)
+                for instrument_attribute in self._instrumenters:
+                    instrument_attribute(self, name)
+
+    def start_instrumentation(self, instrument_attribute: InstrumentAttribute) -> None:
+        """Instrument the public attributes loaded so far and the ones loaded from now on."""
+        object.__setattr__(self, "_instrumentation_started", True)
+        self.add_instrumenter(instrument_attribute)
+
+    def add_instrumenter(self, instrument_attribute: InstrumentAttribute) -> None:
+        """Apply an additional instrumentation to the attributes already instrumented and to the ones loaded from now on."""
+        self._instrumenters.append(instrument_attribute)
+        for name in sorted(self._instrumented_attribute_names):
+            instrument_attribute(self, name)
+        if self._instrumentation_started:
+            self._instrument_pending_attributes()
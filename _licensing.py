@@ -3,10 +3,12 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 from typing import List
 
+from ._java_utils import LICENSE_EXPIRY_WARNING_DAYS, retrieve_info_from_jar
 from ._os_utils import get_env_flag
 from ._path_utils import get_atoti_home
 from ._telemetry import DISABLE_TELEMETRY_ENV_VAR
@@ -125,7 +127,7 @@ def _monitor_license_expiry(
         )
     else:
         remaining_days = (end_date - now).days
-        if remaining_days <= 7:
+        if remaining_days <= LICENSE_EXPIRY_WARNING_DAYS:
             outputs.append(
                 Output(
                     dedent(
@@ -158,3 +160,12 @@ def check_license(end_date: datetime, is_community_license: bool):
             print(output.content)
         elif output.output_type == OutputType.WARNING:
             logging.getLogger("atoti.licensing").warning(output.content)
+
+
+@lru_cache()
+def check_jar_license() -> None:
+    """Check the license of the embedded JAR.
+
+    This is done when the first local session is created rather than on import since reading the license starts a JVM.
+    """
+    check_license(*retrieve_info_from_jar())
@@ -7,21 +7,37 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    Mapping,
     Optional,
+    Sequence,
     Tuple,
     TypeVar,
     Union,
 )
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 from typing_extensions import Literal
 
-from ._arrow import arrow_to_pandas, run_raw_arrow_query
+from ._arrow import (
+    arrow_to_numpy,
+    arrow_to_pandas,
+    rename_level_columns,
+    run_raw_arrow_query,
+)
 from ._base._base_cube import BaseCube
 from ._base._base_level import BaseLevel
 from ._bitwise_operators_only import IdentityElement
-from ._docs_utils import EXPLAIN_QUERY_DOC, QUERY_DOC, doc, get_query_args_doc
+from ._cube_metadata_cache import CubeMetadataCache
+from ._docs_utils import (
+    DRILLTHROUGH_DOC,
+    EXPLAIN_QUERY_DOC,
+    QUERY_DOC,
+    doc,
+    get_query_args_doc,
+)
 from ._hierarchy_isin_conditions import HierarchyIsInCondition
 from ._java_api import JavaApi
 from ._level_conditions import LevelCondition
@@ -30,7 +46,11 @@ from ._local_hierarchies import LocalHierarchies
 from ._local_measures import LocalMeasures
 from ._multi_condition import MultiCondition
 from ._query_plan import QueryAnalysis
-from ._scenario_utils import BASE_SCENARIO_NAME
+from ._scenario_utils import (
+    BASE_SCENARIO_NAME,
+    get_scenario_names_to_query,
+    keep_cells_different_from_base,
+)
 from ._type_utils import typecheck
 from .aggregates_cache import AggregatesCache
 from .experimental._distributed.levels import DistributedLevels
@@ -41,9 +61,11 @@ from .query.cube import _decombine_condition
 from .query.level import QueryLevel
 from .query.measure import QueryMeasure
 from .query.query_result import QueryResult
+from .query.query_timings import QueryTimings, _Stopwatch
 
 if TYPE_CHECKING:
     from ._local_session import LocalSession
+    from .type import DataType
 
 _Level = TypeVar("_Level", bound=BaseLevel)
 _Levels = TypeVar("_Levels", Levels, DistributedLevels)
@@ -92,6 +114,28 @@ _QUERY_ARGS_WITH_MODE_DOC = f"""{get_query_args_doc(is_query_session=False)}
                           Continent  Price.SUM
                         0    Europe      470.0
                         1   America      510.0
+
+            output: The type of the returned result:
+
+              * ``"pandas"`` returns a pandas DataFrame as described above.
+              * ``"arrow"`` returns a :class:`pyarrow.Table`.
+              * ``"numpy"`` returns a dict mapping each column name to a NumPy array.
+
+              ``"arrow"`` and ``"numpy"`` can only be used in ``"raw"`` mode.
+              They skip the conversion to pandas, saving a copy of the result and reducing the peak memory usage.
+              Level columns are named after their level like in the DataFrame.
+
+              Example:
+
+                  .. doctest:: query
+
+                      >>> cube.query(
+                      ...     m["Price.SUM"],
+                      ...     levels=[l["Continent"]],
+                      ...     mode="raw",
+                      ...     output="numpy",
+                      ... )
+                      {'Continent': array(['Europe', 'America'], dtype=object), 'Price.SUM': array([470., 510.])}
 """
 
 
@@ -122,6 +166,10 @@ class LocalCube(BaseCube[_LocalHierarchies, _Levels, _LocalMeasures]):
         """Name of the cube."""
         return self._name
 
+    @property
+    def _metadata_cache(self) -> CubeMetadataCache:
+        return self._session._get_cube_metadata_cache(self.name)
+
     @property
     def hierarchies(self) -> _LocalHierarchies:
         """Hierarchies of the cube."""
@@ -160,40 +208,71 @@ class LocalCube(BaseCube[_LocalHierarchies, _Levels, _LocalMeasures]):
                 HierarchyIsInCondition,
             ]
         ] = None,
+        diff_against_base: bool = False,
         include_totals: bool = False,
         levels: Iterable[_Level] = (),
         mode: Literal["pretty", "raw"] = "pretty",
+        output: Literal["pandas", "arrow", "numpy"] = "pandas",
         scenario: str = BASE_SCENARIO_NAME,
+        scenarios: Optional[Sequence[str]] = None,
         timeout: int = 30,
-    ) -> Union[QueryResult, pd.DataFrame]:
+    ) -> Union[QueryResult, pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
+        scenario_names = get_scenario_names_to_query(
+            scenario=scenario,
+            scenarios=scenarios,
+            diff_against_base=diff_against_base,
+        )
+
         if mode == "pretty":
+            if output != "pandas":
+                raise ValueError(
+                    f"""The "{output}" output can only be used in "raw" mode."""
+                )
+
+            stopwatch = _Stopwatch()
             mdx = self._generate_mdx(
                 condition=condition,
                 include_totals=include_totals,
                 levels=levels,
                 measures=measures,
                 scenario_name=scenario,
+                scenario_names=scenario_names,
             )
             query_result = self._session.query_mdx(
-                mdx, keep_totals=include_totals, timeout=timeout
+                mdx,
+                keep_totals=include_totals,
+                timeout=timeout,
+                timings=QueryTimings(mdx_generation=stopwatch.lap()),
             )
+            if diff_against_base:
+                return keep_cells_different_from_base(query_result)
             return query_result
 
         if include_totals:
             raise ValueError("""Totals cannot be included in "raw" mode.""")
 
+        if scenario_names:
+            # The Arrow endpoint only supports querying a single branch.
+            raise ValueError("""Several scenarios cannot be queried in "raw" mode.""")
+
         # Raw query
-        # Note: Converting to pandas is fast for small tables (<100K) but can take several seconds for large datasets
-        return arrow_to_pandas(
-            self._query_as_arrow(
-                condition=condition,
-                levels=levels,
-                measures=measures,
-                scenario_name=scenario,
-                timeout=timeout,
-            )
+        table = self._query_as_arrow(
+            condition=condition,
+            levels=levels,
+            measures=measures,
+            scenario_name=scenario,
+            timeout=timeout,
         )
 
+        if output == "arrow":
+            return rename_level_columns(table)
+
+        if output == "numpy":
+            return arrow_to_numpy(table)
+
+        # Note: Converting to pandas is fast for small tables (<100K) but can take several seconds for large datasets
+        return arrow_to_pandas(table)
+
     def _query_as_arrow(
         self,
         *,
@@ -223,6 +302,52 @@ class LocalCube(BaseCube[_LocalHierarchies, _Levels, _LocalMeasures]):
             session=self._session._open_transient_query_session(),
         )
 
+    @doc(DRILLTHROUGH_DOC)
+    def drillthrough(
+        self,
+        *,
+        batch_size: int = 10_000,
+        columns: Optional[Sequence[str]] = None,
+        condition: Optional[
+            Union[
+                LevelCondition,
+                MultiCondition,
+                LevelIsInCondition,
+                HierarchyIsInCondition,
+            ]
+        ] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        scenario: str = BASE_SCENARIO_NAME,
+        timeout: int = 30,
+    ) -> Iterator[pa.RecordBatch]:  # type: ignore
+        return (
+            self._session._open_transient_query_session()
+            .cubes[self.name]
+            .drillthrough(
+                batch_size=batch_size,
+                columns=columns,
+                condition=condition,
+                limit=limit,
+                offset=offset,
+                scenario=scenario,
+                timeout=timeout,
+                # Typing the columns up front gives the same schema to all the batches.
+                column_types={
+                    **self._get_table_column_types(),
+                    **{
+                        measure.name: measure.data_type
+                        for measure in self.measures.values()
+                    },
+                    **{level.name: level.data_type for level in self.levels.values()},
+                },
+            )
+        )
+
+    def _get_table_column_types(self) -> Mapping[str, DataType]:
+        """Return the types of the columns of the tables the facts of the cube come from."""
+        return {}
+
     @doc(EXPLAIN_QUERY_DOC, corresponding_method="query")
     def explain_query(
         self,
@@ -264,6 +389,7 @@ class LocalCube(BaseCube[_LocalHierarchies, _Levels, _LocalMeasures]):
         levels: Iterable[_Level],
         measures: Iterable[_Measure],
         scenario_name: str,
+        scenario_names: Sequence[str] = (),
     ) -> str:
         query_measures = [
             QueryMeasure(
@@ -287,6 +413,7 @@ class LocalCube(BaseCube[_LocalHierarchies, _Levels, _LocalMeasures]):
                 levels=query_levels,
                 measures=query_measures,
                 scenario_name=scenario_name,
+                scenario_names=scenario_names,
             )
         )
 
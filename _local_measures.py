@@ -4,12 +4,13 @@ from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, TypeVar
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from atoti.query.measure import QueryMeasure
 
 from ._base._base_measures import BaseMeasures
 from ._mappings import DelegateMutableMapping
+from ._type_utils import typecheck
 from .measure import Measure
 
 if TYPE_CHECKING:
@@ -29,12 +30,12 @@ class LocalMeasures(DelegateMutableMapping[str, _Measure], BaseMeasures[_Measure
     def _get_underlying(self) -> Dict[str, _Measure]:
         """Fetch the measures from the JVM each time they are needed."""
 
-    @typechecked
+    @typecheck
     @abstractmethod
     def __getitem__(self, key: str) -> _Measure:
         """Return the measure with the given name."""
 
-    @typechecked
+    @typecheck
     @abstractmethod
     def __delitem__(self, key: str) -> None:
         """Delete a measure.
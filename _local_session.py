@@ -6,28 +6,40 @@ from datetime import timedelta
 from pathlib import Path
 from subprocess import STDOUT, CalledProcessError, check_output  # nosec
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 from py4j.java_gateway import DEFAULT_PORT as _PY4J_DEFAULT_PORT
 from typing_extensions import Literal
 
 from ._base._base_session import BaseSession
+from ._cube_metadata_cache import CubeMetadataCache
 from ._deprecation import deprecated
 from ._docs_utils import EXPLAIN_QUERY_DOC, doc
 from ._endpoint import EndpointHandler
 from ._java_api import JavaApi
 from ._java_utils import get_java_path
+from ._licensing import check_jar_license
 from ._local_cube import LocalCube
 from ._local_cubes import LocalCubes
 from ._path_utils import PathLike, to_absolute_path
 from ._plugins import MissingPluginError, get_active_plugins
 from ._query_plan import QueryAnalysis
-from ._server_subprocess import ServerSubprocess
+from ._server_pool import create_server_subprocess
 from ._type_utils import typecheck
 from .client_side_encryption import ClientSideEncryption
 from .config import SessionConfig
 from .exceptions import AtotiException, AtotiJavaException
-from .query._cellset import GetLevelDataTypes
+from .query._cellset import GetLevelDataTypes, GetMemberDictionary
 from .query.query_result import QueryResult
 from .query.session import _get_query_mdx_doc
 
@@ -54,6 +66,10 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
         super().__init__()
         self._name = name
         self._config = config
+        self._cube_metadata_caches: Dict[str, CubeMetadataCache] = {}
+        self._endpoint_handlers: List[EndpointHandler] = []
+
+        check_jar_license()
 
         self._create_subprocess_and_java_api(
             detached_process=detached_process, distributed=distributed
@@ -87,7 +103,7 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
                 py4j_java_port,
             )
         else:
-            self._server_subprocess = ServerSubprocess(config=self._config)
+            self._server_subprocess = create_server_subprocess(config=self._config)
             py4j_java_port = self._server_subprocess.py4j_java_port
 
         self._java_api: JavaApi = JavaApi(
@@ -166,6 +182,8 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
 
     def close(self) -> None:
         """Close this session and free all the associated resources."""
+        for endpoint_handler in self._endpoint_handlers:
+            endpoint_handler.close()
         self._java_api.shutdown()
         if self._server_subprocess:
             self.wait()
@@ -192,22 +210,50 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
         auth: Optional[QueryAuth] = (lambda _url: headers) if headers else None
         return QuerySession(f"http://localhost:{self.port}", auth=auth, name=self.name)
 
+    def _get_cube_metadata_cache(self, cube_name: str) -> CubeMetadataCache:
+        cube_metadata_cache = self._cube_metadata_caches.get(cube_name)
+        if cube_metadata_cache is None:
+            cube_metadata_cache = CubeMetadataCache(
+                fetch_level_data_types=lambda levels_coordinates: self.cubes[
+                    cube_name
+                ]._get_level_data_types(levels_coordinates),
+                get_data_version=lambda: self._java_api.data_version,
+                get_structure_version=lambda: self._java_api.structure_version,
+            )
+            # Keep the cache created by another thread meanwhile, if any.
+            cube_metadata_cache = self._cube_metadata_caches.setdefault(
+                cube_name, cube_metadata_cache
+            )
+        return cube_metadata_cache
+
     @doc(_get_query_mdx_doc(is_query_session=False))
     def query_mdx(
-        self, mdx: str, *, keep_totals: bool = False, timeout: int = 30
+        self,
+        mdx: str,
+        *,
+        keep_totals: bool = False,
+        timeout: int = 30,
+        **kwargs: Any,
     ) -> QueryResult:
         get_level_data_types: GetLevelDataTypes = (
-            lambda cube_name, levels_coordinates: self.cubes[
+            lambda cube_name, levels_coordinates: self._get_cube_metadata_cache(
                 cube_name
-            ]._get_level_data_types(levels_coordinates)
+            ).get_level_data_types(levels_coordinates)
+        )
+        get_member_dictionary: GetMemberDictionary = (
+            lambda cube_name, level_coordinates: self._get_cube_metadata_cache(
+                cube_name
+            ).get_member_dictionary(level_coordinates)
         )
 
         return self._open_transient_query_session().query_mdx(
             mdx,
             get_level_data_types=get_level_data_types,
+            get_member_dictionary=get_member_dictionary,
             keep_totals=keep_totals,
             timeout=timeout,
             session=self,
+            **kwargs,
         )
 
     @doc(EXPLAIN_QUERY_DOC, corresponding_method="query_mdx")
@@ -219,7 +265,11 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
         return {"Authorization": f"Jwt {self._java_api.generate_jwt()}"}
 
     def endpoint(
-        self, route: str, *, method: Literal["POST", "GET", "PUT", "DELETE"] = "GET"
+        self,
+        route: str,
+        *,
+        method: Literal["POST", "GET", "PUT", "DELETE"] = "GET",
+        max_workers: Optional[int] = None,
     ) -> Any:
         """Create a custom endpoint at ``/atoti/pyapi/{route}"``.
 
@@ -228,6 +278,14 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
         Since custom endpoints are exposed by atoti's server, they automatically inherit from the configured :attr:`atoti.config.session_config.SessionConfig.authentication` and :attr:`atoti.config.session_config.SessionConfig.https` parameters.
 
         The decorated function must take three parameters with types :class:`~atoti.pyapi.user.User`, :class:`~atoti.pyapi.http_request.HttpRequest`, and :class:`~atoti.session.Session` and return a response body as a Python data structure that can be converted to JSON.
+        pandas DataFrames and Arrow tables can be returned too: they are converted to a list of records.
+        If `orjson <https://github.com/ijl/orjson>`__ is installed, it is used to encode the responses and decode the request bodies.
+
+        Requests are handled concurrently, each one on its own server thread until the response is returned.
+        The decorated function can also be a coroutine function (``async def``).
+        It then runs on an event loop shared by all the endpoints, which brings no extra concurrency: each request still holds its server thread.
+        Coroutine functions must not block since it would stall all the coroutine endpoints.
+        Calls to the session are blocking and must be offloaded, for instance with ``await asyncio.get_running_loop().run_in_executor(None, lambda: len(session.tables["Quantity"]))``.
 
         Args:
             route: The path suffix after ``/atoti/pyapi/``.
@@ -237,6 +295,10 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
                 Path parameters can be configured by wrapping their name in curly braces in the route.
             method: The HTTP method the request must be using to trigger this endpoint.
                 ``DELETE``, ``POST``, and ``PUT`` requests can have a body but it must be JSON.
+            max_workers: The maximum number of requests to this endpoint handled at once.
+                If not ``None``, the decorated function runs on a pool of this many threads dedicated to the endpoint and the other requests wait for a thread to be free.
+                This only limits concurrency, for instance to protect a resource used by the endpoint: it does not add any since the server thread of each request waits for the pool.
+                Ignored for coroutine functions.
 
         Example:
             .. doctest:: Session.endpoint
@@ -291,11 +353,13 @@ class LocalSession(Generic[_LocalCubes], BaseSession[_LocalCubes]):
             )
 
         def endpoint_decorator(func: CallbackEndpoint) -> Callable:
+            handler = EndpointHandler(func, self, max_workers=max_workers)
             self._java_api.create_endpoint(
                 http_method=method,
                 route=route,
-                handler=EndpointHandler(func, self),
+                handler=handler,
             )
+            self._endpoint_handlers.append(handler)
             return func
 
         return endpoint_decorator
@@ -1,15 +1,24 @@
 import os
-from distutils.util import strtobool
+
+# Same values as `distutils.util.strtobool()` but without importing distutils, which is slow to import and deprecated.
+_TRUE_VALUES = {"y", "yes", "t", "true", "on", "1"}
+_FALSE_VALUES = {"n", "no", "f", "false", "off", "0"}
+
+
+def _strtobool(value: str) -> bool:
+    lowered_value = value.lower()
+    if lowered_value in _TRUE_VALUES:
+        return True
+    if lowered_value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
 
 
 def get_env_flag(variable_name: str) -> bool:
-    result = strtobool(
+    return _strtobool(
         os.environ.get(
             variable_name,
             # The default is not configurable because it's simpler if the absence of the flag is equivalent to it being false.
             default="False",
         )
     )
-    # strtobool's type annotations indicate that it returns a bool but it actually returns 0 or 1.
-    # Converting it to a real bool so that `is True` or `is False` can be used down the road.
-    return bool(result)
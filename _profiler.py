@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from typing_extensions import Literal
+
+from ._api_utils import (
+    ContainerType,
+    decorate,
+    get_container_full_name,
+    is_private_element,
+)
+
+IoCategory = Literal["py4j", "http"]
+
+# Private methods are not part of the API but accessing items is.
+_PROFILED_DUNDER_METHODS = {"__getitem__", "__setitem__", "__delitem__"}
+
+_NO_OP_CONTEXT: ContextManager[None] = nullcontext()
+
+
+@dataclass
+class CallerStats:
+    """Statistics of the calls made to an API function from a given caller."""
+
+    count: int = 0
+    primitive_count: int = 0
+    own_time: float = 0
+    total_time: float = 0
+
+
+@dataclass
+class CallStats:
+    """Statistics of the calls made to an API function."""
+
+    filename: str
+    line_number: int
+    count: int = 0
+    """Number of calls."""
+
+    primitive_count: int = 0
+    """Number of calls that were not nested in another call to the same function."""
+
+    total_time: float = 0
+    """Time spent in the function and the functions it called in seconds, not counting recursive calls twice."""
+
+    own_time: float = 0
+    """Time spent in the function but not in the other API functions it called in seconds."""
+
+    py4j_time: float = 0
+    """Part of the own time spent communicating with the JVM through py4j in seconds."""
+
+    http_time: float = 0
+    """Part of the own time spent in HTTP requests in seconds."""
+
+    histogram: Dict[int, int] = field(default_factory=dict)
+    """Number of calls per latency bucket, bucket ``n`` holding the calls lasting between ``2**n`` and ``2**(n+1)`` microseconds."""
+
+    callers: Dict[Optional[str], CallerStats] = field(default_factory=dict)
+    """Statistics of the calls per calling API function, ``None`` being the user code."""
+
+    @property
+    def python_time(self) -> float:
+        """Part of the own time spent in Python in seconds."""
+        return self.own_time - self.py4j_time - self.http_time
+
+    def get_percentile(self, percentile: float) -> float:
+        """Return an upper bound of the latency percentile in seconds, precise to a factor 2."""
+        threshold = self.count * percentile / 100
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= threshold:
+                return 2 ** (bucket + 1) / 1e6
+        return 0
+
+
+@dataclass
+class TraceEvent:
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread_id: int
+
+
+@dataclass
+class _Frame:
+    path: str
+    start: float
+    child_time: float = 0
+    io_depth: int = 0
+    io_times: Dict[str, float] = field(default_factory=dict)
+
+
+class Profiler:
+    """Record the calls to the API functions and the time spent in I/O during these calls."""
+
+    def __init__(self, *, max_trace_events: int):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._max_trace_events = max_trace_events
+        self.stats: Dict[str, CallStats] = {}
+        self.trace_events: List[TraceEvent] = []
+        self.origin = time.perf_counter()
+
+    def _get_stack(self) -> List[_Frame]:
+        stack: Optional[List[_Frame]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _add_trace_event(
+        self, name: str, *, category: str, start: float, duration: float
+    ) -> None:
+        if len(self.trace_events) < self._max_trace_events:
+            self.trace_events.append(
+                TraceEvent(
+                    name=name,
+                    category=category,
+                    start=start - self.origin,
+                    duration=duration,
+                    thread_id=threading.get_ident(),
+                )
+            )
+
+    def call(
+        self,
+        path: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        stack = self._get_stack()
+        frame = _Frame(path=path, start=time.perf_counter())
+        stack.append(frame)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            duration = end - frame.start
+            caller = stack[-1] if stack else None
+            if caller is not None:
+                caller.child_time += duration
+            self._record_call(
+                frame,
+                func,
+                duration=duration,
+                caller_path=None if caller is None else caller.path,
+                is_recursive=any(other.path == path for other in stack),
+            )
+
+    def _record_call(
+        self,
+        frame: _Frame,
+        func: Callable[..., Any],
+        *,
+        duration: float,
+        caller_path: Optional[str],
+        is_recursive: bool,
+    ) -> None:
+        own_time = duration - frame.child_time
+        with self._lock:
+            stats = self.stats.get(frame.path)
+            if stats is None:
+                code = getattr(inspect.unwrap(func), "__code__", None)
+                stats = CallStats(
+                    filename=code.co_filename if code else "~",
+                    line_number=code.co_firstlineno if code else 0,
+                )
+                self.stats[frame.path] = stats
+            stats.count += 1
+            stats.own_time += own_time
+            stats.py4j_time += frame.io_times.get("py4j", 0)
+            stats.http_time += frame.io_times.get("http", 0)
+            if not is_recursive:
+                stats.primitive_count += 1
+                stats.total_time += duration
+            bucket = math.floor(math.log2(max(duration * 1e6, 1)))
+            stats.histogram[bucket] = stats.histogram.get(bucket, 0) + 1
+            caller_stats = stats.callers.setdefault(caller_path, CallerStats())
+            caller_stats.count += 1
+            caller_stats.own_time += own_time
+            if not is_recursive:
+                caller_stats.primitive_count += 1
+                caller_stats.total_time += duration
+            self._add_trace_event(
+                frame.path, category="api", start=frame.start, duration=duration
+            )
+
+    @contextmanager
+    def io_span(self, category: IoCategory, name: str) -> Iterator[None]:
+        stack = self._get_stack()
+        frame = stack[-1] if stack else None
+        if frame is not None:
+            frame.io_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if frame is not None:
+                frame.io_depth -= 1
+                # Nested spans, such as JavaApi methods calling each other, are already counted.
+                if frame.io_depth == 0:
+                    frame.io_times[category] = (
+                        frame.io_times.get(category, 0) + duration
+                    )
+            with self._lock:
+                self._add_trace_event(
+                    name, category=category, start=start, duration=duration
+                )
+
+
+_ACTIVE_PROFILER: Optional[Profiler] = None
+
+
+def get_active_profiler() -> Optional[Profiler]:
+    return _ACTIVE_PROFILER
+
+
+def set_active_profiler(profiler: Optional[Profiler]) -> None:
+    global _ACTIVE_PROFILER  # pylint: disable=global-statement
+    _ACTIVE_PROFILER = profiler
+
+
+def io_span(category: IoCategory, name: str) -> ContextManager[None]:
+    """Return a context manager attributing the time spent in its block to the given I/O category.
+
+    It does nothing when profiling is disabled.
+    """
+    profiler = _ACTIVE_PROFILER
+    return _NO_OP_CONTEXT if profiler is None else profiler.io_span(category, name)
+
+
+def _profile_calls_decorator(
+    func: Callable[..., Any], *, path: str
+) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def profiled_func_wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler = _ACTIVE_PROFILER
+        if profiler is None:
+            return func(*args, **kwargs)
+        return profiler.call(path, func, args, kwargs)
+
+    setattr(profiled_func_wrapper, "_atoti_profiled", True)
+    return profiled_func_wrapper
+
+
+def instrument_profiling_callback(
+    container: ContainerType, attribute_name: str
+) -> None:
+    """Decorate the function of the container to record its calls while profiling is enabled."""
+    func = getattr(container, attribute_name)
+    if (
+        is_private_element(attribute_name)
+        and attribute_name not in _PROFILED_DUNDER_METHODS
+    ) or getattr(func, "_atoti_profiled", False):
+        return
+    if getattr(func, "__module__", "").endswith(".profiling"):
+        return
+    decorate(
+        container=container,
+        attribute_name=attribute_name,
+        decorator=_profile_calls_decorator,
+        decorator_kwargs={
+            "path": f"{get_container_full_name(container)}.{func.__name__}"
+        },
+    )
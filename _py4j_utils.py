@@ -1,8 +1,142 @@
 import datetime
-from typing import Any, Collection, Dict, Iterable, List, Mapping, Union, cast
+import json
+import math
+import struct
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary, WeakSet
 
 from py4j.java_collections import JavaArray, JavaMap, ListConverter
 from py4j.java_gateway import JavaClass, JavaGateway, JavaObject
+from py4j.protocol import Py4JError, Py4JJavaError
+
+# Below this size, converting elements one by one takes fewer round-trips than a bulk transfer.
+_BULK_TRANSFER_MIN_SIZE = 8
+
+_OBJECT_MAPPERS: "WeakKeyDictionary[JavaGateway, Any]" = WeakKeyDictionary()
+
+_GATEWAYS_WITHOUT_BULK_TRANSFER: "WeakSet[JavaGateway]" = WeakSet()
+
+_T = TypeVar("_T")
+
+
+def get_object_mapper(
+    gateway: JavaGateway,  # type: ignore
+) -> Any:
+    """Return the Jackson ObjectMapper of the JVM behind the gateway, creating it on first use."""
+    object_mapper = _OBJECT_MAPPERS.get(gateway)
+    if object_mapper is None:
+        jackson = gateway.jvm.com.fasterxml.jackson.databind  # type: ignore
+        object_mapper = jackson.ObjectMapper()
+        object_mapper.disable(jackson.SerializationFeature.FAIL_ON_EMPTY_BEANS)
+        # Write NaN and infinities as the literals decoded by the json module instead of strings.
+        object_mapper.getFactory().disable(
+            getattr(
+                gateway.jvm.com.fasterxml.jackson.core,  # type: ignore
+                "JsonGenerator$Feature",
+            ).QUOTE_NON_NUMERIC_NUMBERS
+        )
+        try:
+            # Write dates and times as ISO 8601 strings.
+            object_mapper.registerModule(
+                gateway.jvm.com.fasterxml.jackson.datatype.jsr310.JavaTimeModule()  # type: ignore
+            )
+            object_mapper.disable(
+                jackson.SerializationFeature.WRITE_DATES_AS_TIMESTAMPS
+            )
+        except Py4JError:
+            pass
+        _OBJECT_MAPPERS[gateway] = object_mapper
+    return object_mapper
+
+
+def _is_json_scalar(value: Any) -> bool:
+    """Whether the value is decoded by Jackson to the same Java object as the one py4j would create."""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return value is None or isinstance(value, (str, int))
+
+
+def _can_transfer_in_bulk(collection: Collection[Any]) -> bool:
+    return len(collection) >= _BULK_TRANSFER_MIN_SIZE and all(
+        _is_json_scalar(element) for element in collection
+    )
+
+
+def _try_bulk_transfer(
+    transfer: Callable[[], _T],
+    *,
+    gateway: JavaGateway,  # type: ignore
+) -> Optional[_T]:
+    """Return the result of the bulk transfer or ``None`` if it failed, in which case the caller converts the elements one by one.
+
+    If the classes used by bulk transfers cannot be reached in the JVM, they are not attempted anymore through this gateway.
+    """
+    if gateway in _GATEWAYS_WITHOUT_BULK_TRANSFER:
+        return None
+    try:
+        return transfer()
+    except Py4JJavaError:
+        return None
+    except Py4JError:
+        _GATEWAYS_WITHOUT_BULK_TRANSFER.add(gateway)
+        return None
+
+
+def _from_json(
+    value: Any,
+    *,
+    gateway: JavaGateway,  # type: ignore
+    clazz: str,
+) -> Optional[Any]:
+    """Send the value as a single JSON string decoded in the JVM to an instance of the given class, or return ``None`` if Jackson cannot be used."""
+    return _try_bulk_transfer(
+        lambda: get_object_mapper(gateway).readValue(
+            json.dumps(value),
+            gateway.jvm.java.lang.Class.forName(clazz),  # type: ignore
+        ),
+        gateway=gateway,
+    )
+
+
+def _to_primitive_java_array(
+    collection: Collection[Any],
+    *,
+    gateway: JavaGateway,  # type: ignore
+    format_character: str,
+    buffer_method: str,
+    array_type: Any,
+) -> JavaArray:
+    """Send the values packed as big-endian bytes, which py4j transfers as a single byte[].
+
+    Fall back to converting the values one by one if the bytes cannot be transferred.
+    """
+
+    def transfer() -> JavaArray:
+        array = cast(JavaArray, gateway.new_array(array_type, len(collection)))
+        buffer = gateway.jvm.java.nio.ByteBuffer.wrap(  # type: ignore
+            bytearray(
+                struct.pack(f">{len(collection)}{format_character}", *collection)
+            )
+        )
+        getattr(buffer, buffer_method)().get(array)
+        return array
+
+    array = _try_bulk_transfer(transfer, gateway=gateway)
+    if array is None:
+        return to_typed_java_array(collection, gateway=gateway, array_type=array_type)
+    return array
 
 
 # No type stubs for py4j, so we ignore this error
@@ -12,6 +146,12 @@ def to_java_object_array(
     gateway: JavaGateway,  # type: ignore
 ) -> JavaArray:
     """Transform the Python collection into a Java array."""
+    if _can_transfer_in_bulk(collection):
+        array = _from_json(
+            list(collection), gateway=gateway, clazz="[Ljava.lang.Object;"
+        )
+        if array is not None:
+            return array
     return to_typed_java_array(
         collection, gateway=gateway, array_type=gateway.jvm.Object
     )
@@ -33,6 +173,12 @@ def _to_typed_java_map(
     clazz: str,
 ) -> JavaMap:
     """Convert to a map of the given type."""
+    if _can_transfer_in_bulk(to_convert.values()) and all(
+        isinstance(key, str) for key in to_convert
+    ):
+        bulk_map = _from_json(dict(to_convert), gateway=gateway, clazz=clazz)
+        if bulk_map is not None:
+            return bulk_map
     map_type = JavaClass(clazz, gateway._gateway_client)
     java_map = cast(JavaMap, map_type())
     for key in to_convert.keys():
@@ -46,6 +192,14 @@ def to_java_string_array(
     gateway: JavaGateway,  # type: ignore
 ) -> JavaArray:
     """Transform the Python collection into a Java array of strings."""
+    if len(collection) >= _BULK_TRANSFER_MIN_SIZE and all(
+        isinstance(element, str) for element in collection
+    ):
+        array = _from_json(
+            list(collection), gateway=gateway, clazz="[Ljava.lang.String;"
+        )
+        if array is not None:
+            return array
     return to_typed_java_array(
         collection, gateway=gateway, array_type=gateway.jvm.String
     )
@@ -57,8 +211,13 @@ def to_java_object_list(
     gateway: JavaGateway,  # type: ignore
 ) -> Any:
     """Transform the Python iterable into a Java list of object."""
+    elements = list(iterable)
+    if _can_transfer_in_bulk(elements):
+        java_list = _from_json(elements, gateway=gateway, clazz="java.util.ArrayList")
+        if java_list is not None:
+            return java_list
     return ListConverter().convert(
-        [as_java_object(e, gateway=gateway) for e in iterable], gateway._gateway_client
+        [as_java_object(e, gateway=gateway) for e in elements], gateway._gateway_client
     )
 
 
@@ -114,14 +273,35 @@ def as_java_object(
     if isinstance(arg, list):
         # Convert to Vector
         vector_package = gateway.jvm.com.qfs.vector.array.impl  # type: ignore
+        is_bulk = len(arg) >= _BULK_TRANSFER_MIN_SIZE
         if all(isinstance(x, float) for x in arg):
-            array = to_typed_java_array(
-                arg, gateway=gateway, array_type=gateway.jvm.double
+            array = (
+                _to_primitive_java_array(
+                    arg,
+                    gateway=gateway,
+                    format_character="d",
+                    buffer_method="asDoubleBuffer",
+                    array_type=gateway.jvm.double,
+                )
+                if is_bulk
+                else to_typed_java_array(
+                    arg, gateway=gateway, array_type=gateway.jvm.double
+                )
             )
             return vector_package.ArrayDoubleVector(array)  # type: ignore
         if all(isinstance(x, int) for x in arg):
-            array = to_typed_java_array(
-                arg, gateway=gateway, array_type=gateway.jvm.long
+            array = (
+                _to_primitive_java_array(
+                    arg,
+                    gateway=gateway,
+                    format_character="q",
+                    buffer_method="asLongBuffer",
+                    array_type=gateway.jvm.long,
+                )
+                if is_bulk
+                else to_typed_java_array(
+                    arg, gateway=gateway, array_type=gateway.jvm.long
+                )
             )
             return vector_package.ArrayLongVector(array)  # type: ignore
         array = to_java_object_array(arg, gateway=gateway)
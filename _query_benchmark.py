@@ -0,0 +1,314 @@
+"""Benchmark of the query path against a local session and synthetic cubes.
+
+Run it with ``python -m atoti._query_benchmark``.
+Results are compared to the baseline stored in the atoti home directory and ``--save-baseline`` replaces this baseline with the new results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Final, Literal
+
+from ._path_utils import get_atoti_home
+from ._version import VERSION
+
+DEFAULT_BASELINE_PATH: Final = get_atoti_home() / "benchmarks" / "query.json"
+
+# Relative slowdown above which a case is reported as a regression.
+DEFAULT_REGRESSION_THRESHOLD: Final = 0.1
+
+_PHASES = (
+    "mdx_generation",
+    "http_wait",
+    "download",
+    "json_decode",
+    "cellset_conversion",
+    "styler",
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    cell_count: int
+    level_count: int = 2
+    measure_count: int = 1
+    include_totals: bool = False
+    mode: Literal["pretty", "raw"] = "pretty"
+    scenario_count: int = 0
+    style: bool = False
+
+    @property
+    def row_count(self) -> int:
+        return max(self.cell_count // self.measure_count, 1)
+
+
+def _get_cases(*, full: bool) -> List[BenchmarkCase]:
+    cell_counts = [1_000, 100_000, 1_000_000] + ([10_000_000] if full else [])
+    cases = []
+    for cell_count in cell_counts:
+        for mode in ("pretty", "raw"):
+            # Pretty queries of millions of cells take minutes to convert, they are only part of the full run.
+            if mode == "pretty" and cell_count > 100_000 and not full:
+                continue
+            cases.append(
+                BenchmarkCase(f"{mode}-{cell_count}", cell_count=cell_count, mode=mode)
+            )
+    cases.extend(
+        [
+            BenchmarkCase("pretty-many-levels", cell_count=100_000, level_count=8),
+            BenchmarkCase("pretty-many-measures", cell_count=100_000, measure_count=20),
+            BenchmarkCase("pretty-totals", cell_count=100_000, include_totals=True),
+            BenchmarkCase("pretty-style", cell_count=100_000, style=True),
+            BenchmarkCase("pretty-scenarios", cell_count=100_000, scenario_count=4),
+            BenchmarkCase(
+                "raw-many-levels", cell_count=1_000_000, level_count=8, mode="raw"
+            ),
+            BenchmarkCase(
+                "raw-many-measures", cell_count=1_000_000, measure_count=20, mode="raw"
+            ),
+            BenchmarkCase(
+                "raw-scenarios", cell_count=1_000_000, scenario_count=4, mode="raw"
+            ),
+        ]
+    )
+    return cases
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    cell_count: int
+    durations: List[float] = field(default_factory=list)
+    """End-to-end duration of each repetition in seconds."""
+
+    phases: Dict[str, float] = field(default_factory=dict)
+    """Median duration of each phase in seconds, only for pretty queries."""
+
+    peak_memory: int = 0
+    """Peak of the memory allocated by Python during a repetition in bytes, measured apart from the timed repetitions."""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.durations)
+
+    @property
+    def throughput(self) -> float:
+        """Number of cells per second."""
+        return self.cell_count / self.median
+
+
+def _create_dataframe(case: BenchmarkCase, *, seed: int = 0) -> pd.DataFrame:
+    random = np.random.RandomState(seed)
+    # Levels share the cardinality needed for their cross product to cover all the rows.
+    cardinality = int(np.ceil(case.row_count ** (1 / case.level_count)))
+    codes = np.arange(case.row_count)
+    dataframe = pd.DataFrame(
+        {
+            f"Level {level_index}": f"L{level_index}-"
+            + pd.Series((codes // cardinality**level_index) % cardinality).astype(str)
+            for level_index in range(case.level_count)
+        }
+    )
+    for measure_index in range(case.measure_count):
+        dataframe[f"Value {measure_index}"] = random.random_sample(case.row_count)
+    return dataframe
+
+
+def _run_case(
+    session: Any, case: BenchmarkCase, *, repetitions: int
+) -> BenchmarkResult:
+    dataframe = _create_dataframe(case)
+    level_names = [f"Level {level_index}" for level_index in range(case.level_count)]
+    table = session.read_pandas(
+        dataframe, keys=level_names, table_name=f"Benchmark {case.name}"
+    )
+    scenario_names = [f"Scenario {index}" for index in range(case.scenario_count)]
+    for index, scenario_name in enumerate(scenario_names):
+        table.scenarios[scenario_name].load_pandas(
+            _create_dataframe(case, seed=index + 1)
+        )
+    cube = session.create_cube(table)
+    measures = [
+        cube.measures[f"Value {measure_index}.SUM"]
+        for measure_index in range(case.measure_count)
+    ]
+    levels = [cube.levels[level_name] for level_name in level_names]
+
+    def query(scenario: str) -> Any:
+        if case.mode == "raw":
+            return cube.query(*measures, levels=levels, mode="raw", scenario=scenario)
+        result = cube.query(
+            *measures,
+            include_totals=case.include_totals,
+            levels=levels,
+            scenario=scenario,
+            timeout=3600,
+        )
+        if case.style:
+            result.style  # pylint: disable=pointless-statement
+        return result
+
+    # Warm up the JVM and the Python caches.
+    query("Base")
+
+    result = BenchmarkResult(case.name, cell_count=case.cell_count)
+    phases: Dict[str, List[float]] = {phase: [] for phase in _PHASES}
+    for _ in range(repetitions):
+        start = perf_counter()
+        for scenario in ["Base", *scenario_names]:
+            query_result = query(scenario)
+            timings = getattr(query_result, "timings", None)
+            if timings is not None:
+                for phase in _PHASES:
+                    duration = getattr(timings, phase)
+                    if duration is not None:
+                        phases[phase].append(duration)
+        result.durations.append(perf_counter() - start)
+    result.phases = {
+        phase: statistics.median(durations)
+        for phase, durations in phases.items()
+        if durations
+    }
+
+    # Tracing allocations slows Python down so the memory is measured in an extra repetition that is not timed.
+    tracemalloc.start()
+    try:
+        for scenario in ["Base", *scenario_names]:
+            query(scenario)
+        _, result.peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result
+
+
+def run_benchmark(
+    cases: Iterable[BenchmarkCase], *, repetitions: int = 5
+) -> List[BenchmarkResult]:
+    """Run each of the given cases in a new session and return their results.
+
+    Using a new session per case prevents the tables and cubes of the previous cases from slowing down the next ones.
+    """
+    import atoti as tt  # pylint: disable=import-outside-toplevel
+
+    results = []
+    for case in cases:
+        session = tt.create_session()
+        try:
+            result = _run_case(session, case, repetitions=repetitions)
+        finally:
+            session.close()
+        print(
+            f"{case.name}: {result.median:.3f}s, {result.throughput:,.0f} cells/s,"
+            f" {result.peak_memory / 2**20:.1f} MiB peak"
+        )
+        results.append(result)
+    return results
+
+
+def save_baseline(results: Sequence[BenchmarkResult], *, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "version": VERSION,
+                "results": {
+                    result.name: {**asdict(result), "median": result.median}
+                    for result in results
+                },
+            },
+            indent=2,
+        )
+    )
+
+
+def compare_to_baseline(
+    results: Sequence[BenchmarkResult],
+    *,
+    baseline: Mapping[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[str]:
+    """Print the comparison of the results to the baseline and return the names of the regressed cases."""
+    regressions = []
+    print(f"Comparison to the baseline of atoti {baseline['version']}:")
+    for result in results:
+        baseline_result: Optional[Mapping[str, Any]] = baseline["results"].get(
+            result.name
+        )
+        if baseline_result is None:
+            continue
+        ratio = result.median / baseline_result["median"]
+        is_regression = ratio > 1 + threshold
+        if is_regression:
+            regressions.append(result.name)
+        print(
+            f"  {result.name}: {baseline_result['median']:.3f}s -> {result.median:.3f}s"
+            f" ({ratio - 1:+.1%}){' REGRESSION' if is_regression else ''}"
+        )
+        for phase, duration in result.phases.items():
+            baseline_duration = baseline_result["phases"].get(phase)
+            if baseline_duration:
+                print(
+                    f"    {phase}: {baseline_duration:.3f}s -> {duration:.3f}s"
+                    f" ({duration / baseline_duration - 1:+.1%})"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser: Final = argparse.ArgumentParser(  # pylint: disable=invalid-name
+        description="Benchmark queries against a local session."
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE_PATH),
+        help="the path of the JSON file holding the baseline results",
+        type=str,
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="also run the cases with up to 10M cells",
+    )
+    parser.add_argument(
+        "--repetitions", default=5, help="the number of runs of each case", type=int
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="replace the baseline with the results of this run",
+    )
+    parser.add_argument(
+        "--threshold",
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="the relative slowdown above which a case is reported as a regression",
+        type=float,
+    )
+    args: argparse.Namespace = parser.parse_args()
+    baseline_path = Path(args.baseline)
+    benchmark_results = run_benchmark(
+        _get_cases(full=args.full), repetitions=args.repetitions
+    )
+    regressed_cases: List[str] = []
+    if baseline_path.exists():
+        regressed_cases = compare_to_baseline(
+            benchmark_results,
+            baseline=json.loads(baseline_path.read_text()),
+            threshold=args.threshold,
+        )
+    if args.save_baseline:
+        save_baseline(benchmark_results, path=baseline_path)
+        print(f"The baseline has been saved to {baseline_path.resolve()}")
+    if regressed_cases:
+        raise SystemExit(f"Regressed cases: {', '.join(regressed_cases)}")
@@ -1 +1,54 @@
+from typing import Optional, Sequence
+
+import pandas as pd
+
 BASE_SCENARIO_NAME = "Base"
+
+
+def get_scenario_names_to_query(
+    *, scenario: str, scenarios: Optional[Sequence[str]], diff_against_base: bool
+) -> Sequence[str]:
+    """Return the scenarios to put on rows, validating the scenario related query arguments."""
+    if scenarios is None:
+        if diff_against_base:
+            raise ValueError("Diffing against the base scenario requires scenarios.")
+        return ()
+
+    if scenario != BASE_SCENARIO_NAME:
+        raise ValueError("Only one of scenario and scenarios can be passed.")
+
+    if not scenarios:
+        raise ValueError("At least one scenario must be passed.")
+
+    if diff_against_base and BASE_SCENARIO_NAME not in scenarios:
+        return [BASE_SCENARIO_NAME, *scenarios]
+
+    return scenarios
+
+
+def keep_cells_different_from_base(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Return the rows of the non-base scenarios with only the cells whose value differs from the base scenario.
+
+    The scenario must be the first level of the DataFrame's index.
+    Cells with the same value as in the base scenario are replaced with ``NaN`` and rows without any different cell are dropped.
+    """
+    scenario_level_name = dataframe.index.names[0]
+    is_base = (
+        dataframe.index.get_level_values(scenario_level_name) == BASE_SCENARIO_NAME
+    )
+    base_dataframe, other_dataframe = dataframe[is_base], dataframe[~is_base]
+
+    if isinstance(dataframe.index, pd.MultiIndex):
+        base_values = base_dataframe.droplevel(scenario_level_name).reindex(
+            other_dataframe.index.droplevel(scenario_level_name)
+        )
+    else:
+        base_values = base_dataframe.reindex(
+            [BASE_SCENARIO_NAME] * len(other_dataframe)
+        )
+    base_values.index = other_dataframe.index
+
+    is_different = other_dataframe.ne(base_values) & ~(
+        other_dataframe.isna() & base_values.isna()
+    )
+    return other_dataframe.where(is_different).dropna(how="all")
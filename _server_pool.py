@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import atexit
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Deque, Hashable, Optional
+
+from ._server_subprocess import ServerSubprocess, get_server_fingerprint
+from .config import SessionConfig
+
+_LOGGER = logging.getLogger("atoti.process")
+
+
+class ServerPool:
+    """Servers started in the background to be handed out to the next sessions.
+
+    Each server handed out is replaced by a new one started in the background.
+    """
+
+    def __init__(self, *, config: SessionConfig, size: int):
+        if size < 1:
+            raise ValueError(
+                f"The size of the server pool must be positive, not {size}."
+            )
+        if config.port is not None:
+            # The replacement of a handed out server would compete for the same port.
+            raise ValueError("Servers cannot be pooled when the port is configured.")
+        self._config = config
+        self._fingerprint: Hashable = get_server_fingerprint(config)
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="atoti-server-pool"
+        )
+        self._lock = Lock()
+        self._closed = False
+        self._servers: Deque[Future[ServerSubprocess]] = deque(
+            self._start_server() for _ in range(size)
+        )
+
+    def _start_server(self) -> Future[ServerSubprocess]:
+        return self._executor.submit(ServerSubprocess, config=self._config)
+
+    def acquire(self, config: SessionConfig) -> Optional[ServerSubprocess]:
+        """Return a server started with the same fingerprint as the given config, or ``None`` if there is none."""
+        if get_server_fingerprint(config) != self._fingerprint:
+            return None
+        with self._lock:
+            if self._closed or not self._servers:
+                return None
+            # The oldest server is the closest to being ready.
+            server = self._servers.popleft()
+            self._servers.append(self._start_server())
+        try:
+            return server.result()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning("A pooled server failed to start.", exc_info=True)
+            return None
+
+    def close(self) -> None:
+        """Kill the servers that have not been handed out."""
+        with self._lock:
+            self._closed = True
+            servers = list(self._servers)
+            self._servers.clear()
+        for server in servers:
+            server.cancel()
+        self._executor.shutdown(wait=True)
+        for server in servers:
+            if not server.cancelled() and server.exception() is None:
+                server.result().kill()
+
+
+_SERVER_POOL: Optional[ServerPool] = None
+
+
+def start_server_pool(*, config: SessionConfig, size: int) -> None:
+    global _SERVER_POOL  # pylint: disable=global-statement
+    stop_server_pool()
+    _SERVER_POOL = ServerPool(config=config, size=size)
+
+
+def stop_server_pool() -> None:
+    global _SERVER_POOL  # pylint: disable=global-statement
+    if _SERVER_POOL is not None:
+        _SERVER_POOL.close()
+        _SERVER_POOL = None
+
+
+atexit.register(stop_server_pool)
+
+
+def create_server_subprocess(*, config: SessionConfig) -> ServerSubprocess:
+    """Return a server from the pool if it has one compatible with the config, or start a new one."""
+    server = None if _SERVER_POOL is None else _SERVER_POOL.acquire(config)
+    return ServerSubprocess(config=config) if server is None else server
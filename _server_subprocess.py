@@ -7,9 +7,10 @@ import re
 import string
 from pathlib import Path
 from subprocess import PIPE, STDOUT, Popen  # nosec
-from time import sleep, time
-from typing import TYPE_CHECKING, List, Tuple
+from time import time
+from typing import TYPE_CHECKING, Any, Hashable, List, Optional, Tuple
 
+from ._class_data_sharing import ClassDataSharing, get_class_data_sharing
 from ._java_utils import JAR_PATH, get_java_path
 from ._path_utils import get_atoti_home, to_absolute_path
 from ._plugins import get_active_plugins
@@ -23,6 +24,8 @@ DEFAULT_HADOOP_PATH = Path(__file__).parent / "bin" / "hadoop-3.2.1"
 
 REGEX = "Py4J server started on port (?P<port>[0-9]+)"
 
+_START_TIMEOUT_IN_SECONDS = 60
+
 
 def _create_session_directory() -> Path:
     """Create the directory that will contain the session files."""
@@ -42,6 +45,27 @@ def _compute_log_directory(session_directory: Path) -> Path:
     return session_directory / "logs"
 
 
+def get_server_fingerprint(config: SessionConfig) -> Hashable:
+    """Return a value identifying the configuration options used to start the server process.
+
+    The other options are only sent to the server once it has started so servers started with the same fingerprint are interchangeable.
+    """
+    logging_destination: Any = None
+    if config.logging and config.logging.destination is not None:
+        # IOs are compared by identity since the server output is written to them.
+        logging_destination = (
+            id(config.logging.destination)
+            if get_logging_destination_io(config)
+            else str(config.logging.destination)
+        )
+    return (
+        config.port,
+        tuple(config.java_options),
+        tuple(str(jar) for jar in config.extra_jars),
+        logging_destination,
+    )
+
+
 def get_plugin_jar_paths() -> List[str]:
     """Get the JAR paths of the available plugins."""
     return [
@@ -55,6 +79,7 @@ class ServerSubprocess:
     """A wrapper class to start and manage an atoti server from Python."""
 
     _capturing_buffer: StreamCapturingBuffer
+    _class_data_sharing: Optional[ClassDataSharing]
 
     def __init__(self, *, config: SessionConfig):
         """Create and start the subprocess."""
@@ -76,6 +101,10 @@ class ServerSubprocess:
         self._process.wait()
         self._capturing_buffer.stop()
         self._capturing_buffer.join()
+        if self._class_data_sharing:
+            self._class_data_sharing.on_server_exit(
+                return_code=self._process.returncode
+            )
 
     def _start(self) -> Tuple[Popen, int]:
         """Start the atoti server and return a tuple containing the server process and the Py4J port."""
@@ -97,7 +126,9 @@ class ServerSubprocess:
             )
 
         self._capturing_buffer = StreamCapturingBuffer(
-            input_stream=process.stdout, output_stream=output_stream
+            input_stream=process.stdout,
+            output_stream=output_stream,
+            pattern=re.compile(REGEX),
         )
         self._capturing_buffer.start()
 
@@ -142,6 +173,13 @@ class ServerSubprocess:
                 f"-Dloader.path={','.join([to_absolute_path(jar) for jar in jars])}"
             )
 
+        self._class_data_sharing = get_class_data_sharing(
+            jar_paths=[to_absolute_path(jar) for jar in jars],
+            java_options=self._config.java_options,
+        )
+        if self._class_data_sharing:
+            program_args.extend(self._class_data_sharing.get_java_options())
+
         program_args.append(to_absolute_path(JAR_PATH))
 
         try:
@@ -158,31 +196,23 @@ class ServerSubprocess:
 
     def _await_start(self) -> int:
         """Wait for the server to start and return the Py4J Java port."""
-        period = 0.25
-        timeout = 60
-        attempt_count = round(timeout / period)
-        # Wait for the process to start and log the Py4J port.
-        for _ in range(1, attempt_count):
-            # Look for the started line.
-            try:
-                match = re.search(REGEX, self._capturing_buffer.get_buffer_value())
-                if match:
-                    # Server should be ready.
-                    return int(match.group("port"))
-
-            except FileNotFoundError:
-                # The logs file has not yet been created.
-                pass
-
-            # The server is not ready yet.
-            # Wait for a bit.
-            sleep(period)
-
-        # The inner loop did not return.
-        # This means that the server could not be started correctly.
-        raise RuntimeError(
-            f"Could not start server. Check the logs: {self._subprocess_log_file}"
+        # The capturing buffer reports the started line as soon as it is read, or the end of the output if the process exited before.
+        match = self._capturing_buffer.wait_for_match(
+            timeout=_START_TIMEOUT_IN_SECONDS
         )
+        if match is None:
+            raise RuntimeError(
+                f"Could not start server. Check the logs: {self._subprocess_log_file}"
+            )
+        return int(match.group("port"))
+
+    def kill(self) -> None:
+        """Kill the server process.
+
+        Used for servers that were never connected to: the other ones stop by themselves when their Py4J gateway is closed.
+        """
+        self._process.kill()
+        self.wait()
 
     @property
     def logs_path(self) -> Path:
@@ -0,0 +1,642 @@
+"""Export and restoration of the structure of a session: its tables, joins, cubes, hierarchies, and measures.
+
+The JVM does not expose the parameters used to create tables, joins, cubes, and measures so they are recorded in a :class:`DefinitionJournal` when they are created from Python.
+Hierarchies and measure metadata are read from the JVM when exporting.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+import logging
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional
+
+from ._path_utils import PathLike
+from ._version import VERSION
+from .comparator import ASCENDING, Comparator
+from .type import DataType
+
+if TYPE_CHECKING:
+    from .cube import Cube
+    from .measure_description import MeasureDescription
+    from .session import Session
+
+DEFINITION_FORMAT_VERSION = 1
+
+_LOGGER = logging.getLogger("atoti.session")
+
+# Only classes of this package can be instantiated when restoring measures.
+_PACKAGE_NAME = __name__.rsplit(".", 1)[0]
+
+
+class _UnserializableError(Exception):
+    """Raised when a measure description holds a value that cannot be written to the definition file."""
+
+
+def _serialize_value(  # pylint: disable=too-many-return-statements
+    value: Any,
+) -> Any:
+    from ._base._base_hierarchy import BaseHierarchy
+    from ._base._base_level import BaseLevel
+    from ._base._base_measure import BaseMeasure
+    from .column import Column
+    from .measure_description import MeasureDescription
+    from .table import Table
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, BaseMeasure):
+        return {"measure": value.name}
+    if isinstance(value, BaseLevel):
+        return {"level": [value.dimension, value.hierarchy, value.name]}
+    if isinstance(value, BaseHierarchy):
+        return {"hierarchy": [value.dimension, value.name]}
+    if isinstance(value, Column):
+        return {"column": [value._table.name, value.name]}
+    if isinstance(value, Table):
+        return {"table": value.name}
+    if isinstance(value, Enum):
+        return {"enum": _get_class_path(type(value)), "name": value.name}
+    # datetime is a subclass of date so it must be tested first.
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, time):
+        return {"time": value.isoformat()}
+    if isinstance(value, list):
+        return [_serialize_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"tuple": [_serialize_value(item) for item in value]}
+    if isinstance(value, Mapping):
+        return {
+            "mapping": [
+                [_serialize_value(item_key), _serialize_value(item_value)]
+                for item_key, item_value in value.items()
+            ]
+        }
+    if isinstance(value, MeasureDescription) or (
+        dataclasses.is_dataclass(value) and not isinstance(value, type)
+    ):
+        return {
+            "object": _get_class_path(type(value)),
+            "attributes": {
+                attribute_name: _serialize_value(attribute_value)
+                for attribute_name, attribute_value in vars(value).items()
+                # The name is only set once the description has been distilled.
+                if attribute_name != "name"
+            },
+        }
+    raise _UnserializableError(f"Cannot serialize {value!r}.")
+
+
+def _get_class_path(clazz: type) -> str:
+    return f"{clazz.__module__}:{clazz.__qualname__}"
+
+
+def _load_class(class_path: str) -> type:
+    module_name, qualified_name = class_path.split(":")
+    if module_name != _PACKAGE_NAME and not module_name.startswith(
+        f"{_PACKAGE_NAME}."
+    ):
+        raise ValueError(f"Cannot restore an instance of {class_path}.")
+    clazz: Any = importlib.import_module(module_name)
+    for name in qualified_name.split("."):
+        clazz = getattr(clazz, name)
+    if not isinstance(clazz, type):
+        raise ValueError(f"{class_path} is not a class.")
+    return clazz
+
+
+def _deserialize_value(  # pylint: disable=too-many-return-statements
+    value: Any, *, cube: Cube, session: Session
+) -> Any:
+    if isinstance(value, list):
+        return [_deserialize_value(item, cube=cube, session=session) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "measure" in value:
+        from .measure import Measure
+
+        # Descriptions only need the name of the measures they reference.
+        # Not looking them up avoids publishing the measures restored so far.
+        return Measure(value["measure"], None, cube, cube._java_api)  # type: ignore
+    if "level" in value:
+        return cube.levels[tuple(value["level"])]
+    if "hierarchy" in value:
+        return cube.hierarchies[tuple(value["hierarchy"])]
+    if "column" in value:
+        table_name, column_name = value["column"]
+        return session.tables[table_name][column_name]
+    if "table" in value:
+        return session.tables[value["table"]]
+    if "enum" in value:
+        return getattr(_load_class(value["enum"]), value["name"])
+    if "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    if "date" in value:
+        return date.fromisoformat(value["date"])
+    if "time" in value:
+        return time.fromisoformat(value["time"])
+    if "tuple" in value:
+        return tuple(
+            _deserialize_value(item, cube=cube, session=session)
+            for item in value["tuple"]
+        )
+    if "mapping" in value:
+        return {
+            _deserialize_value(
+                item_key, cube=cube, session=session
+            ): _deserialize_value(item_value, cube=cube, session=session)
+            for item_key, item_value in value["mapping"]
+        }
+    if "object" in value:
+        clazz = _load_class(value["object"])
+        instance = clazz.__new__(clazz)
+        # Going through __dict__ also works for frozen dataclasses.
+        instance.__dict__.update(
+            {
+                attribute_name: _deserialize_value(
+                    attribute_value, cube=cube, session=session
+                )
+                for attribute_name, attribute_value in value["attributes"].items()
+            }
+        )
+        return instance
+    raise ValueError(f"Invalid serialized value: {value}.")
+
+
+def _get_referenced_measure_names(value: Any) -> Iterable[str]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _get_referenced_measure_names(item)
+    elif isinstance(value, dict):
+        if "measure" in value:
+            yield value["measure"]
+        elif "object" in value:
+            for item in value["attributes"].values():
+                yield from _get_referenced_measure_names(item)
+        else:
+            for item in value.values():
+                yield from _get_referenced_measure_names(item)
+
+
+def _serialize_data_type(data_type: DataType) -> List[Any]:
+    return [data_type.java_type, data_type.nullable]
+
+
+def _deserialize_data_type(value: List[Any]) -> DataType:
+    java_type, nullable = value
+    return DataType(java_type=java_type, nullable=nullable)
+
+
+class DefinitionJournal:
+    """Record of the structural calls made from Python whose parameters cannot be retrieved from the JVM.
+
+    It can be used from several threads: its content is read and changed under its lock.
+    """
+
+    def __init__(self) -> None:
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self.joins: List[Dict[str, Any]] = []
+        self.cubes: Dict[str, Dict[str, Any]] = {}
+        self.measures: Dict[str, Dict[str, Optional[Any]]] = {}
+        """Serialized description of the measures of each cube, ``None`` for the ones that cannot be serialized."""
+
+        self._lock = Lock()
+
+    def record_table(
+        self,
+        name: str,
+        *,
+        types: Mapping[str, DataType],
+        keys: Iterable[str],
+        partitioning: Optional[str],
+        hierarchized_columns: Optional[Iterable[str]],
+        is_parameter_table: bool,
+    ) -> None:
+        with self._lock:
+            self.tables[name] = {
+                "name": name,
+                "types": {
+                    column_name: _serialize_data_type(data_type)
+                    for column_name, data_type in types.items()
+                },
+                "keys": list(keys),
+                "partitioning": partitioning,
+                "hierarchized_columns": None
+                if hierarchized_columns is None
+                else list(hierarchized_columns),
+                "is_parameter_table": is_parameter_table,
+            }
+
+    def record_join(
+        self, table_name: str, other_table_name: str, mapping: Optional[Mapping[str, str]]
+    ) -> None:
+        with self._lock:
+            self.joins.append(
+                {
+                    "table": table_name,
+                    "other_table": other_table_name,
+                    "mapping": None if mapping is None else dict(mapping),
+                }
+            )
+
+    def get_joined_table_names(self, table_name: str) -> List[str]:
+        """Return the names of the tables joined to the given one, directly or through other tables, from the closest to the farthest.
+
+        Only the joins made from this process are known.
+        """
+        with self._lock:
+            joins = list(self.joins)
+        table_names = [table_name]
+        # The list grows while it is iterated, which walks the joins breadth first.
+        for source_table_name in table_names:
+            for join in joins:
+                if (
+                    join["table"] == source_table_name
+                    and join["other_table"] not in table_names
+                ):
+                    table_names.append(join["other_table"])
+        return table_names[1:]
+
+    def record_cube(self, name: str, *, base_table_name: str, mode: str) -> None:
+        with self._lock:
+            self.cubes[name] = {"base_table": base_table_name, "mode": mode}
+            self.measures[name] = {}
+
+    def forget_cube(self, name: str) -> None:
+        with self._lock:
+            self.cubes.pop(name, None)
+            self.measures.pop(name, None)
+
+    def record_measure(
+        self, cube_name: str, measure_name: str, measure: MeasureDescription
+    ) -> None:
+        try:
+            serialized: Optional[Any] = _serialize_value(measure)
+        except _UnserializableError:
+            serialized = None
+        with self._lock:
+            measures = self.measures.setdefault(cube_name, {})
+            # Moved to the end since it may now depend on measures created after its previous definition.
+            measures.pop(measure_name, None)
+            measures[measure_name] = serialized
+
+    def forget_measure(self, cube_name: str, measure_name: str) -> None:
+        with self._lock:
+            self.measures.get(cube_name, {}).pop(measure_name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.tables.clear()
+            self.joins.clear()
+            self.cubes.clear()
+            self.measures.clear()
+
+
+def _export_cube(cube: Cube, *, journal: DefinitionJournal) -> Dict[str, Any]:
+    java_api = cube._java_api
+    cube_record = journal.cubes.get(cube.name, {})
+    hierarchies = [
+        {
+            "dimension": hierarchy.dimension,
+            "name": hierarchy.name,
+            "levels": [
+                [level_name, level._column_name]
+                for level_name, level in hierarchy.levels.items()
+            ],
+            "slicing": hierarchy.slicing,
+            "visible": hierarchy.visible,
+            "comparators": {
+                level_name: [
+                    level.comparator._name,
+                    _serialize_value(level.comparator._first_members),
+                ]
+                for level_name, level in hierarchy.levels.items()
+                if level.comparator != ASCENDING
+            },
+        }
+        for hierarchy in java_api.retrieve_hierarchies(cube).values()
+    ]
+
+    measure_definitions = journal.measures.get(cube.name, {})
+    unserializable_measure_names = [
+        measure_name
+        for measure_name, definition in measure_definitions.items()
+        if definition is None
+    ]
+    if unserializable_measure_names:
+        _LOGGER.warning(
+            "The definition of the following measures of cube %s cannot be exported: %s.",
+            cube.name,
+            ", ".join(unserializable_measure_names),
+        )
+    measure_descriptions = java_api.get_full_measures(cube)
+    measures = [
+        {
+            "name": measure_name,
+            "definition": measure_definitions.get(measure_name),
+            "folder": description.folder,
+            "formatter": description.formatter,
+            "visible": description.visible,
+            "description": description.description,
+        }
+        for measure_name, description in measure_descriptions.items()
+    ]
+
+    return {
+        "name": cube.name,
+        "base_table": cube_record.get("base_table", cube._base_table.name),
+        # Cubes created from the JVM, such as the ones of a previous Python process, are assumed to be manual.
+        "mode": cube_record.get("mode", "MANUAL"),
+        "hierarchies": hierarchies,
+        "measures": measures,
+    }
+
+
+def export_definition(session: Session, path: PathLike) -> None:
+    """Write the definition of the session's structure to a JSON file."""
+    java_api = session._java_api
+    journal = java_api.definition_journal
+    existing_table_names = set(java_api.get_tables())
+    with journal._lock:
+        definition = {
+            "version": DEFINITION_FORMAT_VERSION,
+            "atoti_version": VERSION,
+            "tables": [
+                table
+                for table_name, table in journal.tables.items()
+                if table_name in existing_table_names
+            ],
+            "joins": list(journal.joins),
+            "cubes": [
+                _export_cube(cube, journal=journal) for cube in session.cubes.values()
+            ],
+        }
+    Path(path).write_text(json.dumps(definition, indent=2), encoding="utf8")
+
+
+def _sort_measures_by_dependencies(
+    measures: Iterable[Mapping[str, Any]]
+) -> List[Mapping[str, Any]]:
+    """Sort the measures so that the ones referenced by a definition come before it."""
+    measures_by_name = {measure["name"]: measure for measure in measures}
+    sorted_measures: List[Mapping[str, Any]] = []
+    visited = set()
+
+    def visit(measure_name: str) -> None:
+        if measure_name in visited or measure_name not in measures_by_name:
+            return
+        visited.add(measure_name)
+        measure = measures_by_name[measure_name]
+        for referenced_name in _get_referenced_measure_names(measure["definition"]):
+            visit(referenced_name)
+        sorted_measures.append(measure)
+
+    for measure_name in measures_by_name:
+        visit(measure_name)
+    return sorted_measures
+
+
+def _restore_tables(
+    session: Session, tables: Iterable[Mapping[str, Any]], *, skip_unchanged: bool
+) -> None:
+    java_api = session._java_api
+    existing_table_names = set(java_api.get_tables())
+    for table in tables:
+        types = {
+            column_name: _deserialize_data_type(data_type)
+            for column_name, data_type in table["types"].items()
+        }
+        if table["name"] in existing_table_names:
+            existing_table = session.tables[table["name"]]
+            if (
+                dict(existing_table._types) != types
+                or list(existing_table.keys) != table["keys"]
+            ):
+                raise ValueError(
+                    f"Table {table['name']} already exists with a different definition."
+                )
+            if not skip_unchanged:
+                raise ValueError(
+                    f"Table {table['name']} already exists; pass skip_unchanged=True to keep it."
+                )
+            continue
+        java_api.create_table(
+            table["name"],
+            types=types,
+            keys=table["keys"],
+            partitioning=table["partitioning"],
+            hierarchized_columns=table["hierarchized_columns"],
+            is_parameter_table=table["is_parameter_table"],
+        )
+
+
+def _restore_joins(session: Session, joins: Iterable[Mapping[str, Any]]) -> None:
+    java_api = session._java_api
+    for join in joins:
+        # Joins cannot be read from the JVM, only the ones made from this process can be skipped.
+        if join in java_api.definition_journal.joins:
+            continue
+        java_api.create_join(
+            session.tables[join["table"]],
+            session.tables[join["other_table"]],
+            mapping=join["mapping"],
+        )
+
+
+def _restore_hierarchies(
+    cube: Cube,
+    hierarchies: Iterable[Mapping[str, Any]],
+    *,
+    drop_missing: bool,
+    skip_unchanged: bool,
+) -> None:
+    """Create or update the hierarchies of the cube.
+
+    The hierarchies missing from the definition are only dropped if *drop_missing* is ``True``.
+    """
+    java_api = cube._java_api
+    existing_hierarchies = java_api.retrieve_hierarchies(cube)
+    structure: Dict[str, Dict[str, Dict[str, str]]] = {}
+    for hierarchy in hierarchies:
+        existing_hierarchy = existing_hierarchies.get(
+            (hierarchy["dimension"], hierarchy["name"])
+        )
+        # The order of the levels matters so they are compared as lists.
+        if (
+            skip_unchanged
+            and existing_hierarchy is not None
+            and [
+                [level_name, level._column_name]
+                for level_name, level in existing_hierarchy.levels.items()
+            ]
+            == hierarchy["levels"]
+        ):
+            continue
+        structure.setdefault(hierarchy["dimension"], {})[hierarchy["name"]] = dict(
+            hierarchy["levels"]
+        )
+    if structure:
+        java_api.update_hierarchies_for_cube(cube, structure=structure)
+
+    hierarchy_keys = {
+        (hierarchy["dimension"], hierarchy["name"]) for hierarchy in hierarchies
+    }
+    dropped_hierarchies = (
+        [
+            existing_hierarchy
+            for hierarchy_key, existing_hierarchy in existing_hierarchies.items()
+            if hierarchy_key not in hierarchy_keys
+        ]
+        if drop_missing
+        else []
+    )
+    for existing_hierarchy in dropped_hierarchies:
+        java_api.drop_hierarchy(cube, existing_hierarchy)
+
+    # The hierarchies only have to be retrieved again if they changed.
+    if structure or dropped_hierarchies:
+        java_api.refresh()
+        existing_hierarchies = java_api.retrieve_hierarchies(cube)
+
+    has_updated_hierarchies = False
+    for hierarchy in hierarchies:
+        existing_hierarchy = existing_hierarchies[
+            (hierarchy["dimension"], hierarchy["name"])
+        ]
+        if hierarchy["slicing"] != existing_hierarchy.slicing:
+            java_api.update_hierarchy_slicing(existing_hierarchy, hierarchy["slicing"])
+            has_updated_hierarchies = True
+        if hierarchy["visible"] != existing_hierarchy.visible:
+            java_api.set_hierarchy_visibility(
+                cube=cube,
+                dimension=hierarchy["dimension"],
+                name=hierarchy["name"],
+                visible=hierarchy["visible"],
+            )
+            has_updated_hierarchies = True
+        for level_name, level in existing_hierarchy.levels.items():
+            comparator_name, first_members = hierarchy["comparators"].get(
+                level_name, [ASCENDING._name, None]
+            )
+            comparator = Comparator(
+                comparator_name,
+                _deserialize_value(first_members, cube=cube, session=cube._session),
+            )
+            if comparator != level.comparator:
+                level._comparator = comparator
+                java_api.update_level_comparator(level)
+                has_updated_hierarchies = True
+    if has_updated_hierarchies:
+        java_api.refresh()
+
+
+def _restore_measures(
+    cube: Cube, measures: Iterable[Mapping[str, Any]], *, skip_unchanged: bool
+) -> None:
+    java_api = cube._java_api
+    recorded_definitions = java_api.definition_journal.measures.get(cube.name, {})
+    with cube.measures.batch():
+        for measure in _sort_measures_by_dependencies(measures):
+            definition = measure["definition"]
+            if definition is None:
+                continue
+            if skip_unchanged and recorded_definitions.get(measure["name"]) == definition:
+                continue
+            cube.measures[measure["name"]] = _deserialize_value(
+                definition, cube=cube, session=cube._session
+            )
+
+    existing_descriptions = java_api.get_full_measures(cube)
+    has_updated_metadata = False
+    for measure in measures:
+        existing_description = existing_descriptions.get(measure["name"])
+        if existing_description is None:
+            continue
+        if (
+            measure["folder"] == existing_description.folder
+            and measure["formatter"] == existing_description.formatter
+            and measure["visible"] == existing_description.visible
+            and measure["description"] == existing_description.description
+        ):
+            continue
+        # Built from the fetched description instead of reading the cube measures again.
+        cube_measure = cube.measures._build_measure(
+            measure["name"], existing_description
+        )
+        if measure["folder"] != existing_description.folder:
+            java_api.set_measure_folder(
+                cube_name=cube.name, measure=cube_measure, folder=measure["folder"]
+            )
+        if measure["formatter"] != existing_description.formatter:
+            java_api.set_measure_formatter(
+                cube_name=cube.name,
+                measure=cube_measure,
+                formatter=measure["formatter"],
+            )
+        if measure["visible"] != existing_description.visible:
+            java_api.set_visible(
+                cube_name=cube.name, measure=cube_measure, visible=measure["visible"]
+            )
+        if measure["description"] != existing_description.description:
+            java_api.set_measure_description(
+                cube_name=cube.name,
+                measure=cube_measure,
+                description=measure["description"],
+            )
+        has_updated_metadata = True
+    if has_updated_metadata:
+        java_api.publish_measures(cube.name)
+
+
+def restore_definition(
+    session: Session, path: PathLike, *, skip_unchanged: bool = True
+) -> None:
+    """Recreate the structure described in a file written by :func:`export_definition`."""
+    definition = json.loads(Path(path).read_text(encoding="utf8"))
+    if definition.get("version") != DEFINITION_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported definition format version: {definition.get('version')}."
+        )
+
+    java_api = session._java_api
+    _restore_tables(session, definition["tables"], skip_unchanged=skip_unchanged)
+    _restore_joins(session, definition["joins"])
+    java_api.refresh()
+
+    existing_cube_names = {java_cube.getName() for java_cube in java_api.retrieve_cubes()}
+    created_cube_names = set()
+    for cube in definition["cubes"]:
+        if cube["name"] in existing_cube_names:
+            if not skip_unchanged:
+                raise ValueError(f"Cube {cube['name']} already exists.")
+            continue
+        java_api.create_cube_from_table(
+            table=session.tables[cube["base_table"]],
+            cube_name=cube["name"],
+            creation_mode=cube["mode"],
+        )
+        created_cube_names.add(cube["name"])
+    java_api.refresh()
+
+    for cube_definition in definition["cubes"]:
+        cube = session.cubes[cube_definition["name"]]
+        _restore_hierarchies(
+            cube,
+            cube_definition["hierarchies"],
+            # The hierarchies automatically created with a new cube but not in the definition were dropped before the export.
+            # Those of existing cubes might have been created by the user after.
+            drop_missing=cube.name in created_cube_names,
+            skip_unchanged=skip_unchanged,
+        )
+        _restore_measures(
+            cube, cube_definition["measures"], skip_unchanged=skip_unchanged
+        )
+
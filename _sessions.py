@@ -7,6 +7,7 @@ from typing import Any, Dict, Mapping, Optional, Type, Union
 
 from ._mappings import EMPTY_MAPPING, DelegateMutableMapping
 from ._repr_utils import ReprJson, ReprJsonable
+from ._server_pool import start_server_pool, stop_server_pool
 from ._type_utils import typecheck
 from .config import SessionConfig
 from .experimental._distributed.session import DistributedSession
@@ -119,6 +120,38 @@ class Sessions(DelegateMutableMapping[str, _Session], ReprJsonable):
         self[name] = query_session
         return query_session
 
+    @typecheck
+    def start_server_pool(
+        self, size: int = 1, *, config: Mapping[str, Any] = EMPTY_MAPPING
+    ) -> None:
+        """Start servers in the background to make the creation of the next sessions faster.
+
+        :meth:`create_session` takes a server from the pool instead of starting a new one when its *config* has the same :attr:`~atoti.config.session_config.SessionConfig.java_options`, :attr:`~atoti.config.session_config.SessionConfig.extra_jars`, and :attr:`~atoti.config.session_config.SessionConfig.logging` destination as the pool's *config*.
+        The other configuration options are applied once the server is taken from the pool.
+        Each server taken from the pool is replaced by a new one started in the background.
+
+        The servers of a previous pool are stopped.
+        Pooled servers are stopped when Python exits or when :meth:`stop_server_pool` is called.
+
+        Args:
+            size: The number of servers to keep ready.
+            config: The configuration used to start the servers.
+                It cannot have a :attr:`~atoti.config.session_config.SessionConfig.port`.
+
+        Example:
+
+          .. code-block::
+
+              tt.sessions.start_server_pool(2, config={"java_options": ["-Xmx4g"]})
+              # Takes a server that is already started.
+              session = tt.create_session(config={"java_options": ["-Xmx4g"]})
+        """
+        start_server_pool(config=SessionConfig._from_mapping(config or {}), size=size)
+
+    def stop_server_pool(self) -> None:
+        """Stop the servers started by :meth:`start_server_pool` that were not taken by a session."""
+        stop_server_pool()
+
     def _clear_duplicate_sessions(self, name: str):
         if name in self._sessions:
             logging.getLogger("atoti.session").warning(
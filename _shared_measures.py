@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .measure_description import MeasureDescription
+
+_LOGGER = logging.getLogger("atoti.measures")
+
+_SCALAR_TYPES = (type(None), bool, int, float, str, date, datetime, time)
+
+
+class _UnshareableError(Exception):
+    """Raised when a measure description holds a value without a canonical key."""
+
+
+def _get_attributes_key(value: Any, *, memo: Dict[int, Hashable]) -> Hashable:
+    return (
+        f"{type(value).__module__}.{type(value).__qualname__}",
+        tuple(
+            (attribute_name, _get_canonical_key(attribute_value, memo=memo))
+            for attribute_name, attribute_value in sorted(vars(value).items())
+            # The name is only set once the description has been distilled.
+            if attribute_name != "name"
+        ),
+    )
+
+
+def _get_canonical_key(  # pylint: disable=too-many-return-statements
+    value: Any, *, memo: Dict[int, Hashable]
+) -> Hashable:
+    """Return a hashable key equal for values defining the same measure.
+
+    Measure descriptions are not hashable since their ``__eq__`` creates a condition.
+    The keys of the descriptions are memoized by identity in *memo*, which must not outlive the value, since a sub-tree can be used several times in a tree.
+    """
+    from ._base._base_hierarchy import BaseHierarchy
+    from ._base._base_level import BaseLevel
+    from ._base._base_measure import BaseMeasure
+    from .column import Column
+    from .measure_description import MeasureDescription
+    from .table import Table
+
+    if isinstance(value, BaseMeasure):
+        return "measure", value.name
+    if isinstance(value, MeasureDescription):
+        key = memo.get(id(value))
+        if key is None:
+            key = _get_attributes_key(value, memo=memo)
+            memo[id(value)] = key
+        return key
+    if isinstance(value, (BaseLevel, BaseHierarchy)):
+        return type(value).__name__, value._java_description
+    if isinstance(value, Column):
+        return "column", value._table.name, value.name
+    if isinstance(value, Table):
+        return "table", value.name
+    if isinstance(value, Enum):
+        return type(value).__qualname__, value.name
+    if isinstance(value, _SCALAR_TYPES):
+        return type(value).__name__, value
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(
+            _get_canonical_key(item, memo=memo) for item in value
+        )
+    if isinstance(value, Mapping):
+        return "mapping", tuple(
+            (
+                _get_canonical_key(item_key, memo=memo),
+                _get_canonical_key(item_value, memo=memo),
+            )
+            for item_key, item_value in value.items()
+        )
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _get_attributes_key(value, memo=memo)
+    raise _UnshareableError(f"No canonical key for {value!r}.")
+
+
+@dataclass
+class SharedMeasure:
+    """A hidden measure reused by several measure definitions."""
+
+    definition: str
+    """Representation of the description of the measure."""
+
+    reuse_count: int = 0
+    """Number of times the measure has been reused instead of creating an identical one."""
+
+
+class SharedMeasures:
+    """Registry of the hidden measures created from measure descriptions, indexed by the canonical key of their description.
+
+    Identical sub-trees of measure definitions, such as the same ``m["a"] * m["b"]`` or ``tt.agg.sum(...)`` used in several measures, are then only created once.
+    Named measures are never shared since they can be redefined.
+    """
+
+    def __init__(self) -> None:
+        self._names: Dict[Tuple[str, Hashable], str] = {}
+        self._measures: Dict[Tuple[str, str], SharedMeasure] = {}
+        # Reentrant since creating a measure creates the hidden measures it depends on.
+        self._lock = RLock()
+
+    def get_or_create(
+        self,
+        measure: MeasureDescription,
+        *,
+        create: Callable[[], str],
+        cube_name: str,
+    ) -> str:
+        """Return the name of the hidden measure identical to the given one, calling *create* if there is none yet."""
+        try:
+            key: Optional[Tuple[str, Hashable]] = cube_name, _get_canonical_key(
+                measure, memo={}
+            )
+            hash(key)
+        except (_UnshareableError, TypeError):
+            key = None
+
+        if key is None:
+            return create()
+
+        with self._lock:
+            name = self._names.get(key)
+            if name is None:
+                name = create()
+                self._names[key] = name
+                self._measures[cube_name, name] = SharedMeasure(
+                    definition=repr(measure)
+                )
+            else:
+                shared_measure = self._measures[cube_name, name]
+                shared_measure.reuse_count += 1
+                _LOGGER.debug(
+                    "Reusing hidden measure %s for %s.",
+                    name,
+                    shared_measure.definition,
+                )
+            return name
+
+    def get_report(self, cube_name: str) -> Dict[str, SharedMeasure]:
+        """Return the hidden measures of the cube that have been reused at least once."""
+        return {
+            name: shared_measure
+            for (measure_cube_name, name), shared_measure in self._measures.items()
+            if measure_cube_name == cube_name and shared_measure.reuse_count
+        }
+
+    def forget_cube(self, cube_name: str) -> None:
+        """Forget the hidden measures of the cube since they do not exist anymore once it is deleted or replaced."""
+        with self._lock:
+            for key in [key for key in self._names if key[0] == cube_name]:
+                del self._names[key]
+            for key in [key for key in self._measures if key[0] == cube_name]:
+                del self._measures[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+            self._measures.clear()
@@ -0,0 +1,82 @@
+"""Benchmark of the time taken to create a session.
+
+Run it with ``python -m atoti._startup_benchmark``.
+Each repetition creates and closes a session in a new interpreter, alternating between servers started with and without the class data sharing archive.
+A first session is created beforehand to create the archive if it does not exist yet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess  # nosec
+import sys
+from typing import Dict, List, Mapping
+
+from typing_extensions import Final
+
+from ._class_data_sharing import DISABLE_CLASS_DATA_SHARING_ENV_VAR
+
+_PROBE: Final = """
+import json
+import time
+
+import atoti as tt
+
+start = time.perf_counter()
+session = tt.create_session()
+duration = time.perf_counter() - start
+session.close()
+print(json.dumps({"duration": duration}))
+"""
+
+_CASES: Final[Mapping[str, Mapping[str, str]]] = {
+    "without archive": {DISABLE_CLASS_DATA_SHARING_ENV_VAR: "True"},
+    "with archive": {DISABLE_CLASS_DATA_SHARING_ENV_VAR: "False"},
+}
+
+
+def _create_session(environment: Mapping[str, str]) -> float:
+    """Return the duration of the session creation in seconds."""
+    output = subprocess.run(  # nosec
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        check=True,
+        env={**os.environ, **environment},
+        text=True,
+    ).stdout
+    return float(json.loads(output.strip().splitlines()[-1])["duration"])
+
+
+def run_benchmark(*, repetitions: int = 5) -> Dict[str, List[float]]:
+    """Return the durations of the session creations in seconds for each case."""
+    _create_session(_CASES["with archive"])
+    results: Dict[str, List[float]] = {case_name: [] for case_name in _CASES}
+    for _ in range(repetitions):
+        for case_name, environment in _CASES.items():
+            results[case_name].append(_create_session(environment))
+    return results
+
+
+if __name__ == "__main__":
+    parser: Final = argparse.ArgumentParser(  # pylint: disable=invalid-name
+        description="Benchmark the creation of a session with and without class data sharing."
+    )
+    parser.add_argument(
+        "--repetitions",
+        default=5,
+        help="the number of sessions created per case",
+        type=int,
+    )
+    args: argparse.Namespace = parser.parse_args()
+    benchmark_results = run_benchmark(repetitions=args.repetitions)
+    medians = {
+        case_name: statistics.median(durations)
+        for case_name, durations in benchmark_results.items()
+    }
+    for case_name, median in medians.items():
+        print(f"{case_name}: {median:.3f}s")
+    gain = 1 - medians["with archive"] / medians["without archive"]
+    print(f"The class data sharing archive makes session creation {gain:.1%} faster.")
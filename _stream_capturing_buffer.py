@@ -1,31 +1,59 @@
 from io import StringIO, TextIOBase
-from threading import Thread
-from typing import IO
+from threading import Event, Thread
+from typing import IO, Match, Optional, Pattern
 
 
 class StreamCapturingBuffer(Thread):
-    """Capture the lines written to a stream and write them to the target stream and a buffer."""
+    """Capture the lines written to a stream and write them to the target stream and a buffer.
 
-    def __init__(self, *, input_stream: IO[str], output_stream: TextIOBase):
+    If a pattern is given, the first line matching it can be awaited with :meth:`wait_for_match`.
+    """
+
+    def __init__(
+        self,
+        *,
+        input_stream: IO[str],
+        output_stream: TextIOBase,
+        pattern: Optional[Pattern[str]] = None,
+    ):
         Thread.__init__(self, daemon=True)
         self._input_stream = input_stream
         self._output_stream = output_stream
         self._buffer = StringIO()
         self._write_to_buffer = True
         self._stopped = False
+        self._pattern = pattern
+        self._match: Optional[Match[str]] = None
+        # Set when the pattern is matched or when the input stream is closed.
+        self._match_event = Event()
 
     def run(self):
-        input_stream_lines_iterator = iter(self._input_stream.readline, b"")
-        for line in input_stream_lines_iterator:
-            self._write(line)
-            if self._stopped:
-                break
+        try:
+            # The input stream is in text mode: it returns an empty string once closed.
+            for line in iter(self._input_stream.readline, ""):
+                self._write(line)
+                if self._stopped:
+                    break
+        finally:
+            self._match_event.set()
 
     def _write(self, line: str):
         if self._write_to_buffer:
             self._buffer.write(line)
+        if self._pattern is not None and self._match is None:
+            self._match = self._pattern.search(line)
+            if self._match is not None:
+                self._match_event.set()
         self._output_stream.write(line)
 
+    def wait_for_match(self, *, timeout: float) -> Optional[Match[str]]:
+        """Block until a line matches the pattern and return the match.
+
+        Return ``None`` if the input stream was closed or the timeout expired before.
+        """
+        self._match_event.wait(timeout)
+        return self._match
+
     def skip_writing_to_buffer(self):
         self._write_to_buffer = False
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from ._java_api import JavaApi
+
+_T = TypeVar("_T")
+
+_MISSING = object()
+
+
+class TableMetadataCache:
+    """Cache of the schema, keys, and partitioning of the tables of a session.
+
+    This metadata does not depend on the scenario so all the scenarios of a table share it.
+    The cache is emptied as soon as the structure version of the session changes.
+
+    It can be used from several threads: values fetched while the version changed are returned but not cached.
+    """
+
+    def __init__(self, *, get_structure_version: Callable[[], int]):
+        self._get_structure_version = get_structure_version
+        self._structure_version = get_structure_version()
+        self._metadata: Dict[Tuple[str, str], Any] = {}
+        """Metadata indexed by table name and kind of metadata."""
+
+        self._lock = RLock()
+
+    def _clear_if_stale(self) -> int:
+        """Empty the cache if it is stale and return the version its content corresponds to."""
+        with self._lock:
+            structure_version = self._get_structure_version()
+            if structure_version != self._structure_version:
+                self._structure_version = structure_version
+                self._metadata.clear()
+            return structure_version
+
+    def _get(self, key: Tuple[str, str], fetch: Callable[[], _T]) -> _T:
+        structure_version = self._clear_if_stale()
+        value = self._metadata.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = fetch()
+        with self._lock:
+            if structure_version == self._structure_version:
+                self._metadata[key] = value
+        return value
+
+    def get_schema(
+        self,
+        table_name: str,
+        fetch_schema: Callable[[], Sequence[JavaApi.ColumnDescription]],
+    ) -> Sequence[JavaApi.ColumnDescription]:
+        """Return the description of the columns of the table, only fetching it if it is not cached."""
+        return self._get((table_name, "schema"), lambda: tuple(fetch_schema()))
+
+    def get_keys(
+        self, table_name: str, fetch_keys: Callable[[], Sequence[str]]
+    ) -> Sequence[str]:
+        """Return the names of the key columns of the table, only fetching them if they are not cached."""
+        return self._get((table_name, "keys"), lambda: tuple(fetch_keys()))
+
+    def get_partitioning(
+        self, table_name: str, fetch_partitioning: Callable[[], str]
+    ) -> str:
+        """Return the partitioning of the table, only fetching it if it is not cached."""
+        return self._get((table_name, "partitioning"), fetch_partitioning)
@@ -10,7 +10,6 @@ from abc import ABC
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from types import ModuleType
 from typing import Any, Callable, Optional
 from urllib.request import Request, urlopen
 from uuid import UUID, uuid4
@@ -20,7 +19,6 @@ from ._api_utils import (
     decorate,
     get_container_full_name,
     is_private_element,
-    walk_api,
 )
 from ._os_utils import get_env_flag
 from ._path_utils import get_atoti_home
@@ -200,6 +198,7 @@ def call_event_decorator(
         finally:
             call_tracker.tracking = False
 
+    setattr(function_wrapper, "_atoti_call_tracked", True)
     return function_wrapper
 
 
@@ -212,44 +211,32 @@ def _should_get_skipped(container: ContainerType, attribute_name: str) -> bool:
     )
 
 
-def _walk_telemetrized_api(
-    module: ModuleType,
-    *,
-    callback: Callable[[ContainerType, str], None],
-):
-    def _telemetry_filter(container: ContainerType, attribute_name: str) -> None:
-        if _should_get_skipped(container, attribute_name):
-            return
-        callback(container, attribute_name)
-
-    walk_api(module, callback=_telemetry_filter)
+_CALL_TRACKER = _CallTracker()
 
 
-def _instrument_call_tracking(
-    module: ModuleType,
+def instrument_call_tracking_callback(
+    container: ContainerType, attribute_name: str
 ) -> None:
-    call_tracker = _CallTracker()
-
-    def decorate_to_track_calls(container: ContainerType, attribute_name: str) -> None:
-        decorate(
-            container=container,
-            attribute_name=attribute_name,
-            decorator=call_event_decorator,
-            decorator_kwargs={
-                "tracked_container": container,
-                "call_tracker": call_tracker,
-            },
-        )
-
-    _walk_telemetrized_api(
-        module,
-        callback=decorate_to_track_calls,
+    """Decorate the function of the container to send an event each time it is called."""
+    if _should_get_skipped(container, attribute_name) or getattr(
+        getattr(container, attribute_name), "_atoti_call_tracked", False
+    ):
+        return
+    decorate(
+        container=container,
+        attribute_name=attribute_name,
+        decorator=call_event_decorator,
+        decorator_kwargs={
+            "tracked_container": container,
+            "call_tracker": _CALL_TRACKER,
+        },
     )
 
 
-def setup_telemetry(module: ModuleType) -> None:
+def setup_telemetry() -> bool:
+    """Send the import event and return whether the calls to the API should be tracked."""
     if disabled_by_atoti_plus() or disabled_by_environment_variable():
-        return
+        return False
 
     imported_at = datetime.now()
 
@@ -263,6 +250,6 @@ def setup_telemetry(module: ModuleType) -> None:
 
     _send_event_to_telemetry_service(import_event)
 
-    _instrument_call_tracking(module)
-
     atexit.register(_send_exit_event, imported_at=imported_at)
+
+    return True
@@ -1,24 +1,39 @@
+from __future__ import annotations
+
 import copy
 import functools
 import inspect
+import os
+from dataclasses import dataclass, replace
 from typing import (
+    IO,
+    TYPE_CHECKING,
     Any,
     Callable,
     Collection,
+    Dict,
     Generic,
+    List,
+    Mapping,
     Optional,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
+    get_type_hints,
     overload,
 )
 
 import typeguard
-from typing_extensions import Literal
+from typing_extensions import Literal, get_args
 
 from ._api_utils import ContainerType, walk_api
-from .measure import Measure
 from .type import DataType
 
+if TYPE_CHECKING:
+    # Only imported for type checking since importing measures loads most of the library.
+    from .measure import Measure
+
 # pylint: disable=invalid-name
 PercentileInterpolation = Literal["linear", "higher", "lower", "nearest", "midpoint"]
 PercentileIndexInterpolation = Literal["higher", "lower", "nearest"]
@@ -29,24 +44,30 @@ VarianceMode = Literal["sample", "population"]
 F = TypeVar("F", bound=Callable[..., Any])  # pylint: disable=invalid-name
 
 
+def instrument_typechecking_callback(container: ContainerType, attribute_name: str):
+    """Replace the function of the container with its typechecked version."""
+    func = getattr(container, attribute_name)
+
+    # Bound methods cannot be instrumented.
+    if inspect.ismethod(func) and not _is_typechecked(func):
+        raise RuntimeError(f"Missing type checking for bound method {func}")
+
+    new_func = typecheck()(func)
+    if new_func is not func:
+        setattr(container, attribute_name, new_func)
+
+
 def _instrument_typechecking(
     container: ContainerType,
     include_attribute: Optional[
         Callable[[ContainerType, str, Collection[str]], bool]
     ] = None,
 ):
-    def callback(container: ContainerType, attribute_name: str):
-        func = getattr(container, attribute_name)
-
-        # Bound methods cannot be instrumented.
-        if inspect.ismethod(func) and not _is_typechecked(func):
-            raise RuntimeError(f"Missing type checking for bound method {func}")
-
-        new_func = typecheck()(func)
-        if new_func is not func:
-            setattr(container, attribute_name, new_func)
-
-    walk_api(container, callback=callback, include_attribute=include_attribute)
+    walk_api(
+        container,
+        callback=instrument_typechecking_callback,
+        include_attribute=include_attribute,
+    )
 
 
 def _is_typechecked(func: Callable[..., Any]) -> bool:
@@ -101,6 +122,61 @@ def typecheck(  # type: ignore
     raise TypeError(f"Unexpected type {type(target)} of {target}")
 
 
+TypecheckMode = Literal["full", "sampled", "disabled"]
+
+TYPECHECK_MODE_ENV_VAR = "ATOTI_TYPECHECK_MODE"
+"""How the arguments of the public functions are checked:
+
+* ``"full"``, the default, checks them on every call.
+* ``"sampled"`` only checks one call out of ``$ATOTI_TYPECHECK_SAMPLING_PERIOD`` (defaults to 100) of each function.
+* ``"disabled"`` does not wrap the functions at all.
+"""
+
+TYPECHECK_SAMPLING_PERIOD_ENV_VAR = "ATOTI_TYPECHECK_SAMPLING_PERIOD"
+
+_DEFAULT_TYPECHECK_SAMPLING_PERIOD = 100
+
+
+@dataclass
+class _TypecheckConfig:
+    mode: TypecheckMode
+    sampling_period: int
+
+
+def _get_typecheck_config_from_environment() -> _TypecheckConfig:
+    mode = os.environ.get(TYPECHECK_MODE_ENV_VAR, "full")
+    if mode not in get_args(TypecheckMode):
+        raise ValueError(
+            f"Unexpected value for {TYPECHECK_MODE_ENV_VAR}: {mode}, expected one of {get_args(TypecheckMode)}."
+        )
+    return _TypecheckConfig(
+        mode=mode,  # type: ignore
+        sampling_period=int(
+            os.environ.get(
+                TYPECHECK_SAMPLING_PERIOD_ENV_VAR, _DEFAULT_TYPECHECK_SAMPLING_PERIOD
+            )
+        ),
+    )
+
+
+_TYPECHECK_CONFIG = _get_typecheck_config_from_environment()
+
+
+def set_typecheck_mode(
+    mode: TypecheckMode,
+    *,
+    sampling_period: int = _DEFAULT_TYPECHECK_SAMPLING_PERIOD,
+) -> None:
+    """Change how the arguments of the typechecked functions are checked.
+
+    Functions decorated while the mode was ``"disabled"`` were not wrapped and are never checked.
+    """
+    if sampling_period < 1:
+        raise ValueError("The sampling period must be strictly positive.")
+    _TYPECHECK_CONFIG.mode = mode
+    _TYPECHECK_CONFIG.sampling_period = sampling_period
+
+
 def _typecheck_function(
     *, ignored_params: Optional[Collection[str]] = None
 ) -> Callable[[F], F]:
@@ -118,6 +194,10 @@ def _typecheck_function(
         if _is_typechecked(func):
             # Already typechecked.
             return func
+        if _TYPECHECK_CONFIG.mode == "disabled":
+            # Marked anyway so that bound methods are not reported as missing type checking.
+            _mark_typechecked(func)
+            return func
 
         # Create and return the wrapper.
         return _TypecheckWrapperFactory(func, ignored_params).create_wrapper()
@@ -151,6 +231,137 @@ def _typecheck_class(clazz: type) -> type:
     return clazz
 
 
+def _get_isinstance_classes(hint: Any) -> Optional[Tuple[type, ...]]:
+    """Return classes such that values instance of one of them match the hint, or ``None`` if only typeguard can tell.
+
+    Values that are not instances of these classes can still match the hint: they are then checked by typeguard.
+    """
+    if hint is Any:
+        return (object,)
+    if getattr(hint, "__origin__", None) is Union:
+        classes: List[type] = []
+        for arg in hint.__args__:
+            classes.extend(_get_isinstance_classes(arg) or ())
+        return tuple(classes) or None
+    if not inspect.isclass(hint) or getattr(hint, "__origin__", None) is not None:
+        return None
+    # typeguard checks the fields of named tuples and typed dicts, the members of protocols, and the mode of IOs.
+    if (
+        issubclass(hint, (tuple, IO))
+        or getattr(hint, "_is_protocol", False)
+        or (issubclass(hint, dict) and hasattr(hint, "__total__"))
+    ):
+        return None
+    # Integers are accepted for floats and complex numbers.
+    if hint is float:
+        return (float, int)
+    if hint is complex:
+        return (complex, float, int)
+    return (hint,)
+
+
+@dataclass(frozen=True)
+class _ParameterCheck:
+    name: str
+    hint: Any
+    isinstance_classes: Optional[Tuple[type, ...]]
+    variadic: bool = False
+
+
+class _ArgumentsValidator:
+    """Check the arguments of a function against its type hints.
+
+    The signature and type hints are resolved on the first call rather than when the function is decorated since they can reference types defined later in the module.
+    Arguments are first checked with :func:`isinstance` against the classes in their hint, typeguard is only called when this check cannot accept them.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        self._func = func
+        self._positional_checks: Optional[List[Optional[_ParameterCheck]]] = None
+        self._keyword_checks: Dict[str, Optional[_ParameterCheck]] = {}
+        self._var_positional_check: Optional[_ParameterCheck] = None
+        self._var_keyword_check: Optional[_ParameterCheck] = None
+        self._memo: Optional[Any] = None
+
+    def _resolve(self) -> List[Optional[_ParameterCheck]]:
+        type_hints = get_type_hints(self._func)
+        positional_checks: List[Optional[_ParameterCheck]] = []
+        for parameter in inspect.signature(self._func).parameters.values():
+            hint = type_hints.get(parameter.name)
+            check = (
+                None
+                if hint is None
+                else _ParameterCheck(
+                    name=parameter.name,
+                    hint=hint,
+                    isinstance_classes=_get_isinstance_classes(hint),
+                )
+            )
+            if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                self._var_positional_check = (
+                    None if check is None else replace(check, variadic=True)
+                )
+            elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                self._var_keyword_check = (
+                    None if check is None else replace(check, variadic=True)
+                )
+            else:
+                if parameter.kind != inspect.Parameter.KEYWORD_ONLY:
+                    positional_checks.append(check)
+                if parameter.kind != inspect.Parameter.POSITIONAL_ONLY:
+                    self._keyword_checks[parameter.name] = check
+        self._memo = typeguard._TypeCheckMemo(  # pylint: disable=protected-access
+            self._func.__globals__, {}
+        )
+        self._positional_checks = positional_checks
+        return positional_checks
+
+    def _check(self, check: Optional[_ParameterCheck], value: Any) -> None:
+        if check is None:
+            return
+        classes = check.isinstance_classes
+        hint = check.hint
+        if not check.variadic:
+            if classes is not None and isinstance(value, classes):
+                return
+        else:
+            items = value.values() if isinstance(value, dict) else value
+            if classes is not None and all(
+                isinstance(item, classes) for item in items
+            ):
+                return
+            hint = (
+                Dict[str, hint]  # type: ignore
+                if isinstance(value, dict)
+                else Tuple[hint, ...]  # type: ignore
+            )
+        try:
+            typeguard.check_type(f'argument "{check.name}"', value, hint, self._memo)
+        except TypeError as error:
+            # Suppress the long traceback of typeguard.
+            raise TypeError(*error.args) from None
+
+    def validate(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> None:
+        positional_checks = self._positional_checks
+        if positional_checks is None:
+            positional_checks = self._resolve()
+
+        for index, value in enumerate(args[: len(positional_checks)]):
+            self._check(positional_checks[index], value)
+        if len(args) > len(positional_checks):
+            # Calling the function will raise an error if it does not take variadic arguments.
+            self._check(self._var_positional_check, tuple(args[len(positional_checks) :]))
+
+        var_keyword_arguments = {}
+        for name, value in kwargs.items():
+            if name in self._keyword_checks:
+                self._check(self._keyword_checks[name], value)
+            else:
+                var_keyword_arguments[name] = value
+        if var_keyword_arguments:
+            self._check(self._var_keyword_check, var_keyword_arguments)
+
+
 class _TypecheckWrapperFactory(Generic[F]):
     def __init__(self, func: F, ignored_params: Optional[Collection[str]]) -> None:
         self._func = func
@@ -175,15 +386,26 @@ class _TypecheckWrapperFactory(Generic[F]):
             )
 
     def create_wrapper(self) -> Any:
+        func = self._func
+        validator = _ArgumentsValidator(self._ts_func)
+        call_count = 0
+
         # Create the wrapper function.
-        @functools.wraps(self._func)
+        @functools.wraps(func)
         def typechecked_func_wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal call_count
+
             # Perform typechecking on the input arguments.
-            memo = typeguard._CallMemo(func=self._ts_func, args=args, kwargs=kwargs)
-            typeguard.check_argument_types(memo)
+            mode = _TYPECHECK_CONFIG.mode
+            if mode == "full":
+                validator.validate(args, kwargs)
+            elif mode == "sampled":
+                if call_count % _TYPECHECK_CONFIG.sampling_period == 0:
+                    validator.validate(args, kwargs)
+                call_count += 1
 
             # Call the actual function.
-            return self._func(*args, **kwargs)
+            return func(*args, **kwargs)
 
         # Mark the function as typechecked and return it.
         _mark_typechecked(typechecked_func_wrapper)
@@ -0,0 +1,115 @@
+"""Benchmark of the overhead of runtime type checking per call.
+
+Run it with ``python -m atoti._typecheck_benchmark``.
+Each signature is called with valid arguments without type checking, with the previous implementation building a ``typeguard._CallMemo`` on every call, and with each :data:`atoti._type_utils.TypecheckMode`.
+The ``"disabled"`` column measures functions disabled after being decorated: functions decorated while the mode is ``"disabled"`` are not wrapped and have no overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date
+from timeit import timeit
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Union
+
+import typeguard
+from typing_extensions import Final, get_args
+
+from ._type_utils import (
+    _TYPECHECK_CONFIG,
+    TypecheckMode,
+    set_typecheck_mode,
+    typecheck,
+)
+
+
+def _no_parameters() -> None:
+    ...
+
+
+def _scalars(name: str, index: int, visible: bool = True) -> None:
+    ...
+
+
+def _unions(key: Union[str, int], value: Optional[Union[date, float, str]]) -> None:
+    ...
+
+
+def _generics(names: Sequence[str], mapping: Mapping[str, Iterable[int]]) -> None:
+    ...
+
+
+def _variadic(*values: str, **options: int) -> None:
+    ...
+
+
+_CASES: Final[Dict[str, Any]] = {
+    "no parameters": (_no_parameters, (), {}),
+    "scalars": (_scalars, ("Price", 3), {"visible": False}),
+    "unions": (_unions, ("Price",), {"value": 1.5}),
+    "generics": (_generics, (["a", "b"],), {"mapping": {"a": [1, 2, 3]}}),
+    "variadic": (_variadic, ("a", "b", "c"), {"x": 1, "y": 2}),
+}
+
+
+def _with_call_memo(func: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        memo = typeguard._CallMemo(  # pylint: disable=protected-access
+            func=func, args=args, kwargs=kwargs
+        )
+        typeguard.check_argument_types(memo)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _measure(func: Callable[..., Any], args: Any, kwargs: Any, *, number: int) -> float:
+    """Return the duration of a call in microseconds."""
+    return timeit(lambda: func(*args, **kwargs), number=number) / number * 1e6
+
+
+def run_benchmark(*, number: int = 100_000) -> Dict[str, Dict[str, float]]:
+    """Return the duration of a call in microseconds for each case and implementation.
+
+    The type checking configuration is restored once done.
+    """
+    previous_mode = _TYPECHECK_CONFIG.mode
+    previous_sampling_period = _TYPECHECK_CONFIG.sampling_period
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for name, (func, args, kwargs) in _CASES.items():
+            results[name] = {
+                "unchecked": _measure(func, args, kwargs, number=number),
+                "call memo": _measure(
+                    _with_call_memo(func), args, kwargs, number=number
+                ),
+            }
+            # Functions decorated while type checking is disabled are not wrapped.
+            set_typecheck_mode("full")
+            typechecked_func = typecheck(func)
+            for mode in get_args(TypecheckMode):
+                set_typecheck_mode(mode)
+                results[name][mode] = _measure(
+                    typechecked_func, args, kwargs, number=number
+                )
+    finally:
+        set_typecheck_mode(previous_mode, sampling_period=previous_sampling_period)
+    return results
+
+
+if __name__ == "__main__":
+    parser: Final = argparse.ArgumentParser(  # pylint: disable=invalid-name
+        description="Benchmark the overhead of runtime type checking per call."
+    )
+    parser.add_argument(
+        "--number", default=100_000, help="the number of calls per case", type=int
+    )
+    args: argparse.Namespace = parser.parse_args()
+    benchmark_results = run_benchmark(number=args.number)
+    columns = list(next(iter(benchmark_results.values())))
+    print(f"{'µs per call':<16}" + "".join(f"{column:>12}" for column in columns))
+    for case_name, durations in benchmark_results.items():
+        print(
+            f"{case_name:<16}"
+            + "".join(f"{durations[column]:>12.2f}" for column in columns)
+        )
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from threading import Lock
-from typing import Sequence
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, List, Optional, Sequence
 
 from ._java_api import JavaApi
-from ._operation import Operation
+from ._operation import (
+    ColumnOperation,
+    ConstantOperation,
+    JavaFunctionOperation,
+    Operation,
+    TernaryOperation,
+)
+from ._os_utils import get_env_flag
+from ._path_utils import get_atoti_home
 from ._udaf_utils import (
     LongAggregationOperationVisitor,
     MaxAggregationOperationVisitor,
@@ -16,8 +29,15 @@ from ._udaf_utils import (
     SquareSumAggregationOperationVisitor,
     SumAggregationOperationVisitor,
 )
-from ._udaf_utils.java_operation_visitor import OperationVisitor
+from ._udaf_utils.java_function import (
+    CustomJavaFunction,
+    ExistingJavaFunction,
+    JavaFunction,
+)
+from ._udaf_utils.java_operation_visitor import JavaOperation, OperationVisitor
+from ._version import VERSION
 from .column import Column
+from .type import DataType
 
 OPERATION_VISITORS = {
     "SUM": SumAggregationOperationVisitor,
@@ -31,18 +51,156 @@ OPERATION_VISITORS = {
     "SINGLE_VALUE_NULLABLE": SingleValueNullableAggregationOperationVisitor,
 }
 
+DISABLE_UDAF_CACHE_ENV_VAR = "ATOTI_DISABLE_UDAF_CACHE"
+
+# Bumped each time the generated Java code changes so that stale cached sources are not reused.
+_CODE_GENERATION_VERSION = 2
+
+_LOGGER = logging.getLogger("atoti.udaf")
+
+
+def _get_cache_directory() -> Path:
+    return get_atoti_home() / "cache" / "udaf"
+
+
+def _describe_data_type(data_type: DataType) -> List[Any]:
+    return [data_type.java_type, data_type.nullable]
+
+
+def _describe_java_function(java_function: JavaFunction) -> List[Any]:
+    if isinstance(java_function, ExistingJavaFunction):
+        return [
+            "existing",
+            java_function.method_call_string,
+            java_function.import_package,
+        ]
+    if isinstance(java_function, CustomJavaFunction):
+        # The method name is left out since it is suffixed with the creation time of the function.
+        return [
+            "custom",
+            java_function.method_body,
+            [
+                [[name, *_describe_data_type(data_type)] for name, data_type in inputs]
+                for inputs in java_function.inputs
+            ],
+            _describe_data_type(java_function.output_type),
+            sorted(java_function.additional_imports or ()),
+        ]
+    raise TypeError(f"Unsupported Java function: {java_function}")
+
+
+def _describe_operation(operation: Operation, column_names: Sequence[str]) -> Any:
+    """Describe the operation with JSON values independent from the names of its columns.
+
+    Columns are replaced by their index and their type since that is all the generated Java code depends on.
+    """
+    if isinstance(operation, ColumnOperation):
+        return [
+            "column",
+            column_names.index(operation._column.name),
+            *_describe_data_type(operation._column.data_type),
+        ]
+    if isinstance(operation, ConstantOperation):
+        return ["constant", type(operation._value).__name__, repr(operation._value)]
+    if isinstance(operation, TernaryOperation):
+        return [
+            "ternary",
+            _describe_operation(operation.condition, column_names),
+            _describe_operation(operation.true_operation, column_names),
+            None
+            if operation.false_operation is None
+            else _describe_operation(operation.false_operation, column_names),
+        ]
+    if isinstance(operation, JavaFunctionOperation):
+        return [
+            "function",
+            _describe_java_function(operation.java_function),
+            [
+                _describe_operation(underlying, column_names)
+                for underlying in operation.underlyings
+            ],
+        ]
+    raise TypeError(f"Unsupported operation: {operation}")
+
+
+def _get_canonical_hash(
+    operation: Operation, *, agg_fun: str, column_names: Sequence[str]
+) -> str:
+    description = [
+        VERSION,
+        _CODE_GENERATION_VERSION,
+        agg_fun,
+        _describe_operation(operation, column_names),
+    ]
+    return hashlib.sha256(
+        json.dumps(description, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:32]
+
+
+def _java_operation_to_json(java_operation: JavaOperation) -> Any:
+    return {
+        "additional_imports": sorted(java_operation.additional_imports),
+        "additional_methods_source_codes": sorted(
+            java_operation.additional_methods_source_codes
+        ),
+        "contribute_source_code": java_operation.contribute_source_code,
+        "buffer_types": [
+            _describe_data_type(data_type) for data_type in java_operation.buffer_types
+        ],
+        "decontribute_source_code": java_operation.decontribute_source_code,
+        "merge_source_code": java_operation.merge_source_code,
+        "output_type": _describe_data_type(java_operation.output_type),
+        "terminate_source_code": java_operation.terminate_source_code,
+    }
+
+
+def _java_operation_from_json(value: Any) -> JavaOperation:
+    return JavaOperation(
+        additional_imports=value["additional_imports"],
+        additional_methods_source_codes=value["additional_methods_source_codes"],
+        contribute_source_code=value["contribute_source_code"],
+        buffer_types=[
+            DataType(java_type=java_type, nullable=nullable)
+            for java_type, nullable in value["buffer_types"]
+        ],
+        decontribute_source_code=value["decontribute_source_code"],
+        merge_source_code=value["merge_source_code"],
+        output_type=DataType(
+            java_type=value["output_type"][0], nullable=value["output_type"][1]
+        ),
+        terminate_source_code=value["terminate_source_code"],
+    )
+
 
-class AtomicCounter:
-    """Threadsafe counter to get unique IDs."""
+def _read_cached_java_operation(canonical_hash: str) -> Optional[JavaOperation]:
+    if get_env_flag(DISABLE_UDAF_CACHE_ENV_VAR):
+        return None
+    path = _get_cache_directory() / f"{canonical_hash}.json"
+    try:
+        return _java_operation_from_json(json.loads(path.read_text(encoding="utf8")))
+    except FileNotFoundError:
+        return None
+    except (KeyError, OSError, TypeError, ValueError):
+        _LOGGER.debug("Ignoring invalid cached UDAF %s.", path, exc_info=True)
+        return None
 
-    def __init__(self):
-        self._value = 0
-        self._lock = Lock()
 
-    def read_and_increment(self) -> int:
-        with self._lock:
-            self._value += 1
-            return self._value
+def _write_cached_java_operation(
+    canonical_hash: str, java_operation: JavaOperation
+) -> None:
+    if get_env_flag(DISABLE_UDAF_CACHE_ENV_VAR):
+        return
+    directory = _get_cache_directory()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so that concurrent sessions never read a partial file.
+        with NamedTemporaryFile(
+            "w", dir=directory, delete=False, encoding="utf8", suffix=".tmp"
+        ) as file:
+            json.dump(_java_operation_to_json(java_operation), file)
+        os.replace(file.name, directory / f"{canonical_hash}.json")
+    except OSError:
+        _LOGGER.debug("Could not cache UDAF %s.", canonical_hash, exc_info=True)
 
 
 class UserDefinedAggregateFunction:
@@ -50,6 +208,9 @@ class UserDefinedAggregateFunction:
 
     This class parses the combination of operations passed and converts them into Java source code blocks.
     These source code blocks are then compiled using Javassist into a new aggregation function which is then registered on the session.
+
+    The plugin key is a hash of the operation tree, the aggregation function, and the column types so identical definitions share the same compiled class, even when they are on different columns.
+    The generated source code is also cached in the atoti home directory so that new sessions skip generating it.
     """
 
     _agg_fun: str
@@ -58,7 +219,6 @@ class UserDefinedAggregateFunction:
     column_names: Sequence[str]
     _java_api: JavaApi
     plugin_key: str
-    _id_provider = AtomicCounter()
 
     def __init__(self, operation: Operation, agg_fun: str):
         self._operation = operation
@@ -66,18 +226,33 @@ class UserDefinedAggregateFunction:
         self.column_names = [column.name for column in self._columns]
         self._agg_fun = agg_fun
         self._java_api = self._columns[0]._table._java_api
-        self.plugin_key = f"{''.join(self.column_names)}{UserDefinedAggregateFunction._id_provider.read_and_increment()}.{agg_fun}"
+        self._canonical_hash = _get_canonical_hash(
+            operation, agg_fun=agg_fun, column_names=self.column_names
+        )
+        self.plugin_key = f"udaf{self._canonical_hash}.{agg_fun}"
 
-    def register_aggregation_function(self):
-        """Generate the required Java source code blocks and pass them to the Java process to be compiled into a new UserDefinedAggregateFunction."""
-        visitor_class = OPERATION_VISITORS[self._agg_fun]
+    def _build_java_operation(self) -> JavaOperation:
+        visitor_class = OPERATION_VISITORS.get(self._agg_fun)
         if visitor_class is None:
             raise ValueError("Unsupported aggregation function " + self._agg_fun)
         visitor: OperationVisitor = visitor_class(
             column_names=self.column_names, java_api=self._java_api
         )
+        return visitor.build_java_operation(self._operation)
+
+    def register_aggregation_function(self):
+        """Generate the required Java source code blocks and pass them to the Java process to be compiled into a new UserDefinedAggregateFunction.
+
+        Nothing is done if an identical function was already registered on the session.
+        """
+        if self._java_api.is_aggregation_function_registered(self.plugin_key):
+            return
+
+        java_operation = _read_cached_java_operation(self._canonical_hash)
+        if java_operation is None:
+            java_operation = self._build_java_operation()
+            _write_cached_java_operation(self._canonical_hash, java_operation)
 
-        java_operation = visitor.build_java_operation(self._operation)
         self._java_api.register_aggregation_function(
             additional_imports=java_operation.additional_imports,
             additional_methods=java_operation.additional_methods_source_codes,
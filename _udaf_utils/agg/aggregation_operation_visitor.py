@@ -15,6 +15,7 @@ from ..._operation import (
     TernaryOperation,
 )
 from ...type import DataType
+from ..array_fusion import fuse_array_operation
 from ..java_operation_element import (
     BasicJavaOperationElement,
     JavaOperationElement,
@@ -119,6 +120,11 @@ class AggregationOperationVisitor(OperationVisitor, ABC):
                 column, self.column_names.index(name)
             ),
             _output_type=column.data_type,
+            fused_array_expression=fuse_array_operation(
+                operation,
+                column_names=self.column_names,
+                output_type=column.data_type,
+            ),
         )
 
     def visit_constant_operation(  # pylint: disable=no-self-use
@@ -191,9 +197,13 @@ class AggregationOperationVisitor(OperationVisitor, ABC):
         java_source_code = java_function.get_java_source_code(
             *operation_elements, java_api=self.java_api
         )
+        output_type = java_function.get_output_type_function()(
+            operation_elements, self.java_api
+        )
         return BasicJavaOperationElement(
             java_source_code=java_source_code,
-            _output_type=java_function.get_output_type_function()(
-                operation_elements, self.java_api
+            _output_type=output_type,
+            fused_array_expression=fuse_array_operation(
+                operation, column_names=self.column_names, output_type=output_type
             ),
         )
@@ -79,9 +79,28 @@ class MeanAggregationOperationVisitor(AggregationOperationVisitor):
             }}
         """
         )
+        # Only the first contribution allocates a vector, the next ones are accumulated in place.
+        fused_array_code = dedent(
+            """\
+            if (aggregationBuffer.isNull(0)) {{
+                aggregationBuffer.write(0, {java_source_code});
+                aggregationBuffer.addInt(1, 1);
+            }} else {{
+                {declarations}
+                if ({not_null_condition}) {{
+                    IVector buffer = aggregationBuffer.readWritableVector(0);
+                    for (int i = 0, size = buffer.size(); i < size; ++i) {{
+                        buffer.write{element_accessor}(i, buffer.read{element_accessor}(i) + {element_code});
+                    }}
+                    aggregationBuffer.addInt(1, 1);
+                }}
+            }}
+        """
+        )
         body = operation_element.get_java_source_code(
             numeric_code=numeric_code,
             array_code=array_code,
+            fused_array_code=fused_array_code,
         )
         return CONTRIBUTE_TEMPLATE.format(body=body)
 
@@ -102,9 +121,24 @@ class MeanAggregationOperationVisitor(AggregationOperationVisitor):
             }}
         """
         )
+        fused_array_code = dedent(
+            """\
+            if (!aggregationBuffer.isNull(0)) {{
+                {declarations}
+                if ({not_null_condition}) {{
+                    IVector buffer = aggregationBuffer.readWritableVector(0);
+                    for (int i = 0, size = buffer.size(); i < size; ++i) {{
+                        buffer.write{element_accessor}(i, buffer.read{element_accessor}(i) - {element_code});
+                    }}
+                    aggregationBuffer.addInt(1, -1);
+                }}
+            }}
+        """
+        )
         body = operation_element.get_java_source_code(
             numeric_code=numeric_code,
             array_code=array_code,
+            fused_array_code=fused_array_code,
         )
         return DECONTRIBUTE_TEMPLATE.format(body=body)
 
@@ -47,9 +47,26 @@ class SumAggregationOperationVisitor(AggregationOperationVisitor):
             }}
         """
         )
+        # Only the first contribution allocates a vector, the next ones are accumulated in place.
+        fused_array_code = dedent(
+            """\
+            if (aggregationBuffer.isNull(0)) {{
+                aggregationBuffer.write(0, {java_source_code});
+            }} else {{
+                {declarations}
+                if ({not_null_condition}) {{
+                    IVector buffer = aggregationBuffer.readWritableVector(0);
+                    for (int i = 0, size = buffer.size(); i < size; ++i) {{
+                        buffer.write{element_accessor}(i, buffer.read{element_accessor}(i) + {element_code});
+                    }}
+                }}
+            }}
+        """
+        )
         body = operation_element.get_java_source_code(
             numeric_code=numeric_code,
             array_code=array_code,
+            fused_array_code=fused_array_code,
         )
         return CONTRIBUTE_TEMPLATE.format(body=body)
 
@@ -71,9 +88,23 @@ class SumAggregationOperationVisitor(AggregationOperationVisitor):
                 aggregationBuffer.readWritableVector(0).minus({java_source_code});
             }}
         """
+        fused_array_code = dedent(
+            """\
+            if (!aggregationBuffer.isNull(0)) {{
+                {declarations}
+                if ({not_null_condition}) {{
+                    IVector buffer = aggregationBuffer.readWritableVector(0);
+                    for (int i = 0, size = buffer.size(); i < size; ++i) {{
+                        buffer.write{element_accessor}(i, buffer.read{element_accessor}(i) - {element_code});
+                    }}
+                }}
+            }}
+        """
+        )
         body = operation_element.get_java_source_code(
             numeric_code=numeric_code,
             array_code=array_code,
+            fused_array_code=fused_array_code,
         )
         return DECONTRIBUTE_TEMPLATE.format(body=body)
 
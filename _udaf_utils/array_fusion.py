@@ -0,0 +1,186 @@
+"""Fusion of element-wise array operations into a single loop.
+
+Calling ``ArithmeticOperator`` methods on vectors allocates a new vector for each intermediate result.
+When an operation only combines numeric array columns, numeric scalar columns, and constants with ``+``, ``-``, ``*``, and ``/``, its i-th element can instead be computed directly from the i-th elements of the read vectors and accumulated in place into the aggregation buffer.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from .._operation import (
+    ColumnOperation,
+    ConstantOperation,
+    JavaFunctionOperation,
+    Operation,
+)
+from ..type import (
+    DOUBLE,
+    DOUBLE_ARRAY,
+    FLOAT,
+    FLOAT_ARRAY,
+    INT,
+    INT_ARRAY,
+    LONG,
+    LONG_ARRAY,
+    DataType,
+)
+from .functions.arithmetic_functions import (
+    ADD_FUNCTION,
+    MUL_FUNCTION,
+    SUB_FUNCTION,
+    TRUEDIV_FUNCTION,
+)
+
+_ELEMENT_TYPES: Dict[str, DataType] = {
+    DOUBLE_ARRAY.java_type: DOUBLE,
+    FLOAT_ARRAY.java_type: FLOAT,
+    LONG_ARRAY.java_type: LONG,
+    INT_ARRAY.java_type: INT,
+}
+
+# Numeric types ordered by Java widening conversions.
+_SCALAR_TYPES = [INT.java_type, LONG.java_type, FLOAT.java_type, DOUBLE.java_type]
+
+_OPERATORS = {
+    id(ADD_FUNCTION): "+",
+    id(MUL_FUNCTION): "*",
+    id(SUB_FUNCTION): "-",
+    id(TRUEDIV_FUNCTION): "/",
+}
+
+
+@dataclass(frozen=True)
+class FusedArrayExpression:
+    """Java code computing an array operation one element at a time."""
+
+    declarations: Sequence[str]
+    """Statements reading the vectors and scalars used by the element code."""
+
+    vector_names: Sequence[str]
+    """Names of the declared vectors, which are ``null`` when the fact has no value."""
+
+    element_type: DataType
+    """Type of the elements of the operation's output."""
+
+    element_code: str
+    """Java expression of the element at index ``i`` of the operation's output."""
+
+    def format(self, template: str, *, java_source_code: str) -> str:
+        """Fill the template.
+
+        Besides ``java_source_code``, which computes the whole array, the template can use ``declarations``, ``not_null_condition``, ``element_accessor`` (e.g. ``Double``), and ``element_code``.
+        """
+        return template.format(
+            declarations="\n".join(self.declarations),
+            element_accessor=self.element_type.java_type.capitalize(),
+            element_code=self.element_code,
+            java_source_code=java_source_code,
+            not_null_condition=" && ".join(
+                f"{vector_name} != null" for vector_name in self.vector_names
+            ),
+        )
+
+
+@dataclass
+class _Fuser:
+    column_names: Sequence[str]
+    element_type: DataType
+    declarations: List[str] = field(default_factory=list)
+    vector_names: List[str] = field(default_factory=list)
+    _names: Dict[int, str] = field(default_factory=dict)
+
+    def _cast(self, code: str, java_type: str) -> Optional[str]:
+        if java_type == self.element_type.java_type:
+            return code
+        if _SCALAR_TYPES.index(java_type) > _SCALAR_TYPES.index(
+            self.element_type.java_type
+        ):
+            # Narrowing would silently change the results.
+            return None
+        return f"(({self.element_type.java_type}) {code})"
+
+    def _visit_column(self, operation: ColumnOperation) -> Optional[str]:
+        data_type = operation._column.data_type
+        index = self.column_names.index(operation._column.name)
+        name = self._names.get(index)
+
+        vector_element_type = _ELEMENT_TYPES.get(data_type.java_type)
+        if vector_element_type is not None:
+            if name is None:
+                name = f"vector{index}"
+                self._names[index] = name
+                self.declarations.append(
+                    f"IVector {name} = fact.isNull({index}) ? null : fact.readVector({index});"
+                )
+                self.vector_names.append(name)
+            return self._cast(
+                f"{name}.read{vector_element_type.java_type.capitalize()}(i)",
+                vector_element_type.java_type,
+            )
+
+        if data_type.java_type not in _SCALAR_TYPES:
+            return None
+        if name is None:
+            name = f"scalar{index}"
+            self._names[index] = name
+            self.declarations.append(
+                f"{data_type.java_type} {name} = fact.read{data_type.java_type.capitalize()}({index});"
+            )
+        return self._cast(name, data_type.java_type)
+
+    def visit(self, operation: Operation) -> Optional[str]:
+        if isinstance(operation, ColumnOperation):
+            return self._visit_column(operation)
+
+        if isinstance(operation, ConstantOperation):
+            value = operation._value
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            if isinstance(value, float) and not math.isfinite(value):
+                return None
+            if isinstance(value, float):
+                return self._cast(repr(value), DOUBLE.java_type)
+            if -(2**31) <= value < 2**31:
+                return self._cast(str(value), INT.java_type)
+            return self._cast(f"{value}L", LONG.java_type)
+
+        if isinstance(operation, JavaFunctionOperation):
+            operator = _OPERATORS.get(id(operation.java_function))
+            if operator is None or len(operation.underlyings) != 2:
+                return None
+            if operator == "/" and self.element_type.java_type not in (
+                DOUBLE.java_type,
+                FLOAT.java_type,
+            ):
+                # Java would do an integer division.
+                return None
+            left, right = (
+                self.visit(underlying) for underlying in operation.underlyings
+            )
+            if left is None or right is None:
+                return None
+            return f"({left} {operator} {right})"
+
+        return None
+
+
+def fuse_array_operation(
+    operation: Operation, *, column_names: Sequence[str], output_type: DataType
+) -> Optional[FusedArrayExpression]:
+    """Return the fused expression of the operation or ``None`` if it cannot be computed element-wise."""
+    element_type = _ELEMENT_TYPES.get(output_type.java_type)
+    if element_type is None:
+        return None
+    fuser = _Fuser(column_names=column_names, element_type=element_type)
+    element_code = fuser.visit(operation)
+    if element_code is None or not fuser.vector_names:
+        return None
+    return FusedArrayExpression(
+        declarations=fuser.declarations,
+        vector_names=fuser.vector_names,
+        element_type=element_type,
+        element_code=element_code,
+    )
@@ -1,17 +1,24 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ..type import DataType
 from .utils import is_numeric_array_type, is_numeric_type
 
+if TYPE_CHECKING:
+    from .array_fusion import FusedArrayExpression
+
 
 class JavaOperationElement(ABC):
     """Operation's which have been processed and can be converted into compilable Java code."""
 
     @abstractmethod
     def get_java_source_code(
-        self, *, numeric_code: Optional[str] = None, array_code: Optional[str] = None
+        self,
+        *,
+        numeric_code: Optional[str] = None,
+        array_code: Optional[str] = None,
+        fused_array_code: Optional[str] = None,
     ) -> str:
         """Retrieve the Java code for the current operation element."""
 
@@ -27,19 +34,32 @@ class BasicJavaOperationElement(JavaOperationElement):
 
     java_source_code: str
     _output_type: DataType
+    fused_array_expression: Optional["FusedArrayExpression"] = None
+    """Element-wise version of the code, when the output is an array that can be computed without intermediate vectors."""
 
     @property
     def output_type(self) -> DataType:
         return self._output_type
 
     def get_java_source_code(
-        self, *, numeric_code: Optional[str] = None, array_code: Optional[str] = None
+        self,
+        *,
+        numeric_code: Optional[str] = None,
+        array_code: Optional[str] = None,
+        fused_array_code: Optional[str] = None,
     ) -> str:
-        if numeric_code is None and array_code is None:
+        if numeric_code is None and array_code is None and fused_array_code is None:
             return self.java_source_code
 
         if is_numeric_type(self._output_type) and numeric_code is not None:
             return numeric_code.format(java_source_code=self.java_source_code)
+        if (
+            self.fused_array_expression is not None
+            and fused_array_code is not None
+        ):
+            return self.fused_array_expression.format(
+                fused_array_code, java_source_code=self.java_source_code
+            )
         if is_numeric_array_type(self._output_type) and array_code is not None:
             return array_code.format(java_source_code=self.java_source_code)
 
@@ -71,7 +91,11 @@ class TernaryJavaOperationElement(JavaOperationElement):
     false_statement_java_operation: Optional[JavaOperationElement]
 
     def get_java_source_code(
-        self, *, numeric_code: Optional[str] = None, array_code: Optional[str] = None
+        self,
+        *,
+        numeric_code: Optional[str] = None,
+        array_code: Optional[str] = None,
+        fused_array_code: Optional[str] = None,
     ) -> str:
         if self.false_statement_java_operation is not None:
             return self.true_false_template.format(
@@ -79,10 +103,12 @@ class TernaryJavaOperationElement(JavaOperationElement):
                 true_statement_code=self.true_statement_java_operation.get_java_source_code(
                     numeric_code=numeric_code,
                     array_code=array_code,
+                    fused_array_code=fused_array_code,
                 ),
                 false_statement_code=self.false_statement_java_operation.get_java_source_code(
                     numeric_code=numeric_code,
                     array_code=array_code,
+                    fused_array_code=fused_array_code,
                 ),
             )
 
@@ -91,6 +117,7 @@ class TernaryJavaOperationElement(JavaOperationElement):
             true_statement_code=self.true_statement_java_operation.get_java_source_code(
                 numeric_code=numeric_code,
                 array_code=array_code,
+                fused_array_code=fused_array_code,
             ),
         )
 
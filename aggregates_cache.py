@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
+
+from ._type_utils import typecheck
 
 if TYPE_CHECKING:
     from ._java_api import JavaApi
@@ -32,7 +34,7 @@ class AggregatesCache:
         return self._java_api.get_aggregates_cache_description(self._cube).capacity
 
     @capacity.setter
-    @typechecked
+    @typecheck
     def capacity(self, capacity: int) -> None:
         """Capacity setter."""
         self._java_api.set_aggregates_cache(self._cube, capacity)
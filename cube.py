@@ -19,7 +19,7 @@ from typing import (
 from warnings import warn
 
 import pandas as pd
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ._functions.measure import value
 from ._ipython_utils import running_in_ipython
@@ -27,6 +27,7 @@ from ._local_cube import LocalCube
 from ._providers import PartialAggregateProvider
 from ._repr_utils import ReprJson, ReprJsonable
 from ._scenario_utils import BASE_SCENARIO_NAME
+from ._type_utils import typecheck
 from .aggregates_cache import AggregatesCache
 from .exceptions import AtotiJavaException
 from .hierarchies import Hierarchies
@@ -69,6 +70,18 @@ class Cube(LocalCube[Hierarchies, Levels, Measures]):
         self._base_table = base_table
         self._shared_context = CubeContext(java_api, self)
 
+    def _get_table_column_types(self) -> Mapping[str, DataType]:
+        column_types: Dict[str, DataType] = {}
+        table_names = self._java_api.definition_journal.get_joined_table_names(
+            self._base_table.name
+        )
+        existing_table_names = set(self._java_api.get_tables())
+        # The columns of the base table, then of the closest joined tables, take precedence.
+        for table_name in reversed([self._base_table.name, *table_names]):
+            if table_name in existing_table_names:
+                column_types.update(Table(table_name, self._java_api)._types)
+        return column_types
+
     @property
     def schema(self) -> Any:
         """Schema of the cube's tables as an SVG graph.
@@ -545,11 +558,11 @@ class CubeContext(MutableMapping[str, str], ReprJsonable):
     def _get_values(self) -> Dict[str, str]:
         return self._java_api.get_shared_context_values(self._cube.name)
 
-    @typechecked
+    @typecheck
     def __getitem__(self, key: str) -> str:
         return self._get_values()[key]
 
-    @typechecked
+    @typecheck
     def __setitem__(  # pylint: disable=redefined-outer-name
         self, key: str, value: Any
     ) -> None:
@@ -558,7 +571,7 @@ class CubeContext(MutableMapping[str, str], ReprJsonable):
         )
         self._java_api.refresh()
 
-    @typechecked
+    @typecheck
     def __delitem__(self, key: str) -> None:
         raise ValueError("Cannot delete context value.")
 
@@ -7,11 +7,12 @@ If any other exception is raised by the code inside the custom hook, it is proce
 from __future__ import annotations
 
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from py4j.protocol import Py4JError, Py4JJavaError, Py4JNetworkError
 
 from ._os_utils import get_env_flag
+from ._profiler import io_span
 
 if TYPE_CHECKING:
     from ._java_api import JavaApi
@@ -50,6 +51,29 @@ class AtotiJavaException(AtotiException):
         self.java_exception: Exception = java_exception
 
 
+class MeasuresDefinitionException(AtotiException):
+    """Exception thrown when some of the measures defined at once could not be created.
+
+    The other measures have been created; they are published when the update, or the outermost :meth:`~atoti.measures.Measures.batch`, ends.
+    """
+
+    def __init__(self, errors: Mapping[str, Exception]):
+        """Create a new MeasuresDefinitionException.
+
+        Args:
+            errors: The exception raised by each measure that could not be created.
+        """
+        super().__init__(
+            "\n".join(
+                [
+                    f"{len(errors)} measure(s) could not be created:",
+                    *(f"- {name}: {error}" for name, error in errors.items()),
+                ]
+            )
+        )
+        self.errors: Mapping[str, Exception] = errors
+
+
 class AtotiNetworkException(AtotiException):
     """Exception thrown when Py4J throws a network exception."""
 
@@ -68,7 +92,8 @@ def _java_api_call_wrapper(method: Callable[[Any], Any]):  # type: ignore
     @wraps(method)
     def catch_py4j_exceptions(java_api: JavaApi, *args: Any, **kwargs: Any) -> Any:
         try:
-            return method(java_api, *args, **kwargs)
+            with io_span("py4j", method.__qualname__):
+                return method(java_api, *args, **kwargs)
         except Py4JJavaError as java_exception:
             cause = (
                 str(java_exception)
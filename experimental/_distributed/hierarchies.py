@@ -3,11 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, Mapping, Tuple, Union
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ..._base._base_hierarchies import _HierarchyKey
 from ..._local_hierarchies import LocalHierarchies
 from ..._mappings import ImmutableMapping
+from ..._type_utils import typecheck
 from ...hierarchy import Hierarchy
 from ...level import Level
 from ...query.hierarchy import QueryHierarchy
@@ -64,7 +65,7 @@ class DistributedHierarchies(
             for hierarchyCoordinate in hierarchies
         }
 
-    @typechecked
+    @typecheck
     def __getitem__(self, key: _HierarchyKey) -> QueryHierarchy:
         (dimension_name, hierarchy_name) = self._convert_key(key)
         cube_hierarchies = self._java_api.retrieve_hierarchy(
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Tuple, Union
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ._base._base_hierarchies import _HierarchyKey
 from ._local_hierarchies import LocalHierarchies
+from ._type_utils import typecheck
 from .hierarchy import Hierarchy
 from .level import Level
 from .table import Column
@@ -62,24 +63,30 @@ class Hierarchies(LocalHierarchies[Hierarchy]):
 
     _cube: Cube = field(repr=False)
 
+    def _get_cached_hierarchies(self) -> Mapping[Tuple[str, str], Hierarchy]:
+        return self._cube._metadata_cache.get_hierarchies(
+            lambda: self._retrieve_hierarchies(self._java_api, self._cube)
+        )
+
     def _get_underlying(self) -> Dict[Tuple[str, str], Hierarchy]:
-        return self._retrieve_hierarchies(self._java_api, self._cube)
+        return dict(self._get_cached_hierarchies())
 
-    @typechecked
+    @typecheck
     def __getitem__(self, key: _HierarchyKey) -> Hierarchy:
         (dimension_name, hierarchy_name) = self._convert_key(key)
-        hierarchies = self._java_api.retrieve_hierarchy(
-            hierarchy_name,
-            cube=self._cube,
-            dimension=dimension_name,
-        )
+        hierarchies = [
+            hierarchy
+            for (dimension, name), hierarchy in self._get_cached_hierarchies().items()
+            if name == hierarchy_name
+            and (dimension_name is None or dimension == dimension_name)
+        ]
         if len(hierarchies) == 0:
             raise KeyError(f"Unknown hierarchy: {key}")
         if len(hierarchies) == 1:
             return hierarchies[0]
         raise self._multiple_hierarchies_error(key, hierarchies)
 
-    @typechecked
+    @typecheck
     def __setitem__(  # type: ignore
         self,
         key: _HierarchyKey,
@@ -87,7 +94,7 @@ class Hierarchies(LocalHierarchies[Hierarchy]):
     ) -> None:
         self.update({key: value})
 
-    @typechecked
+    @typecheck
     def __delitem__(self, key: _HierarchyKey) -> None:
         try:
             self._java_api.drop_hierarchy(self._cube, self[key])
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Mapping
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ._base._base_hierarchy import BaseHierarchy
+from ._type_utils import typecheck
 from .level import Level
 
 if TYPE_CHECKING:
@@ -56,14 +57,14 @@ class Hierarchy(BaseHierarchy[Mapping[str, Level]]):
         return self._visible
 
     @levels.setter
-    @typechecked
+    @typecheck
     def levels(self, value: Mapping[str, Level]) -> None:
         """Levels setter."""
         self._levels = value
         self._cube.hierarchies.update({(self._dimension, self.name): value})
 
     @dimension.setter
-    @typechecked
+    @typecheck
     def dimension(self, value: str) -> None:
         """Dimension setter."""
         self._java_api.update_hierarchy_coordinate(
@@ -73,7 +74,7 @@ class Hierarchy(BaseHierarchy[Mapping[str, Level]]):
         self._dimension = value
 
     @slicing.setter
-    @typechecked
+    @typecheck
     def slicing(self, value: bool) -> None:
         """Slicing setter."""
         self._java_api.update_hierarchy_slicing(self, value)
@@ -81,7 +82,7 @@ class Hierarchy(BaseHierarchy[Mapping[str, Level]]):
         self._slicing = value
 
     @visible.setter
-    @typechecked
+    @typecheck
     def visible(self, value: bool) -> None:
         """Visibility setter."""
         self._java_api.set_hierarchy_visibility(
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from typeguard import typechecked, typeguard_ignore
+import pyarrow as pa
+import pyarrow.compute as pc
+from typeguard import typeguard_ignore
 
 from ._base._base_level import BaseLevel
 from ._level_conditions import LevelCondition
 from ._repr_utils import ReprJson
+from ._scenario_utils import BASE_SCENARIO_NAME
+from ._type_utils import typecheck
 from .comparator import ASCENDING, Comparator
 from .measure_description import MeasureConvertible, MeasureDescription
 from .type import DataType
@@ -16,6 +20,47 @@ if TYPE_CHECKING:
     from .hierarchy import Hierarchy
 
 
+def _to_first_members_array(
+    first_members: List[Any], *, data_type: pa.DataType  # type: ignore
+) -> pa.Array:  # type: ignore
+    """Convert the first members to the type of the level members, skipping the ones that cannot be converted."""
+    try:
+        return pa.array(first_members, type=data_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arrays = []
+        for member in first_members:
+            try:
+                # Casting also converts string representations such as "1" for an int level.
+                arrays.append(pa.array([member]).cast(data_type, safe=False))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                continue
+        return pa.concat_arrays(arrays) if arrays else pa.array([], type=data_type)
+
+
+def _sort_members(
+    members: pa.Array, *, comparator: Comparator  # type: ignore
+) -> pa.Array:  # type: ignore
+    if comparator._name == "DESCENDING":
+        return members.take(pc.array_sort_indices(members, order="descending"))
+
+    sorted_members = members.take(pc.array_sort_indices(members))
+
+    if comparator._name == "FIRST_MEMBERS" and comparator._first_members:
+        first_members = _to_first_members_array(
+            list(comparator._first_members), data_type=members.type
+        )
+        return pa.concat_arrays(
+            [
+                first_members.filter(pc.is_in(first_members, value_set=members)),
+                sorted_members.filter(
+                    pc.invert(pc.is_in(sorted_members, value_set=first_members))
+                ),
+            ]
+        )
+
+    return sorted_members
+
+
 @typeguard_ignore
 @dataclass(eq=False)
 class Level(BaseLevel, MeasureConvertible):
@@ -59,7 +104,7 @@ class Level(BaseLevel, MeasureConvertible):
         return self._comparator
 
     @comparator.setter
-    @typechecked
+    @typecheck
     def comparator(self, value: Comparator) -> None:  # noqa: D401
         """Comparator setter."""
         if self._hierarchy is None:
@@ -68,6 +113,73 @@ class Level(BaseLevel, MeasureConvertible):
         self._hierarchy._java_api.update_level_comparator(self)
         self._hierarchy._java_api.refresh()
 
+    def members(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        prefix: Optional[str] = None,
+        scenario: str = BASE_SCENARIO_NAME,
+    ) -> List[Any]:
+        """Return the distinct members of the level sorted according to its :attr:`comparator`.
+
+        The members are retrieved with a single Arrow query and cached until the structure of the session changes or data is loaded from Python.
+
+        Args:
+            limit: The maximum number of members to return.
+            offset: The number of members to skip, after filtering on *prefix*.
+            prefix: Only return the members whose string representation starts with it.
+            scenario: The scenario from which to retrieve the members.
+
+        Example:
+            >>> df = pd.DataFrame(
+            ...     columns=["City", "Price"],
+            ...     data=[
+            ...         ("Paris", 200.0),
+            ...         ("Berlin", 150.0),
+            ...         ("London", 240.0),
+            ...         ("Lyon", 270.0),
+            ...     ],
+            ... )
+            >>> table = session.read_pandas(df, table_name="Cities")
+            >>> cube = session.create_cube(table)
+            >>> cube.levels["City"].members()
+            ['Berlin', 'London', 'Lyon', 'Paris']
+            >>> cube.levels["City"].members(prefix="L", limit=1, offset=1)
+            ['Lyon']
+
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit cannot be negative.")
+        if offset < 0:
+            raise ValueError("offset cannot be negative.")
+        if self._hierarchy is None:
+            raise ValueError(f"Missing hierarchy for level {self.name}.")
+
+        cube = self._hierarchy._cube
+        comparator = self.comparator
+
+        def fetch_members() -> pa.Array:  # type: ignore
+            table = cube._query_as_arrow(
+                levels=[self], measures=[], scenario_name=scenario
+            )
+            return _sort_members(table.column(0).unique(), comparator=comparator)
+
+        cube_metadata_cache = cube._session._get_cube_metadata_cache(cube.name)
+        members = cube_metadata_cache.get_level_members(
+            (self.dimension, self.hierarchy, self.name),
+            comparator=comparator,
+            fetch_level_members=fetch_members,
+            scenario=scenario,
+        )
+
+        if prefix is not None:
+            members = members.filter(
+                pc.starts_with(members.cast(pa.string()), pattern=prefix)
+            )
+
+        return members[offset : None if limit is None else offset + limit].to_pylist()
+
     def _to_measure_description(
         self, agg_fun: Optional[str] = None
     ) -> MeasureDescription:
@@ -32,12 +32,13 @@ class Levels(BaseLevels[Level, Hierarchies]):
         hierarchy_name: Optional[str] = None,
     ) -> Level:
         """Get a level from the hierarchy name and level name."""
-        hierarchies = self._hierarchies._java_api.retrieve_hierarchy_for_level(
-            level_name,
-            cube=self._hierarchies._cube,
-            dimension_name=dimension_name,
-            hierarchy_name=hierarchy_name,
-        )
+        hierarchies = [
+            hierarchy
+            for hierarchy in self._hierarchies._get_cached_hierarchies().values()
+            if level_name in hierarchy.levels
+            and (dimension_name is None or hierarchy.dimension == dimension_name)
+            and (hierarchy_name is None or hierarchy.name == hierarchy_name)
+        ]
         if len(hierarchies) > 1:
             raise_multiple_levels_error(level_name, hierarchies)
 
@@ -3,11 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
-from typeguard import typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ._base._base_measure import BaseMeasure
 from ._bitwise_operators_only import IdentityElement
 from ._deprecation import deprecated
+from ._type_utils import typecheck
 from .measure_description import MeasureDescription
 from .type import DataType
 
@@ -97,7 +98,7 @@ class Measure(MeasureDescription, BaseMeasure):
         return self._folder
 
     @folder.setter
-    @typechecked
+    @typecheck
     def folder(self, value: Optional[str]) -> None:
         if value is None:
             deprecated(
@@ -182,7 +183,7 @@ class Measure(MeasureDescription, BaseMeasure):
         return self._formatter
 
     @formatter.setter
-    @typechecked
+    @typecheck
     def formatter(self, value: Optional[str]) -> None:
         if value is None:
             # https://github.com/activeviam/atoti/issues/2690 needs to be fixed before this can be dropped.
@@ -228,7 +229,7 @@ class Measure(MeasureDescription, BaseMeasure):
         return self._visible
 
     @visible.setter
-    @typechecked
+    @typecheck
     def visible(self, value: bool) -> None:
         self._visible = value
         self._java_api.set_visible(
@@ -268,7 +269,7 @@ class Measure(MeasureDescription, BaseMeasure):
         return self._description
 
     @description.setter
-    @typechecked
+    @typecheck
     def description(self, value: Optional[str]) -> None:
         if value is None:
             deprecated(
@@ -280,7 +281,7 @@ class Measure(MeasureDescription, BaseMeasure):
         self._set_description(value)
 
     @description.deleter
-    @typechecked
+    @typecheck
     def description(self) -> None:
         self._set_description(None)
 
@@ -5,9 +5,10 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
-from typeguard import check_argument_types, typechecked, typeguard_ignore
+from typeguard import typeguard_ignore
 
 from ._bitwise_operators_only import BitwiseOperatorsOnly
+from ._type_utils import typecheck
 
 if TYPE_CHECKING:
     from ._java_api import JavaApi
@@ -28,6 +29,13 @@ class MeasureDescription(BitwiseOperatorsOnly):
         if not hasattr(self, "name"):
             self.name: str = (  # pylint: disable=attribute-defined-outside-init
                 self._do_distil(java_api=java_api, cube=cube, measure_name=measure_name)
+                if measure_name is not None
+                # Hidden measures are shared between identical descriptions.
+                else java_api.shared_measures.get_or_create(
+                    self,
+                    create=lambda: self._do_distil(java_api=java_api, cube=cube),
+                    cube_name=cube.name,
+                )
             )
         elif measure_name is not None:
             # This measure has already been distilled, this is a copy.
@@ -182,7 +190,7 @@ class MeasureDescription(BitwiseOperatorsOnly):
     # Array operations #
     ####################
 
-    @typechecked
+    @typecheck
     def __getitem__(self, key: Union[slice, int, MeasureLike]) -> MeasureDescription:
         """Return a measure equal to the element or slice of this array measure at the passed index(es)."""
         from ._measures.calculated_measure import CalculatedMeasure, Operator
@@ -238,12 +246,11 @@ LiteralMeasureValue = Union[
 MeasureLike = Union[LiteralMeasureValue, MeasureDescription, MeasureConvertible]
 
 
+@typecheck
 def _convert_to_measure_description(arg: MeasureLike) -> MeasureDescription:
     """Convert the passed argument to a measure."""
     from ._measures.literal_measure import LiteralMeasure
 
-    check_argument_types()
-
     if isinstance(arg, MeasureDescription):
         return arg
     if isinstance(arg, MeasureConvertible):
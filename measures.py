@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Generator, Iterable, Mapping, Tuple, Union
 
 from typeguard import typeguard_ignore
 
 from ._local_measures import LocalMeasures
-from .exceptions import AtotiJavaException
+from ._shared_measures import SharedMeasure
+from .exceptions import AtotiJavaException, MeasuresDefinitionException
 from .measure import Measure
 from .measure_description import (
     MeasureDescription,
@@ -45,6 +47,8 @@ class Measures(LocalMeasures[Measure]):
     def __init__(self, java_api: JavaApi, cube: Cube = field(repr=False)):
         super().__init__(java_api)
         self._cube = cube
+        self._batch_depth = 0
+        self._has_unpublished_measures = False
 
     @typeguard_ignore
     def _build_measure(
@@ -61,9 +65,77 @@ class Measures(LocalMeasures[Measure]):
             description.description,
         )
 
+    def _get_measure_descriptions(
+        self,
+    ) -> Mapping[str, JavaApi.JavaMeasureDescription]:
+        return self._cube._metadata_cache.get_measures(
+            lambda: self._java_api.get_full_measures(self._cube)
+        )
+
+    def _publish(self) -> None:
+        if self._has_unpublished_measures:
+            self._java_api.publish_measures(self._cube.name)
+            self._has_unpublished_measures = False
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Return a context manager deferring the publication of the measures created inside it until it exits.
+
+        Publishing the cube once instead of after each measure makes the creation of many measures much faster.
+        Reading the measures inside the context publishes the ones created so far.
+
+        Example:
+            >>> df = pd.DataFrame(
+            ...     columns=["Product", "Price", "Quantity"],
+            ...     data=[("TV", 300.0, 2), ("Computer", 900.0, 1)],
+            ... )
+            >>> table = session.read_pandas(df, table_name="Sales")
+            >>> cube = session.create_cube(table)
+            >>> m = cube.measures
+            >>> with m.batch():
+            ...     m["Turnover"] = tt.agg.sum(table["Price"] * table["Quantity"])
+            ...     m["Max price"] = tt.agg.max(table["Price"])
+            >>> cube.query(m["Turnover"], m["Max price"])
+              Turnover Max price
+            0 1,500.00    900.00
+
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._publish()
+
+    def sharing_report(self) -> Mapping[str, SharedMeasure]:
+        """Return the hidden measures reused by several measure definitions, indexed by name.
+
+        Identical parts of measure definitions, such as the same ``m["Price.SUM"] * m["Quantity.SUM"]`` or ``tt.agg.sum()`` in several measures, are only created once in the cube and then computed once per location by queries using them.
+
+        Example:
+            >>> df = pd.DataFrame(
+            ...     columns=["Product", "Price", "Quantity"],
+            ...     data=[("TV", 300.0, 2.0), ("Computer", 900.0, 1.0)],
+            ... )
+            >>> table = session.read_pandas(df, table_name="Shared sales")
+            >>> cube = session.create_cube(table)
+            >>> m = cube.measures
+            >>> m["Turnover x2"] = m["Price.SUM"] * m["Quantity.SUM"] * 2
+            >>> m["Turnover x3"] = m["Price.SUM"] * m["Quantity.SUM"] * 3
+            >>> [
+            ...     shared_measure.reuse_count
+            ...     for shared_measure in m.sharing_report().values()
+            ... ]
+            [1]
+
+        """
+        return self._java_api.shared_measures.get_report(self._cube.name)
+
     def _get_underlying(self) -> Dict[str, Measure]:
         """Fetch the measures from the JVM each time they are needed."""
-        cube_measures = self._java_api.get_full_measures(self._cube)
+        self._publish()
+        cube_measures = self._get_measure_descriptions()
         return {
             name: self._build_measure(name, cube_measures[name])
             for name in cube_measures
@@ -71,11 +143,15 @@ class Measures(LocalMeasures[Measure]):
 
     def __getitem__(self, key: str) -> Measure:
         """Return the measure with the given name."""
-        try:
-            cube_measure = self._java_api.get_measure(self._cube, key)
-            return self._build_measure(key, cube_measure)
-        except AtotiJavaException:
-            raise KeyError(f"No measure named {key}") from None
+        self._publish()
+        cube_measure = self._get_measure_descriptions().get(key)
+        if cube_measure is None:
+            # Hidden measures are not part of the full measures.
+            try:
+                cube_measure = self._java_api.get_measure(self._cube, key)
+            except AtotiJavaException:
+                raise KeyError(f"No measure named {key}") from None
+        return self._build_measure(key, cube_measure)
 
     def __setitem__(self, key: str, value: MeasureLike) -> None:
         self.update({key: value})
@@ -85,31 +161,58 @@ class Measures(LocalMeasures[Measure]):
         other: Union[Mapping[str, MeasureLike], Iterable[Tuple[str, MeasureLike]]],
         **kwargs: MeasureLike,
     ) -> None:
+        """Create or replace the given measures.
+
+        The cube is published once all the measures have been created, or when the outermost :meth:`batch` exits.
+        The update does not stop at the first measure that fails to be created: the other measures are still created and a :class:`~atoti.exceptions.MeasuresDefinitionException` holding each failure is then raised.
+        When a single measure is given, its error is raised directly.
+        """
         full_mapping = {}
         full_mapping.update(other, **kwargs)
         self._update(full_mapping)
 
+    def _create(self, measure_name: str, measure: MeasureLike) -> None:
+        _validate_name(measure_name)
+        if not isinstance(measure, MeasureDescription):
+            measure = _convert_to_measure_description(measure)
+
+        try:
+            measure._distil(
+                java_api=self._java_api, cube=self._cube, measure_name=measure_name
+            )
+        except AttributeError as err:
+            raise ValueError(f"Cannot create a measure from {measure}") from err
+        self._java_api.definition_journal.record_measure(
+            self._cube.name, measure_name, measure
+        )
+
     def _update(self, mapping: Mapping[str, MeasureLike]):
         """Update the cube with the given measures.
 
         If the input is not a MeasureDescription, its ``_to_measure_description`` method will be called.
+        The cube is published once after all the measures have been created, or when exiting :meth:`batch` if inside it.
+        A measure failing to be created does not prevent the other ones from being created.
 
         Args:
             mapping: the measure names and values to add to the cube.
         """
-        for measure_name, measure in mapping.items():
-            _validate_name(measure_name)
-            if not isinstance(measure, MeasureDescription):
-                measure = _convert_to_measure_description(measure)
+        errors: Dict[str, Exception] = {}
 
+        for measure_name, measure in mapping.items():
             try:
-                measure._distil(
-                    java_api=self._java_api, cube=self._cube, measure_name=measure_name
-                )
-            except AttributeError as err:
-                raise ValueError(f"Cannot create a measure from {measure}") from err
+                self._create(measure_name, measure)
+            except Exception as error:  # pylint: disable=broad-except
+                errors[measure_name] = error
+            else:
+                self._has_unpublished_measures = True
 
-            self._java_api.publish_measures(self._cube.name)
+        if not self._batch_depth:
+            self._publish()
+
+        if errors:
+            if len(mapping) == 1:
+                raise next(iter(errors.values()))
+            raise MeasuresDefinitionException(errors)
 
     def __delitem__(self, key: str) -> None:
         """Delete a measure.
@@ -117,7 +220,9 @@ class Measures(LocalMeasures[Measure]):
         Args:
             key: The name of the measure to delete.
         """
+        self._publish()
         found = self._java_api.delete_measure(cube=self._cube, measure_name=key)
         if not found:
             raise KeyError(f"{key} is not an existing measure.")
+        self._java_api.definition_journal.forget_measure(self._cube.name, key)
         self._java_api.refresh()
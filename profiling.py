@@ -0,0 +1,196 @@
+"""Profile the calls made to atoti's API.
+
+While profiling is enabled, each call to a public function or method of atoti is recorded with its duration.
+The time spent in a call is split between the other API functions it called, the communication with the JVM through py4j, HTTP requests, and Python.
+
+Example:
+
+    .. code-block:: python
+
+        import atoti as tt
+
+        tt.profiling.enable()
+        session = tt.create_session()
+        ...
+        tt.profiling.print_stats()
+        tt.profiling.export_chrome_trace("trace.json")
+
+"""
+
+from __future__ import annotations
+
+import json
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from typing_extensions import Literal
+
+from ._api_utils import walk_api_attribute
+from ._lazy_module import LazyModule
+from ._path_utils import PathLike
+from ._profiler import (
+    CallStats,
+    Profiler,
+    get_active_profiler,
+    instrument_profiling_callback,
+    set_active_profiler,
+)
+
+SortKey = Literal[
+    "count", "total_time", "own_time", "python_time", "py4j_time", "http_time"
+]
+
+_DEFAULT_MAX_TRACE_EVENTS = 1_000_000
+
+_PROFILER: Optional[Profiler] = None
+
+
+def _instrument_api_attribute(module: LazyModule, attribute_name: str) -> None:
+    walk_api_attribute(module, attribute_name, callback=instrument_profiling_callback)
+
+
+def _get_profiler() -> Profiler:
+    if _PROFILER is None:
+        raise RuntimeError("Profiling has never been enabled.")
+    return _PROFILER
+
+
+def enable(*, max_trace_events: int = _DEFAULT_MAX_TRACE_EVENTS) -> None:
+    """Start recording the calls to atoti's API.
+
+    The data recorded by a previous profiling is kept, call :func:`clear` to drop it.
+
+    Args:
+        max_trace_events: The maximum number of events to record for :func:`export_chrome_trace`.
+            Statistics keep being updated once this number is reached.
+    """
+    global _PROFILER  # pylint: disable=global-statement
+    if _PROFILER is None:
+        # The API is only wrapped the first time profiling is enabled so that it has no overhead until then.
+        package = sys.modules[__name__.rsplit(".", 1)[0]]
+        if isinstance(package, LazyModule):
+            package.add_instrumenter(_instrument_api_attribute)
+        _PROFILER = Profiler(max_trace_events=max_trace_events)
+    set_active_profiler(_PROFILER)
+
+
+def disable() -> None:
+    """Stop recording the calls to atoti's API."""
+    set_active_profiler(None)
+
+
+def is_enabled() -> bool:
+    """Whether the calls to atoti's API are being recorded."""
+    return get_active_profiler() is not None
+
+
+def clear() -> None:
+    """Drop the data recorded so far."""
+    global _PROFILER  # pylint: disable=global-statement
+    profiler = _get_profiler()
+    _PROFILER = Profiler(
+        max_trace_events=profiler._max_trace_events  # pylint: disable=protected-access
+    )
+    if is_enabled():
+        set_active_profiler(_PROFILER)
+
+
+def get_stats() -> Mapping[str, CallStats]:
+    """Return the statistics of the calls recorded so far, indexed by the path of the called function (e.g. ``"atoti.cube.Cube.query"``)."""
+    return dict(_get_profiler().stats)
+
+
+def print_stats(*, sort_by: SortKey = "total_time", limit: Optional[int] = 20) -> None:
+    """Print the statistics of the calls recorded so far.
+
+    Durations are in milliseconds.
+    The percentiles are upper bounds precise to a factor 2.
+
+    Args:
+        sort_by: The statistic by which to sort the functions, in descending order.
+        limit: The maximum number of functions to print.
+    """
+    stats = sorted(
+        get_stats().items(), key=lambda item: getattr(item[1], sort_by), reverse=True
+    )[:limit]
+    columns = ["calls", "total", "own", "python", "py4j", "http", "p50", "p99"]
+    print("".join(f"{column:>10}" for column in columns) + "  function")
+    for path, call_stats in stats:
+        values = [
+            call_stats.total_time,
+            call_stats.own_time,
+            call_stats.python_time,
+            call_stats.py4j_time,
+            call_stats.http_time,
+            call_stats.get_percentile(50),
+            call_stats.get_percentile(99),
+        ]
+        print(
+            f"{call_stats.count:>10}"
+            + "".join(f"{value * 1000:>10.3f}" for value in values)
+            + f"  {path}"
+        )
+
+
+def export_pstats(path: PathLike) -> None:
+    """Export the statistics of the calls recorded so far to a file readable by :class:`pstats.Stats`.
+
+    The own time of the functions is used as their internal time.
+    """
+    stats = get_stats()
+
+    def get_key(function_path: str) -> Tuple[str, int, str]:
+        call_stats = stats[function_path]
+        return call_stats.filename, call_stats.line_number, function_path
+
+    pstats: Dict[Tuple[str, int, str], Tuple[Any, ...]] = {}
+    for function_path, call_stats in stats.items():
+        pstats[get_key(function_path)] = (
+            call_stats.primitive_count,
+            call_stats.count,
+            call_stats.own_time,
+            call_stats.total_time,
+            {
+                get_key(caller_path): (
+                    caller_stats.primitive_count,
+                    caller_stats.count,
+                    caller_stats.own_time,
+                    caller_stats.total_time,
+                )
+                for caller_path, caller_stats in call_stats.callers.items()
+                if caller_path in stats
+            },
+        )
+    with open(path, "wb") as file:
+        marshal.dump(pstats, file)
+
+
+def export_chrome_trace(path: PathLike) -> None:
+    """Export the calls recorded so far to a JSON file in the Trace Event Format.
+
+    It can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+    process_id = os.getpid()
+    Path(path).write_text(
+        json.dumps(
+            {
+                "displayTimeUnit": "ms",
+                "traceEvents": [
+                    {
+                        "cat": event.category,
+                        "dur": event.duration * 1e6,
+                        "name": event.name,
+                        "ph": "X",
+                        "pid": process_id,
+                        "tid": event.thread_id,
+                        "ts": event.start * 1e6,
+                    }
+                    for event in _get_profiler().trace_events
+                ],
+            }
+        ),
+        encoding="utf8",
+    )
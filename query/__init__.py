@@ -8,5 +8,11 @@ There are two main ways to query atoti sessions in Python:
 """
 
 from ._auth import create_basic_authentication, create_token_authentication
+from .query_timings import add_query_timings_callback, remove_query_timings_callback
 
-__all__ = ["create_basic_authentication", "create_token_authentication"]
+__all__ = [
+    "add_query_timings_callback",
+    "create_basic_authentication",
+    "create_token_authentication",
+    "remove_query_timings_callback",
+]
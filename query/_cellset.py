@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from itertools import zip_longest
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,12 +17,14 @@ from typing import (
     Union,
 )
 
+import numpy as np
 import pandas as pd
 from typing_extensions import TypedDict
 
 from ._context import Context
 from ._discovery import Discovery, DiscoveryDimensionMapping, get_dimensions_mapping
 from .query_result import QueryResult
+from .query_timings import QueryTimings
 
 if TYPE_CHECKING:
     from pandas.io.formats.style import Styler
@@ -43,6 +46,10 @@ LevelCoordinates = Tuple[DimensionName, HierarchyName, LevelName]
 GetLevelDataTypes = Callable[
     [str, Collection[LevelCoordinates]], Mapping[LevelCoordinates, str]
 ]
+GetMemberDictionary = Callable[[str, LevelCoordinates], "MemberDictionary"]
+
+# Above this number of distinct members, a dictionary is cleared instead of growing further.
+MAX_MEMBER_DICTIONARY_SIZE = 100_000
 
 SUPPORTED_DATE_FORMATS = [
     "LocalDate",
@@ -348,39 +355,125 @@ def _format_to_pandas_type(
     return values
 
 
+class MemberDictionary:
+    """Dictionary encoding the members of a level with integer codes.
+
+    Each distinct member is converted to its pandas type only the first time it is encountered.
+    The index of a query result is then built by taking the already converted values at the codes of its members.
+    Only conversions to the type of the level are cached so that the type of an index never depends on previous queries.
+    """
+
+    def __init__(self, *, data_type: str):
+        self._data_type = data_type
+        self._codes: Dict[Any, int] = {}
+        self._values: Optional[pd.Index] = None
+
+    def _add(self, members: Sequence[Any]) -> bool:
+        new_values = pd.Index(_format_to_pandas_type(members, data_type=self._data_type))
+
+        if (
+            self._data_type.split("[")[0] in SUPPORTED_DATE_FORMATS
+            and not pd.api.types.is_datetime64_any_dtype(new_values.dtype)
+        ):
+            # The conversion of these members fell back to strings (e.g. because a member is N/A).
+            # This fallback only applies to the current query so it is not cached.
+            return False
+
+        if self._values is None:
+            self._values = new_values
+        elif new_values.dtype == self._values.dtype:
+            self._values = self._values.append(new_values)
+        else:
+            # The current query must be converted on its own so that all its members have the same type.
+            return False
+
+        for member in members:
+            self._codes[member] = len(self._codes)
+
+        return True
+
+    def get_index(self, members: Sequence[Any], *, name: str) -> Optional[pd.Index]:
+        """Return the index of the given members or ``None`` if they cannot be encoded by this dictionary."""
+        distinct_members = dict.fromkeys(members)
+
+        if None in distinct_members:
+            # Padded totals change the type of the whole index (e.g. ints become floats) so it is not encoded.
+            return None
+
+        new_members = [
+            member for member in distinct_members if member not in self._codes
+        ]
+
+        if new_members:
+            if len(new_members) > MAX_MEMBER_DICTIONARY_SIZE:
+                return None
+
+            if len(self._codes) + len(new_members) > MAX_MEMBER_DICTIONARY_SIZE:
+                self._codes.clear()
+                self._values = None
+                new_members = list(distinct_members)
+
+            if not self._add(new_members):
+                return None
+
+        if self._values is None:
+            return None
+
+        codes = np.fromiter(
+            (self._codes[member] for member in members),
+            dtype=np.int64,
+            count=len(members),
+        )
+        return self._values.take(codes).rename(name)
+
+
 def _get_member_name_index(
     levels_coordinates: Collection[LevelCoordinates],
     *,
     cellset: Cellset,
     get_level_data_types: Optional[GetLevelDataTypes] = None,
+    get_member_dictionary: Optional[GetMemberDictionary] = None,
     members: Iterable[Tuple[str, ...]],
 ) -> Optional[pd.Index]:
     if not levels_coordinates:
         return None
 
-    level_names = tuple(
-        level_coordinates[2] for level_coordinates in levels_coordinates
-    )
-    index_dataframe = pd.DataFrame(
-        members,
-        columns=level_names,
+    members = list(members)
+    # Shorter tuples (i.e. totals) are padded with ``None`` like when building a DataFrame from them.
+    columns: List[Sequence[Any]] = list(zip_longest(*members))
+    columns.extend(
+        [(None,) * len(members)] * (len(levels_coordinates) - len(columns))
     )
+
     level_data_types = (
         get_level_data_types(cellset["cube"], levels_coordinates)
         if get_level_data_types
         else {level_coordinates: "object" for level_coordinates in levels_coordinates}
     )
-    for level_coordinates in levels_coordinates:
+
+    indices = []
+    for level_coordinates, column in zip(levels_coordinates, columns):
         level_name = level_coordinates[2]
-        index_dataframe[level_name] = _format_to_pandas_type(
-            index_dataframe[level_name],
-            data_type=level_data_types[level_coordinates],
+        index = (
+            get_member_dictionary(cellset["cube"], level_coordinates).get_index(
+                column, name=level_name
+            )
+            if get_member_dictionary and column
+            else None
         )
+        if index is None:
+            index = pd.Index(
+                _format_to_pandas_type(
+                    column, data_type=level_data_types[level_coordinates]
+                ),
+                name=level_name,
+            )
+        indices.append(index)
 
     if len(levels_coordinates) == 1:
-        return pd.Index(index_dataframe.iloc[:, 0])
+        return indices[0]
 
-    return pd.MultiIndex.from_frame(index_dataframe)
+    return pd.MultiIndex.from_arrays(indices)
 
 
 def _get_member_caption_index(
@@ -461,7 +554,9 @@ def cellset_to_query_result(
     context: Optional[Context] = None,
     discovery: Discovery,
     get_level_data_types: Optional[GetLevelDataTypes] = None,
+    get_member_dictionary: Optional[GetMemberDictionary] = None,
     keep_totals: bool,
+    timings: Optional[QueryTimings] = None,
 ) -> QueryResult:
     """Convert an MDX cellset to a pandas DataFrame."""
     default_measure = _get_default_measure(cellset)
@@ -536,6 +631,7 @@ def cellset_to_query_result(
         levels_coordinates,
         cellset=cellset,
         get_level_data_types=get_level_data_types,
+        get_member_dictionary=get_member_dictionary,
         members=member_names_to_measure_values.keys(),
     )
 
@@ -582,4 +678,5 @@ def cellset_to_query_result(
         formatted_values=formatted_values_dataframe,
         get_styler=_get_styler,
         index=member_name_index,
+        timings=timings,
     )
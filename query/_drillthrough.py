@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Optional, Sequence
+
+import pyarrow as pa
+
+from .._mappings import EMPTY_MAPPING
+from .._type_utils import is_array
+from ..type import DataType
+from ._context import Context
+
+if TYPE_CHECKING:
+    from .session import QuerySession
+
+GenerateDrillthroughMdx = Callable[[int, int], str]
+"""Take the index of the first row and the maximum number of rows and return the MDX."""
+
+
+@dataclass(frozen=True)
+class _DrillthroughPrivateParameters:
+    column_types: Mapping[str, DataType] = EMPTY_MAPPING
+    """Types of the drillthrough columns, such as the ones of the table columns, levels, and measures of a local cube."""
+
+
+def _get_schema(
+    column_names: Sequence[str], *, column_types: Mapping[str, DataType]
+) -> pa.Schema:  # type: ignore
+    # Imported here since it imports the query package.
+    from .._arrow import (  # pylint: disable=import-outside-toplevel
+        get_arrow_type,
+    )
+
+    fields = []
+    for column_name in column_names:
+        data_type = column_types.get(column_name)
+        arrow_type = (
+            None
+            # Drillthrough arrays are formatted as strings.
+            if data_type is None or is_array(data_type)
+            else get_arrow_type(data_type)
+        )
+        # Columns of unknown types are strings so that all the batches have the same schema.
+        fields.append(pa.field(column_name, arrow_type or pa.string()))
+    return pa.schema(fields)
+
+
+def _to_batch(
+    rows: Sequence[Sequence[Any]],
+    *,
+    column_types: Mapping[str, DataType],
+    schema: pa.Schema,  # type: ignore
+) -> pa.RecordBatch:  # type: ignore
+    from .._arrow import (  # pylint: disable=import-outside-toplevel
+        to_arrow_array,
+    )
+
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        if field.name in column_types and field.type != pa.string():
+            array = to_arrow_array(values, data_type=column_types[field.name])
+        else:
+            array = pa.array(
+                [None if value is None else str(value) for value in values],
+                type=pa.string(),
+            )
+        arrays.append(array.cast(field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _generate_batches(
+    *,
+    batch_size: int,
+    column_types: Mapping[str, DataType],
+    context: Context,
+    generate_mdx: GenerateDrillthroughMdx,
+    limit: Optional[int],
+    offset: int,
+    session: QuerySession,
+) -> Iterator[pa.RecordBatch]:  # type: ignore
+    first_row = offset
+    remaining_rows = limit
+    schema = None
+
+    while remaining_rows is None or remaining_rows > 0:
+        max_rows = (
+            batch_size if remaining_rows is None else min(batch_size, remaining_rows)
+        )
+        result = session._query_drillthrough(
+            generate_mdx(first_row, max_rows), context=context
+        )
+        if schema is None:
+            schema = _get_schema(
+                [header["name"] for header in result["headers"]],
+                column_types=column_types,
+            )
+        rows = [row["rowContent"] for row in result["rows"]]
+
+        if rows:
+            yield _to_batch(rows, column_types=column_types, schema=schema)
+
+        if len(rows) < max_rows:
+            return
+
+        first_row += len(rows)
+        if remaining_rows is not None:
+            remaining_rows -= len(rows)
+
+
+def iter_drillthrough_batches(
+    *,
+    batch_size: int,
+    context: Context,
+    generate_mdx: GenerateDrillthroughMdx,
+    limit: Optional[int],
+    offset: int,
+    session: QuerySession,
+    **kwargs: Any,
+) -> Iterator[pa.RecordBatch]:  # type: ignore
+    """Return an iterator of the drillthrough rows one page at a time, each page being its own query.
+
+    All the batches have the schema built from the headers of the first page.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"The batch size must be positive but got {batch_size}.")
+    if limit is not None and limit < 0:
+        raise ValueError(f"The limit cannot be negative but got {limit}.")
+    if offset < 0:
+        raise ValueError(f"The offset cannot be negative but got {offset}.")
+
+    private_parameters = _DrillthroughPrivateParameters(**kwargs)
+    return _generate_batches(
+        batch_size=batch_size,
+        column_types=private_parameters.column_types,
+        context=context,
+        generate_mdx=generate_mdx,
+        limit=limit,
+        offset=offset,
+        session=session,
+    )
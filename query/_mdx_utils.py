@@ -92,6 +92,16 @@ def _generate_level_set(
     )
 
 
+def _generate_scenarios_set(scenario_names: Iterable[str]) -> str:
+    return _generate_set(
+        [
+            f"[Epoch].[Epoch].[{_escape(scenario_name)}]"
+            for scenario_name in scenario_names
+        ],
+        single_element_short_syntax=False,
+    )
+
+
 def _generate_rows_set(
     levels: Mapping[QueryLevel, int], *, cube: QueryCube, include_totals: bool
 ) -> str:
@@ -242,19 +252,39 @@ def generate_mdx(
     level_isin_conditions: Iterable[LevelIsInCondition],
     measures: Iterable[QueryMeasure],
     scenario_name: str,
+    scenario_names: Sequence[str] = (),
 ) -> str:
     """Return the corresponding MDX query.
 
     The value of the measures is given on all the members of the given levels.
     If no level is specified then the value at the top level is returned.
+    When *scenario_names* is not empty, the Epoch hierarchy is put on rows to query all these scenarios at once and *scenario_name* is ignored.
     """
 
     mdx = f"SELECT {_generate_columns_set(measures)} ON COLUMNS"
 
+    rows_sets = []
+
+    if scenario_names:
+        rows_sets.append(_generate_scenarios_set(scenario_names))
+        scenario_name = BASE_SCENARIO_NAME
+
     deepest_levels = _keep_only_deepest_levels(levels, cube=cube)
 
     if deepest_levels:
-        mdx = f"{mdx}, NON EMPTY {_generate_rows_set(deepest_levels, cube=cube, include_totals=include_totals)} ON ROWS"
+        rows_sets.append(
+            _generate_rows_set(
+                deepest_levels, cube=cube, include_totals=include_totals
+            )
+        )
+
+    if rows_sets:
+        rows_set = (
+            rows_sets[0]
+            if len(rows_sets) == 1
+            else f"Crossjoin({', '.join(rows_sets)})"
+        )
+        mdx = f"{mdx}, NON EMPTY {rows_set} ON ROWS"
 
     hierarchy_coordinates_to_member_paths = (
         _generate_hierarchy_coordinates_to_member_paths_from_conditions(
@@ -276,11 +306,13 @@ def generate_mdx(
     return mdx
 
 
+_LEVEL_UNIQUE_NAME_REGEX = re.compile(
+    r"^\[(?P<dimension>.*)\]\.\[(?P<hierarchy>.*)\]\.\[(?P<level>.*)\]$"
+)
+
+
 def parse_level_unique_name(unique_name: str) -> Optional[Tuple[str, str, str]]:
-    regex = re.compile(
-        r"^\[(?P<dimension>.*)\]\.\[(?P<hierarchy>.*)\]\.\[(?P<level>.*)\]$"
-    )
-    match = regex.match(unique_name)
+    match = _LEVEL_UNIQUE_NAME_REGEX.match(unique_name)
     if match is None:
         return None
 
@@ -289,3 +321,38 @@ def parse_level_unique_name(unique_name: str) -> Optional[Tuple[str, str, str]]:
         match.group("hierarchy"),
         match.group("level"),
     )
+
+
+def generate_drillthrough_mdx(
+    *,
+    columns: Optional[Sequence[str]],
+    cube: QueryCube,
+    first_row: int,
+    hierarchy_isin_conditions: Iterable[HierarchyIsInCondition],
+    level_conditions: Iterable[LevelCondition],
+    level_isin_conditions: Iterable[LevelIsInCondition],
+    max_rows: int,
+    scenario_name: str,
+) -> str:
+    """Return the MDX retrieving the facts contributing to the location defined by the conditions."""
+    hierarchy_coordinates_to_member_paths = (
+        _generate_hierarchy_coordinates_to_member_paths_from_conditions(
+            cube=cube,
+            hierarchy_isin_conditions=hierarchy_isin_conditions,
+            level_conditions=level_conditions,
+            level_isin_conditions=level_isin_conditions,
+        )
+    )
+
+    filters = _generate_filters(
+        cube=cube,
+        hierarchy_coordinates_to_member_paths=hierarchy_coordinates_to_member_paths,
+        scenario_name=scenario_name,
+    )
+
+    mdx = f"DRILLTHROUGH MAXROWS {max_rows} FIRSTROW {first_row} SELECT {_generate_from_clause(cube, filters=filters)}"
+
+    if columns:
+        mdx = f"""{mdx} RETURN {", ".join(f"[{_escape(column)}]" for column in columns)}"""
+
+    return mdx
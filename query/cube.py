@@ -1,18 +1,36 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
-
-from typeguard import typechecked, typeguard_ignore
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+import pyarrow as pa
+from typeguard import typeguard_ignore
 
 from .._base._base_cube import BaseCube
-from .._docs_utils import QUERY_DOC, doc, get_query_args_doc
+from .._docs_utils import DRILLTHROUGH_DOC, QUERY_DOC, doc, get_query_args_doc
 from .._hierarchy_isin_conditions import HierarchyIsInCondition
 from .._level_conditions import LevelCondition
 from .._level_isin_conditions import LevelIsInCondition
 from .._multi_condition import MultiCondition
-from .._scenario_utils import BASE_SCENARIO_NAME
-from ._mdx_utils import generate_mdx
+from .._scenario_utils import (
+    BASE_SCENARIO_NAME,
+    get_scenario_names_to_query,
+    keep_cells_different_from_base,
+)
+from .._type_utils import typecheck
+from ._drillthrough import iter_drillthrough_batches
+from ._mdx_utils import generate_drillthrough_mdx, generate_mdx
 from ._widget_conversion_details import WidgetConversionDetails
 from .hierarchies import QueryHierarchies
 from .level import QueryLevel
@@ -20,6 +38,7 @@ from .levels import QueryLevels
 from .measure import QueryMeasure
 from .measures import QueryMeasures
 from .query_result import QueryResult
+from .query_timings import QueryTimings, _Stopwatch
 
 if TYPE_CHECKING:
     from .session import QuerySession
@@ -52,6 +71,7 @@ class QueryCube(BaseCube[QueryHierarchies, QueryLevels, QueryMeasures]):
         levels: Iterable[QueryLevel],
         measures: Iterable[QueryMeasure],
         scenario_name: str,
+        scenario_names: Sequence[str] = (),
     ) -> str:
         (
             level_conditions,
@@ -68,10 +88,11 @@ class QueryCube(BaseCube[QueryHierarchies, QueryLevels, QueryMeasures]):
             levels=levels,
             measures=measures,
             scenario_name=scenario_name,
+            scenario_names=scenario_names,
         )
 
     @doc(QUERY_DOC, args=get_query_args_doc(is_query_session=True))
-    @typechecked
+    @typecheck
     def query(
         self,
         *measures: QueryMeasure,
@@ -83,25 +104,39 @@ class QueryCube(BaseCube[QueryHierarchies, QueryLevels, QueryMeasures]):
                 HierarchyIsInCondition,
             ]
         ] = None,
+        diff_against_base: bool = False,
         include_totals: bool = False,
         levels: Iterable[QueryLevel] = (),
         scenario: str = BASE_SCENARIO_NAME,
+        scenarios: Optional[Sequence[str]] = None,
         timeout: int = 30,
         **kwargs: Any,
-    ) -> QueryResult:
+    ) -> Union[QueryResult, pd.DataFrame]:
         if levels is None:
             levels = []
 
+        scenario_names = get_scenario_names_to_query(
+            scenario=scenario,
+            scenarios=scenarios,
+            diff_against_base=diff_against_base,
+        )
+
+        stopwatch = _Stopwatch()
         mdx = self._generate_mdx(
             condition=condition,
             include_totals=include_totals,
             levels=levels,
             measures=measures,
             scenario_name=scenario,
+            scenario_names=scenario_names,
         )
 
         query_result = self._session.query_mdx(
-            mdx, keep_totals=include_totals, timeout=timeout, **kwargs
+            mdx,
+            keep_totals=include_totals,
+            timeout=timeout,
+            timings=QueryTimings(mdx_generation=stopwatch.lap()),
+            **kwargs,
         )
 
         # Remove this branch when https://github.com/activeviam/atoti/issues/1943 is done.
@@ -117,13 +152,62 @@ class QueryCube(BaseCube[QueryHierarchies, QueryLevels, QueryMeasures]):
                     levels=levels,
                     measures=measures,
                     scenario_name=scenario,
+                    scenario_names=scenario_names,
                 ),
                 session_id=query_result._atoti_widget_conversion_details.session_id,
                 widget_creation_code=query_result._atoti_widget_conversion_details.widget_creation_code,
             )
 
+        if diff_against_base:
+            return keep_cells_different_from_base(query_result)
+
         return query_result
 
+    @doc(DRILLTHROUGH_DOC)
+    def drillthrough(
+        self,
+        *,
+        batch_size: int = 10_000,
+        columns: Optional[Sequence[str]] = None,
+        condition: Optional[
+            Union[
+                LevelCondition,
+                MultiCondition,
+                LevelIsInCondition,
+                HierarchyIsInCondition,
+            ]
+        ] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        scenario: str = BASE_SCENARIO_NAME,
+        timeout: int = 30,
+        **kwargs: Any,
+    ) -> Iterator[pa.RecordBatch]:  # type: ignore
+        (
+            level_conditions,
+            level_isin_conditions,
+            hierarchy_isin_conditions,
+        ) = _decombine_condition(condition)
+
+        return iter_drillthrough_batches(
+            batch_size=batch_size,
+            context={"queriesTimeLimit": timeout},
+            generate_mdx=lambda first_row, max_rows: generate_drillthrough_mdx(
+                columns=columns,
+                cube=self,
+                first_row=first_row,
+                hierarchy_isin_conditions=hierarchy_isin_conditions,
+                level_conditions=level_conditions,
+                level_isin_conditions=level_isin_conditions,
+                max_rows=max_rows,
+                scenario_name=scenario,
+            ),
+            limit=limit,
+            offset=offset,
+            session=self._session,
+            **kwargs,
+        )
+
 
 def _decombine_condition(
     condition: Optional[
@@ -8,6 +8,7 @@ from typeguard import typeguard_ignore
 
 from ._context import Context
 from ._widget_conversion_details import WidgetConversionDetails
+from .query_timings import QueryTimings, _Stopwatch
 
 if TYPE_CHECKING:
     from pandas.io.formats.style import Styler
@@ -32,6 +33,7 @@ class QueryResult(pd.DataFrame):  # pylint: disable=abstract-method
         "_atoti_get_styler",
         "_atoti_has_been_mutated",
         "_atoti_initial_dataframe",
+        "_atoti_timings",
         "_atoti_widget_conversion_details",
     ]
     _internal_names_set = set(_internal_names)
@@ -46,6 +48,7 @@ class QueryResult(pd.DataFrame):  # pylint: disable=abstract-method
         context: Optional[Context] = None,
         formatted_values: pd.DataFrame,
         get_styler: Callable[[], Styler],
+        timings: Optional[QueryTimings] = None,
     ):
         """Init the parent DataFrame and set extra internal attributes."""
         super().__init__(data, index)
@@ -54,6 +57,7 @@ class QueryResult(pd.DataFrame):  # pylint: disable=abstract-method
         self._atoti_get_styler = get_styler
         self._atoti_has_been_mutated = False
         self._atoti_initial_dataframe = self.copy(deep=True)
+        self._atoti_timings = timings
         self._atoti_widget_conversion_details: Optional[WidgetConversionDetails] = None
 
     # The conversion to an atoti widget and the styling are based on the fact that this dataframe represents the original result of the MDX query.
@@ -75,7 +79,22 @@ class QueryResult(pd.DataFrame):  # pylint: disable=abstract-method
 
         If the query result has not been mutated, the returned object will follow the styling included in the CellSet from which the DataFrame was converted.
         """
-        return super().style if self._has_been_mutated() else self._atoti_get_styler()
+        if self._has_been_mutated():
+            return super().style
+
+        stopwatch = _Stopwatch()
+        styler = self._atoti_get_styler()
+        if self._atoti_timings is not None:
+            self._atoti_timings.styler = stopwatch.lap()
+        return styler
+
+    @property
+    def timings(self) -> Optional[QueryTimings]:
+        """Breakdown of the time spent executing the query that produced this result.
+
+        It is ``None`` when the result was not created by a query.
+        """
+        return self._atoti_timings
 
     def _get_dataframe_to_repr(self, *, has_been_mutated: bool) -> pd.DataFrame:
         return super() if has_been_mutated else self._atoti_formatted_values
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, List, Optional
+
+QueryTimingsCallback = Callable[["QueryTimings"], None]
+
+_CALLBACKS: List[QueryTimingsCallback] = []
+
+
+@dataclass
+class QueryTimings:
+    """Breakdown of the time spent executing a query.
+
+    Durations are in seconds and are ``None`` when the corresponding phase did not happen.
+    The REST API does not expose how long the server spent computing the query: it is included in :attr:`http_wait`, along with the network latency.
+    """
+
+    mdx_generation: Optional[float] = None
+    """Time spent generating the MDX from the queried measures, levels, and condition."""
+
+    http_wait: Optional[float] = None
+    """Time between sending the query and receiving the first byte of the response."""
+
+    download: Optional[float] = None
+    """Time spent reading the body of the response."""
+
+    json_decode: Optional[float] = None
+    """Time spent decoding the JSON cellset."""
+
+    cellset_conversion: Optional[float] = None
+    """Time spent converting the cellset to a :class:`~atoti.query.query_result.QueryResult`."""
+
+    styler: Optional[float] = None
+    """Time spent building the Styler the last time :attr:`~atoti.query.query_result.QueryResult.style` was accessed."""
+
+    request_size: Optional[int] = None
+    """Size in bytes of the body of the request."""
+
+    response_size: Optional[int] = None
+    """Size in bytes of the body of the response."""
+
+    cell_count: Optional[int] = None
+    """Number of cells in the cellset returned by the server."""
+
+    row_count: Optional[int] = None
+    """Number of rows of the query result."""
+
+    column_count: Optional[int] = None
+    """Number of columns of the query result."""
+
+    @property
+    def total(self) -> float:
+        """Sum of the durations of all the phases that happened."""
+        return sum(
+            duration
+            for duration in (
+                self.mdx_generation,
+                self.http_wait,
+                self.download,
+                self.json_decode,
+                self.cellset_conversion,
+                self.styler,
+            )
+            if duration is not None
+        )
+
+
+class _Stopwatch:
+    def __init__(self) -> None:
+        self._start = perf_counter()
+
+    def lap(self) -> float:
+        """Return the time elapsed since the previous lap and start a new one."""
+        now = perf_counter()
+        elapsed, self._start = now - self._start, now
+        return elapsed
+
+
+def add_query_timings_callback(callback: QueryTimingsCallback) -> None:
+    """Register a function called with the :class:`QueryTimings` of each query once its result is created.
+
+    This can be used to export the timings to a metrics system.
+    Since the Styler is built lazily, :attr:`QueryTimings.styler` is always ``None`` when the callback is called.
+
+    Args:
+        callback: The function to call.
+            Exceptions raised by it are logged and do not make the query fail.
+    """
+    _CALLBACKS.append(callback)
+
+
+def remove_query_timings_callback(callback: QueryTimingsCallback) -> None:
+    """Unregister a function previously passed to :func:`add_query_timings_callback`."""
+    _CALLBACKS.remove(callback)
+
+
+def _notify_query_timings_callbacks(timings: QueryTimings) -> None:
+    for callback in list(_CALLBACKS):
+        try:
+            callback(timings)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger("atoti.query").warning(
+                "Query timings callback %s failed.", callback, exc_info=True
+            )
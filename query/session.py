@@ -7,7 +7,13 @@ from urllib.request import Request, urlopen
 
 from .._base._base_session import BaseSession
 from .._docs_utils import doc
-from ._cellset import Cellset, GetLevelDataTypes, cellset_to_query_result
+from .._profiler import io_span
+from ._cellset import (
+    Cellset,
+    GetLevelDataTypes,
+    GetMemberDictionary,
+    cellset_to_query_result,
+)
 from ._context import Context
 from ._discovery import Discovery
 from ._discovery_utils import create_cubes_from_discovery
@@ -15,6 +21,7 @@ from ._widget_conversion_details import WidgetConversionDetails
 from .auth import Auth
 from .cubes import QueryCubes
 from .query_result import QueryResult
+from .query_timings import QueryTimings, _notify_query_timings_callbacks, _Stopwatch
 
 SUPPORTED_VERSIONS = ["5", "5.Z1", "4", "6zz1"]
 
@@ -118,7 +125,9 @@ def _get_query_mdx_doc(*, is_query_session: bool) -> str:
 class _QuerySessionPrivateParameters:
     session: Optional[BaseSession] = None
     get_level_data_types: Optional[GetLevelDataTypes] = None
+    get_member_dictionary: Optional[GetMemberDictionary] = None
     context: Context = field(default_factory=dict)
+    timings: Optional[QueryTimings] = None
 
 
 class QuerySession(BaseSession[QueryCubes]):
@@ -169,19 +178,36 @@ class QuerySession(BaseSession[QueryCubes]):
         """Generate the authentication headers to use for this session."""
         return self._auth(self.url) or {}
 
-    def _execute_json_request(self, url: str, *, body: Optional[Any] = None) -> Any:
+    def _execute_json_request(
+        self,
+        url: str,
+        *,
+        body: Optional[Any] = None,
+        timings: Optional[QueryTimings] = None,
+    ) -> Any:
         headers = {"Content-Type": "application/json"}
         headers.update(self._auth(url) or {})
         data = json.dumps(body).encode("utf8") if body else None
         # The user can send any URL, wrapping it in a request object makes it a bit safer
         request = Request(url, data=data, headers=headers)
+        stopwatch = _Stopwatch()
         try:
-            with urlopen(request) as response:  # nosec
-                return json.load(response)
+            with io_span("http", url), urlopen(request) as response:  # nosec
+                http_wait = stopwatch.lap()
+                content = response.read()
         except HTTPError as error:
             error_json = error.read()
             error_data = json.loads(error_json)
             raise RuntimeError("Request failed", error_data) from error
+        download = stopwatch.lap()
+        result = json.loads(content)
+        if timings is not None:
+            timings.http_wait = http_wait
+            timings.download = download
+            timings.json_decode = stopwatch.lap()
+            timings.request_size = len(data) if data else 0
+            timings.response_size = len(content)
+        return result
 
     def _fetch_versions(self) -> Any:
         url = urljoin(f"{self.url}/", "versions/rest")
@@ -207,9 +233,19 @@ class QuerySession(BaseSession[QueryCubes]):
         response = self._execute_json_request(url)
         return response["data"]
 
-    def _query_mdx_to_cellset(self, mdx: str, *, context: Context) -> Cellset:
+    def _query_mdx_to_cellset(
+        self, mdx: str, *, context: Context, timings: Optional[QueryTimings] = None
+    ) -> Cellset:
         url = urljoin(f"{self.url}/", f"pivot/rest/v{self._version}/cube/query/mdx")
         body: Mapping[str, Union[str, Context]] = {"context": context, "mdx": mdx}
+        response = self._execute_json_request(url, body=body, timings=timings)
+        return response["data"]
+
+    def _query_drillthrough(self, mdx: str, *, context: Context) -> Any:
+        url = urljoin(
+            f"{self.url}/", f"pivot/rest/v{self._version}/cube/query/mdx/drillthrough"
+        )
+        body: Mapping[str, Union[str, Context]] = {"context": context, "mdx": mdx}
         response = self._execute_json_request(url, body=body)
         return response["data"]
 
@@ -226,14 +262,21 @@ class QuerySession(BaseSession[QueryCubes]):
         context = private_parameters.context
         if timeout is not None:
             context = {**context, "queriesTimeLimit": timeout}
-        cellset = self._query_mdx_to_cellset(mdx, context=context)
+        timings = private_parameters.timings or QueryTimings()
+        cellset = self._query_mdx_to_cellset(mdx, context=context, timings=timings)
+        timings.cell_count = len(cellset["cells"])
+        stopwatch = _Stopwatch()
         query_result = cellset_to_query_result(
             cellset,
             context=context,
             discovery=self._discovery,
             get_level_data_types=private_parameters.get_level_data_types,
+            get_member_dictionary=private_parameters.get_member_dictionary,
             keep_totals=keep_totals,
+            timings=timings,
         )
+        timings.cellset_conversion = stopwatch.lap()
+        timings.row_count, timings.column_count = query_result.shape
         # Let local sessions pass their reference to have the correct name and widget creation code.
         session = (
             private_parameters.session
@@ -245,4 +288,5 @@ class QuerySession(BaseSession[QueryCubes]):
             session_id=session._id,
             widget_creation_code=session._get_widget_creation_code(),
         )
+        _notify_query_timings_callbacks(timings)
         return query_result
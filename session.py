@@ -21,6 +21,8 @@ from ._pandas_utils import pandas_to_temporary_parquet
 from ._path_utils import PathLike, stem_path
 from ._plugins import MissingPluginError
 from ._scenario_utils import BASE_SCENARIO_NAME
+from ._session_definition import export_definition as _export_definition
+from ._session_definition import restore_definition as _restore_definition
 from ._sources.csv import CsvDataSource
 from ._sources.parquet import ParquetDataSource
 from ._transaction import Transaction
@@ -583,6 +585,34 @@ class Session(LocalSession[Cubes]):
         """
         self._java_api.export_i18n_template(path)
 
+    def export_definition(self, path: PathLike) -> None:
+        """Export the definition of the session's tables, joins, and cubes to a JSON file.
+
+        The file can be passed to :meth:`restore_definition` to rebuild the same data model without replaying the script that created it.
+        Measures whose definition cannot be serialized, such as the ones created from parameter simulations, are exported without definition and will not be restored.
+
+        Args:
+            path: The path at which to write the definition.
+        """
+        _export_definition(self, path)
+
+    def restore_definition(
+        self, path: PathLike, *, skip_unchanged: bool = True
+    ) -> None:
+        """Restore the tables, joins, and cubes of a definition exported with :meth:`export_definition`.
+
+        The hierarchies of each cube are updated in a single call and its measures are created in a single batch.
+        The hierarchy properties and measure metadata that differ from the definition are then set, followed by one more refresh and measure publication if needed.
+        Hierarchies missing from the definition are only dropped from the cubes created by the restoration: the other hierarchies of existing cubes are kept.
+        Data is not part of the definition and has to be loaded separately.
+
+        Args:
+            path: The path of the definition to restore.
+            skip_unchanged: Whether to skip the tables, joins, cubes, and measures already defined identically in the session.
+                When ``False``, restoring a table or a cube that already exists raises an error.
+        """
+        _restore_definition(self, path, skip_unchanged=skip_unchanged)
+
     def _retrieve_cube(self, cube_name: str) -> Cube:
         java_cube = self._java_api.retrieve_cube(cube_name)
         return Cube(
@@ -6,7 +6,9 @@ from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple,
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from ._arrow import filter_arrow_table
 from ._bitwise_operators_only import IdentityElement
 from ._docs_utils import (
     CLIENT_SIDE_ENCRYPTION_DOC,
@@ -71,7 +73,9 @@ class Table(ReprJsonable):
 
     def __post_init__(self) -> None:
         """Finish initialization."""
-        for col in self._java_api.get_table_schema(self):
+        for col in self._java_api.table_metadata_cache.get_schema(
+            self.name, lambda: self._java_api.get_table_schema(self)
+        ):
             self._columns[col.name] = Column(col.name, col.data_type, self)
 
     @property
@@ -82,7 +86,11 @@ class Table(ReprJsonable):
     @property
     def keys(self) -> Sequence[str]:
         """Names of the key columns of the table."""
-        return self._java_api.get_key_columns(self)
+        return list(
+            self._java_api.table_metadata_cache.get_keys(
+                self.name, lambda: self._java_api.get_key_columns(self)
+            )
+        )
 
     @property
     def scenario(self) -> str:
@@ -102,7 +110,9 @@ class Table(ReprJsonable):
     @property
     def _partitioning(self) -> str:
         """Table partitioning."""
-        return self._java_api.get_table_partitioning(self)
+        return self._java_api.table_metadata_cache.get_partitioning(
+            self.name, lambda: self._java_api.get_table_partitioning(self)
+        )
 
     def join(
         self,
@@ -238,14 +248,110 @@ class Table(ReprJsonable):
         }
         return schema, {"expanded": True, "root": self.name}
 
+    def to_arrow(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filter: Mapping[str, Any] = EMPTY_MAPPING,  # pylint: disable=redefined-builtin
+        limit: Optional[int] = None,
+        scenario: Optional[str] = None,
+    ) -> pa.Table:  # type: ignore
+        """Return the rows of the table as an Arrow table.
+
+        Each column has the Arrow type corresponding to the type of the table column.
+
+        The rows are transferred from the server at once, and when a *filter* is given all the rows of the table are transferred before being filtered.
+        This method is thus meant for tables, or *limit* values, small enough for their rows to fit in memory several times.
+
+        Args:
+            columns: The names of the columns to return.
+                Defaults to all the columns of the table.
+            filter: Mapping between table columns and values.
+                Only the rows matching all these values are returned.
+            limit: The maximum number of rows to return.
+                Defaults to all the rows.
+            scenario: The scenario to read the rows from.
+                Defaults to the scenario of the table.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit cannot be negative.")
+        columns = self.columns if columns is None else list(columns)
+        for column_name in [*columns, *filter]:
+            self[column_name]  # pylint: disable=pointless-statement
+
+        # The filter is applied once the rows are fetched so all of them are needed.
+        fetched_columns = list(dict.fromkeys([*columns, *filter]))
+        arrow_table = self._java_api.get_table_arrow(
+            self,
+            columns=fetched_columns,
+            limit=None if filter else limit,
+            scenario_name=self.scenario if scenario is None else scenario,
+        )
+        if not filter:
+            return arrow_table
+        arrow_table = filter_arrow_table(arrow_table, coordinates=filter)
+        arrow_table = pa.Table.from_arrays(
+            [arrow_table.column(column_name) for column_name in columns],
+            names=columns,
+        )
+        return arrow_table if limit is None else arrow_table.slice(0, limit)
+
+    def to_pandas(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filter: Mapping[str, Any] = EMPTY_MAPPING,  # pylint: disable=redefined-builtin
+        limit: Optional[int] = None,
+        scenario: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Return the rows of the table as a pandas DataFrame indexed by the returned key columns.
+
+        Args:
+            columns: The names of the columns to return.
+                Defaults to all the columns of the table.
+            filter: Mapping between table columns and values.
+                Only the rows matching all these values are returned.
+            limit: The maximum number of rows to return.
+                Defaults to all the rows.
+            scenario: The scenario to read the rows from.
+                Defaults to the scenario of the table.
+        """
+        return self._to_dataframe(
+            self.to_arrow(
+                columns=columns, filter=filter, limit=limit, scenario=scenario
+            )
+        )
+
+    def _to_dataframe(
+        self, arrow_table: pa.Table, *, array_to_list: bool = False  # type: ignore
+    ) -> pd.DataFrame:
+        dataframe = arrow_table.to_pandas(date_as_object=False)
+        if array_to_list:
+            for field in arrow_table.schema:
+                if pa.types.is_list(field.type):
+                    dataframe[field.name] = dataframe[field.name].apply(
+                        lambda array: None if array is None else array.tolist()
+                    )
+        keys = [key for key in self.keys if key in dataframe.columns]
+        return dataframe.set_index(keys) if keys else dataframe
+
     @doc(HEAD_DOC, **_DOC_KWARGS)
     def head(self, n: int = 5) -> pd.DataFrame:
         if n < 1:
             raise ValueError("n must be at least 1.")
 
-        return self._java_api.get_table_dataframe(
-            self, n, scenario_name=self.scenario, keys=self.keys
+        arrow_table = self.to_arrow(limit=n)
+        # Unlike to_pandas(), ints and floats are widened and arrays are lists like in the DataFrames returned before to_pandas() existed.
+        widened_types = {pa.int32(): pa.int64(), pa.float32(): pa.float64()}
+        arrow_table = arrow_table.cast(
+            pa.schema(
+                [
+                    field.with_type(widened_types.get(field.type, field.type))
+                    for field in arrow_table.schema
+                ]
+            )
         )
+        return self._to_dataframe(arrow_table, array_to_list=True)
 
     @doc(**{**CSV_KWARGS, **CLIENT_SIDE_ENCRYPTION_DOC})
     def load_csv(
@@ -392,6 +498,8 @@ class TableScenarios:
     def __getitem__(self, key: str) -> Table:
         """Get the scenario or create it if it does not exist.
 
+        The returned table shares the cached metadata of the base table.
+
         Args:
             key: the name of the scenario
 